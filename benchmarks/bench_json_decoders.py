@@ -0,0 +1,117 @@
+"""
+Compare the JSON decoder backends on order pages.
+
+Usage:
+    python benchmarks/bench_json_decoders.py [--payload PATH ...] [--number N]
+
+Without --payload, synthetic Walmart and eBay pages shaped like the marketplace responses are used.
+Backends that are not installed are skipped.
+
+Columns: decoding the whole page (loads), decoding it into Order models (parse_orders_page), and
+building the Order models alone from the page's items (Order). With msgspec, Orders are decoded
+into Structs holding only the fields of the connector's OrderMapping.
+"""
+import argparse
+import json
+import os
+import timeit
+from unittest.mock import MagicMock
+from JegBridge.connectors.ebay_connector import EbayConnector
+from JegBridge.connectors.walmartmp_connector import WalmartMPConnector
+from JegBridge.models.order import Order
+from JegBridge.utils.json_decoder import JSON_DECODERS
+
+
+def walmart_page(count: int) -> bytes:
+    orders = [{
+        "purchaseOrderId": str(1000000 + i),
+        "customerOrderId": str(2000000 + i),
+        "customerEmailId": f"buyer{i}@relay.walmart.com",
+        "orderDate": 1740830400000 + i * 1000,
+        "shippingInfo": {
+            "phone": "5555555555",
+            "methodCode": "Standard",
+            "postalAddress": {"name": "Jane Doe", "address1": "1 Main St", "city": "Springfield",
+                              "state": "IL", "postalCode": "62701", "country": "USA"},
+        },
+        "orderLines": {"orderLine": [{
+            "lineNumber": str(line + 1),
+            "item": {"productName": f"Refurbished phone {i}-{line}", "sku": f"SKU-{i}-{line}"},
+            "charges": {"charge": [{"chargeType": "PRODUCT", "chargeName": "ItemPrice",
+                                    "chargeAmount": {"currency": "USD", "amount": 199.99}}]},
+            "orderLineQuantity": {"unitOfMeasurement": "EACH", "amount": "1"},
+            "orderLineStatuses": {"orderLineStatus": [{"status": "Acknowledged",
+                                                       "statusQuantity": {"unitOfMeasurement": "EACH", "amount": "1"}}]},
+        } for line in range(3)]},
+    } for i in range(count)]
+    return json.dumps({"list": {"meta": {"totalCount": count, "limit": count, "nextCursor": None},
+                                "elements": {"order": orders}}}).encode()
+
+
+def ebay_page(count: int) -> bytes:
+    orders = [{
+        "orderId": f"12-0000{i}-00000",
+        "creationDate": "2025-03-01T12:00:00.000Z",
+        "lastModifiedDate": "2025-03-02T12:00:00.000Z",
+        "orderFulfillmentStatus": "NOT_STARTED",
+        "orderPaymentStatus": "PAID",
+        "buyer": {"username": f"buyer{i}", "buyerRegistrationAddress": {"fullName": "Jane Doe"}},
+        "pricingSummary": {"total": {"value": "199.99", "currency": "USD"}},
+        "lineItems": [{
+            "lineItemId": f"{i}{line}",
+            "sku": f"SKU-{i}-{line}",
+            "title": f"Refurbished phone {i}-{line}",
+            "quantity": 1,
+            "lineItemCost": {"value": "199.99", "currency": "USD"},
+        } for line in range(3)],
+    } for i in range(count)]
+    return json.dumps({"href": "", "total": count, "limit": count, "offset": 0, "orders": orders}).encode()
+
+
+def available_decoders():
+    decoders = []
+    for name, decoder_class in JSON_DECODERS.items():
+        try:
+            decoders.append(decoder_class())
+        except ImportError:
+            print(f"skipping {name}: not installed")
+    return decoders
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--payload", action="append", default=[],
+                        help="Recorded order page to decode, as walmart:PATH or ebay:PATH. May be repeated.")
+    parser.add_argument("--orders", type=int, default=200, help="Orders per synthetic page. Defaults to 200.")
+    parser.add_argument("--number", type=int, default=50, help="Decodes per measurement. Defaults to 50.")
+    args = parser.parse_args()
+
+    connectors = {"walmart": WalmartMPConnector, "ebay": EbayConnector}
+    if args.payload:
+        pages = []
+        for payload in args.payload:
+            marketplace, path = payload.split(":", 1)
+            with open(path, "rb") as payload_file:
+                pages.append((f"{marketplace}:{os.path.basename(path)}", connectors[marketplace], payload_file.read()))
+    else:
+        pages = [("walmart", WalmartMPConnector, walmart_page(args.orders)), ("ebay", EbayConnector, ebay_page(args.orders))]
+
+    decoders = available_decoders()
+    print(f"{'page':<24} {'backend':<8} {'loads ms':>10} {'parse_orders_page ms':>22} {'Order ms':>10}")
+    for label, connector_class, content in pages:
+        for decoder in decoders:
+            auth = MagicMock()
+            auth.json_decoder = decoder
+            connector = connector_class(auth=auth)
+            loads = min(timeit.repeat(lambda: decoder.loads(content), number=args.number, repeat=3)) / args.number
+            parse = min(timeit.repeat(lambda: connector.parse_orders_page(content), number=args.number, repeat=3)) / args.number
+            items = decoder.loads_items(content, connector.orders_page_path)
+            build = min(timeit.repeat(
+                lambda: [Order(connector.marketplace, item, connector.order_mapping, json_decoder=decoder) for item in items],
+                number=args.number, repeat=3,
+            )) / args.number
+            print(f"{label:<24} {decoder.name:<8} {loads * 1000:>10.3f} {parse * 1000:>22.3f} {build * 1000:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,4 +6,8 @@ setup(
     packages=find_packages(where="src"),
     package_dir={"": "src"},
     python_requires=">=3.7",  # Minimum Python version
+    extras_require={
+        "async": ["aiohttp>=3.8"],  # AsyncBaseAuth and the async connectors
+        "fastjson": ["orjson>=3.6", "msgspec>=0.18"],  # faster JSON decoder backends
+    },
 )
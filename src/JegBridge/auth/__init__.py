@@ -3,5 +3,6 @@ from .ebay_auth import EbayAuth
 from .amazon_auth import AmazonAuth
 from .walmartmp_auth import WalmartMPAuth
 from .backmarket_auth import BackmarketAuth
+from .async_base_auth import AsyncBaseAuth, AsyncResponse
 
-__all__ = ["BaseAuth", "EbayAuth", "AmazonAuth", "WalmartMPAuth", "BackmarketAuth"]
+__all__ = ["BaseAuth", "EbayAuth", "AmazonAuth", "WalmartMPAuth", "BackmarketAuth", "AsyncBaseAuth", "AsyncResponse"]
@@ -1,14 +1,33 @@
 import requests
-from typing import Optional
 from datetime import datetime
 from JegBridge.auth.base_auth import BaseAuth
 from JegBridge.utils.custom_exceptions import TokenMissingError, AuthenticationError
 from JegBridge.utils.time_formatter import TimeFormatter
+from JegBridge.utils.rate_limiter import RateLimiter
+
+# Default SP-API usage plans as (method, endpoint pattern, requests per second, burst).
+# Amazon may grant different plans per seller; the limiter adjusts from x-amzn-RateLimit-Limit.
+# Reference: https://developer-docs.amazon.com/sp-api/docs/usage-plans-and-rate-limits
+SP_API_RATE_LIMITS = [
+    ("GET", r"orders/v0/orders", 0.0167, 20),                              # getOrders
+    ("GET", r"orders/v0/orders/[^/]+", 0.5, 30),                           # getOrder
+    ("GET", r"orders/v0/orders/[^/]+/orderItems", 0.5, 30),                # getOrderItems
+    ("POST", r"reports/2021-06-30/reports", 0.0167, 15),                   # createReport
+    ("GET", r"reports/2021-06-30/reports", 0.0222, 10),                    # getReports
+    ("GET", r"reports/2021-06-30/reports/[^/]+", 2.0, 15),                 # getReport
+    ("DELETE", r"reports/2021-06-30/reports/[^/]+", 0.0222, 10),           # cancelReport
+    ("GET", r"reports/2021-06-30/documents/[^/]+", 0.0167, 15),            # getReportDocument
+    ("GET", r"listings/2021-08-01/items/[^/]+", 5.0, 5),                   # searchListingsItems
+    ("GET", r"listings/2021-08-01/items/[^/]+/[^/]+", 5.0, 10),            # getListingsItem
+]
 
 class AmazonAuth(BaseAuth):
     """
     Amazon-specific authentication using OAuth2.
     """
+    marketplace = "amazon"
+    endpoint_routes = [pattern for _, pattern, _, _ in SP_API_RATE_LIMITS]
+    refresh_token_on_401 = True
 
     def __init__(
         self,
@@ -18,6 +37,7 @@ class AmazonAuth(BaseAuth):
         use_production: bool = False,
         sandbox_url: str = None,
         production_url: str = None,
+        **kwargs,
     ):
         """
         Initialize the AmazonAuth object.
@@ -29,17 +49,21 @@ class AmazonAuth(BaseAuth):
             use_production (bool): Whether to use the production environment.
             sandbox_url (str): Optional custom sandbox URL.
             production_url (str): Optional custom production URL.
+            **kwargs: Additional options passed to `BaseAuth` (e.g. connection pool sizing).
         """
         # Set marketplace-specific default URLs
         sandbox_url = sandbox_url or "https://sandbox.sellingpartnerapi-na.amazon.com/"
         production_url = production_url or "https://sellingpartnerapi-na.amazon.com/"
 
-        super().__init__(use_production, sandbox_url, production_url)
+        # Throttle to the SP-API usage plans unless the caller supplied (or disabled) a limiter
+        if "rate_limiter" not in kwargs:
+            kwargs["rate_limiter"] = RateLimiter(SP_API_RATE_LIMITS)
+
+        super().__init__(use_production, sandbox_url, production_url, **kwargs)
 
         self.client_id = client_id
         self.client_secret = client_secret
         self.refresh_token = refresh_token
-        self.access_token: Optional[str] = None
 
     def authenticate(self) -> dict:
         """
@@ -60,7 +84,7 @@ class AmazonAuth(BaseAuth):
         }
 
         try:
-            response = requests.post(url, data=payload)
+            response = self.session.post(url, data=payload)
             response.raise_for_status()  # Raise an HTTPError for bad responses (4xx, 5xx)
             data = response.json()
 
@@ -72,6 +96,8 @@ class AmazonAuth(BaseAuth):
                     "Check the API response format or credentials."
                 )
 
+            self._set_token_expiry(data.get("expires_in"))
+
         except requests.exceptions.RequestException as e:
             raise AuthenticationError(
                 f"Failed to authenticate with Amazon API. Check your network connection, API URL, "
@@ -94,7 +120,7 @@ class AmazonAuth(BaseAuth):
         Raises:
             AuthenticationError: If the access token is missing or invalid.
         """
-        self.authenticate()
+        self._ensure_token()
 
         # Ensure the access token exists before returning headers
         if not self.access_token:
@@ -0,0 +1,251 @@
+import asyncio
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from requests.structures import CaseInsensitiveDict
+from JegBridge.auth.base_auth import BaseAuth, RequestAttempts
+from JegBridge.utils.custom_exceptions import RequestError
+from JegBridge.utils.json_decoder import JsonDecoder
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is an optional dependency (pip install JegBridge[async])
+    aiohttp = None
+
+
+class AsyncResponse:
+    """
+    Fully read HTTP response returned by `AsyncBaseAuth.make_request`.
+
+    Mirrors the parts of `requests.Response` the connectors use, so async code can
+    call `response.json()` and `response.status_code` just like the sync connectors.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: Dict[str, str],
+        content: bytes,
+        url: str,
+        json_decoder: Optional[JsonDecoder] = None,
+    ):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+        self.json_decoder = json_decoder
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self, **kwargs) -> Any:
+        if self.json_decoder is not None and not kwargs:
+            return self.json_decoder.loads(self.content)
+        return json.loads(self.content, **kwargs)
+
+    def raise_for_status(self) -> None:
+        if not self.ok:
+            raise RequestError(f"Request to {self.url} failed with status code {self.status_code}")
+
+
+class AsyncBaseAuth:
+    """
+    Asyncio counterpart of `BaseAuth.make_request`.
+
+    Wraps an existing auth object (AmazonAuth, EbayAuth, WalmartMPAuth, BackmarketAuth) so tokens
+    and headers are produced by exactly the same code as the sync stack, while requests are sent
+    over a shared `aiohttp` connection pool. Attributes that are not defined here (e.g.
+    `get_headers_with_bearer`) are looked up on the wrapped auth object.
+    """
+
+    def __init__(
+        self,
+        auth: BaseAuth,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        timeout: Optional[float] = 60,
+        session: Optional["aiohttp.ClientSession"] = None,
+    ):
+        """
+        Initialize the AsyncBaseAuth object.
+
+        Args:
+            auth (BaseAuth): The marketplace auth object providing credentials and headers.
+            limit (int): Maximum number of simultaneous connections. Defaults to 100.
+            limit_per_host (int): Maximum simultaneous connections per host. Defaults to 0 (no limit).
+            timeout (Optional[float]): Total timeout in seconds for each request. Defaults to 60.
+            session (Optional[aiohttp.ClientSession]): Optional pre-configured aiohttp session.
+
+        Raises:
+            ImportError: If aiohttp is not installed.
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncBaseAuth requires aiohttp. Install it with `pip install JegBridge[async]`."
+            )
+        self.auth = auth
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._timeout = timeout
+        self._session = session
+        self._token_lock: Optional[asyncio.Lock] = None
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes missing on this object; delegate to the wrapped auth
+        if name == "auth":
+            raise AttributeError(name)
+        return getattr(self.auth, name)
+
+    @property
+    def base_url(self) -> str:
+        return self.auth.base_url
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """
+        Get the aiohttp session, creating it on first use inside the running event loop.
+
+        Returns:
+            aiohttp.ClientSession: The pooled session.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self._limit, limit_per_host=self._limit_per_host)
+            timeout = aiohttp.ClientTimeout(total=self._timeout)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        return self._session
+
+    async def close(self) -> None:
+        """
+        Close the aiohttp session and release its connections.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _get_headers(self, get_headers_callback: Callable[[], Dict[str, str]]) -> Dict[str, str]:
+        """
+        Build request headers without blocking the event loop on token refreshes.
+
+        When the cached token is stale, the (blocking) refresh runs once in the default executor
+        while concurrent coroutines wait on a lock, then every caller reuses the new token.
+        """
+        if not self.auth._is_token_valid():
+            if self._token_lock is None:
+                self._token_lock = asyncio.Lock()
+            async with self._token_lock:
+                if not self.auth._is_token_valid():
+                    loop = asyncio.get_running_loop()
+                    await loop.run_in_executor(None, self.auth._ensure_token)
+        return get_headers_callback()
+
+    @staticmethod
+    def _encode_params(params: Optional[Dict[str, Any]]) -> Optional[List[Tuple[str, str]]]:
+        """
+        Convert `requests`-style params (lists become repeated keys, None is dropped) for aiohttp.
+        """
+        if params is None:
+            return None
+        encoded = []
+        for key, value in params.items():
+            values = value if isinstance(value, (list, tuple)) else [value]
+            for item in values:
+                if item is not None:
+                    encoded.append((key, str(item)))
+        return encoded
+
+    @staticmethod
+    def _body_size(kwargs: Dict[str, Any]) -> int:
+        """
+        Size of the request body for metrics, encoding `json` the way aiohttp does.
+        """
+        if kwargs.get("json") is not None:
+            return len(json.dumps(kwargs["json"]).encode("utf-8"))
+        data = kwargs.get("data")
+        if isinstance(data, str):
+            return len(data.encode("utf-8"))
+        return len(data) if isinstance(data, bytes) else 0
+
+    async def make_request(
+        self,
+        method: str,
+        endpoint: str,
+        get_headers_callback: Optional[Callable[[], Dict[str, str]]] = None,
+        **kwargs
+    ) -> AsyncResponse:
+        """
+        Make an HTTP request with common error handling.
+
+        Args:
+            method (str): HTTP method (e.g., 'GET', 'POST').
+            endpoint (str): Endpoint relative to the base URL.
+            get_headers_callback: Callable that returns headers dictionary. Defaults to `self.auth.get_headers`.
+            **kwargs: Additional arguments to pass to `aiohttp.ClientSession.request`
+                (`params`, `data` and `json` behave as in `requests`).
+
+        Returns:
+            AsyncResponse: The response with its body already read.
+
+        Rate limiting and retries follow the wrapped auth's `rate_limiter` and `retry_policy`.
+
+        Raises:
+            RequestError: If the request fails at the transport level.
+        """
+        if get_headers_callback is None:
+            get_headers_callback = self.auth.get_headers
+        url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+
+        # Merge default headers with any headers passed in kwargs
+        headers = kwargs.pop("headers", {})
+        headers.update(await self._get_headers(get_headers_callback))
+
+        if "params" in kwargs:
+            kwargs["params"] = self._encode_params(kwargs["params"])
+        if isinstance(kwargs.get("timeout"), (int, float)):
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=kwargs["timeout"])
+
+        rate_limiter = self.auth.rate_limiter
+        bytes_sent = self._body_size(kwargs) if self.auth.metrics is not None else 0
+        attempts = RequestAttempts(self.auth, method, endpoint, bytes_sent)
+
+        while True:
+            if rate_limiter is not None:
+                delay = rate_limiter.reserve(method, endpoint)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            started = time.perf_counter()
+            try:
+                async with self.session.request(method.upper(), url, headers=headers, **kwargs) as response:
+                    content = await response.read()
+                    result = AsyncResponse(
+                        response.status, CaseInsensitiveDict(response.headers), content, str(response.url),
+                        json_decoder=self.auth.json_decoder,
+                    )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                retryable = isinstance(e, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+                delay = attempts.failed(e, time.perf_counter() - started, retryable)
+                if delay is None:
+                    raise RequestError(f"Request failed: {e}")
+            else:
+                attempts.received(result.status_code, result.headers, time.perf_counter() - started, bytes_received=len(content))
+
+                if attempts.refresh_token(result.status_code):
+                    headers.update(await self._get_headers(get_headers_callback))
+                    continue
+
+                delay = attempts.retry_delay(status_code=result.status_code, headers=result.headers)
+                if delay is None:
+                    return result
+
+            await asyncio.sleep(delay)
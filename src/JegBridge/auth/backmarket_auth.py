@@ -1,4 +1,3 @@
-from typing import Optional
 from JegBridge.auth.base_auth import BaseAuth
 from JegBridge.utils.custom_exceptions import AuthenticationError
 from JegBridge.utils.base64_utils import encode_base64
@@ -7,6 +6,8 @@ class BackmarketAuth(BaseAuth):
     """
     Backmarket-specific authentication using OAuth2.
     """
+    marketplace = "backmarket"
+    endpoint_routes = [r"ws/orders/[^/]+"]
 
     def __init__(
         self,
@@ -17,6 +18,7 @@ class BackmarketAuth(BaseAuth):
         use_production: bool = False,
         sandbox_url: str = None,
         production_url: str = None,
+        **kwargs,
     ):
         """
         Initialize the BackmarketAuth object.
@@ -28,18 +30,18 @@ class BackmarketAuth(BaseAuth):
             use_production (bool): Whether to use the production environment.
             sandbox_url (str): Optional custom sandbox URL.
             production_url (str): Optional custom production URL.
+            **kwargs: Additional options passed to `BaseAuth` (e.g. connection pool sizing).
         """
         # Set marketplace-specific default URLs
         sandbox_url = sandbox_url or "https://preprod.backmarket.com/"
         production_url = production_url or "https://www.backmarket.com/"
 
-        super().__init__(use_production, sandbox_url, production_url)
+        super().__init__(use_production, sandbox_url, production_url, **kwargs)
 
         self._dev_client_id = dev_client_id
         self._dev_client_secret = dev_client_secret
         self._prod_client_id = prod_client_id
         self._prod_client_secret = prod_client_secret
-        self.access_token: Optional[str] = None
 
     @property
     def client_id(self) -> str:
@@ -56,6 +58,8 @@ class BackmarketAuth(BaseAuth):
         auth_str = f"{self.client_secret}"
         # encoded_auth_string = encode_base64(auth_str)
         self.access_token = f"Basic {auth_str}"
+        # Backmarket API keys do not expire, so the token stays valid until the environment changes
+        self._set_token_expiry(float("inf"))
 
 
     def get_headers(self) -> dict:
@@ -68,7 +72,7 @@ class BackmarketAuth(BaseAuth):
         Raises:
             AuthenticationError: If the access token is missing or invalid.
         """
-        self.authenticate()
+        self._ensure_token()
 
         # Ensure the access token exists before returning headers
         if not self.access_token:
@@ -1,13 +1,44 @@
+import time
+import threading
 import requests
 from abc import ABC, abstractmethod
-from typing import Callable, Optional, Dict
+from typing import Any, Callable, Hashable, Mapping, Optional, Dict, Sequence, Tuple, Union
+from requests.adapters import HTTPAdapter
 from JegBridge.utils.custom_exceptions import RequestError
+from JegBridge.utils.json_decoder import JsonDecoder, get_json_decoder
+from JegBridge.utils.metrics import MetricsRegistry
+from JegBridge.utils.rate_limiter import RateLimiter
+from JegBridge.utils.retry import RetryPolicy
+from JegBridge.utils.single_flight import SingleFlight
 
 class BaseAuth(ABC):
     """
     Abstract base class for authentication mechanisms.
     """
-    def __init__(self, use_production: bool = False, sandbox_url: str = None, production_url: str = None):
+    # Marketplace name used to label metrics (e.g. "amazon"), matching the connectors' `marketplace`.
+    marketplace: str = None
+    # Endpoint patterns of the marketplace API ("[^/]+" for ids), used to label metrics by endpoint template.
+    endpoint_routes: Sequence[str] = ()
+    # Seconds before expiry at which a cached access token is considered stale.
+    token_expiry_buffer: float = 60
+    # Whether a 401 response means the access token expired and should be refreshed and retried.
+    refresh_token_on_401: bool = False
+
+    def __init__(
+        self,
+        use_production: bool = False,
+        sandbox_url: str = None,
+        production_url: str = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        session: Optional[requests.Session] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        json_decoder: Union[str, JsonDecoder, None] = None,
+        coalesce_gets: bool = False,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
         """
         Initialize the authentication object.
 
@@ -15,10 +46,86 @@ class BaseAuth(ABC):
             use_production (bool): Whether to use the production environment. Defaults to False (sandbox).
             sandbox_url (str): Optional custom sandbox URL.
             production_url (str): Optional custom production URL.
+            pool_connections (int): Number of per-host connection pools to cache. Defaults to 10.
+            pool_maxsize (int): Maximum number of keep-alive connections kept per host. Defaults to 10.
+            pool_block (bool): Whether to block when all connections to a host are in use
+                instead of opening a throwaway connection. Defaults to False.
+            session (Optional[requests.Session]): Optional pre-configured session to use instead of
+                creating one. The caller remains responsible for its adapters.
+            rate_limiter (Optional[RateLimiter]): Optional per-endpoint rate limiter applied by `make_request`.
+                It is thread-safe, so one auth object can be shared by many workers.
+            retry_policy (Optional[RetryPolicy]): Retry policy for transient failures (429, 5xx, connection
+                errors). Defaults to `RetryPolicy()`; pass `RetryPolicy(max_retries=0)` to disable retries.
+            json_decoder (Union[str, JsonDecoder, None]): Backend used by `response.json()` on responses from
+                `make_request`: "json" (default), "orjson", "msgspec", "auto" or a `JsonDecoder` instance.
+            coalesce_gets (bool): Whether concurrent identical GET requests share one API call. While a GET
+                is in flight, other threads asking for the same URL and params wait for it and receive the
+                same response object instead of spending rate-limit quota on a duplicate. Defaults to False.
+            metrics (Optional[MetricsRegistry]): Optional registry recording every HTTP call (status, latency,
+                bytes) and every `authenticate()` call. It can be shared by several auth objects.
         """
         self.use_production = use_production
         self._sandbox_url = sandbox_url
         self._production_url = production_url
+        self.access_token: Optional[str] = None
+        self.token_expiry: Optional[float] = None
+        self._token_environment: Optional[bool] = None
+        self._token_lock = threading.Lock()
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+        self._session = session
+        self._session_lock = threading.Lock()
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.json_decoder = get_json_decoder(json_decoder)
+        self.single_flight: Optional[SingleFlight] = SingleFlight() if coalesce_gets else None
+        self.metrics = metrics
+        if metrics is not None and self.endpoint_routes:
+            metrics.add_routes(self.marketplace, self.endpoint_routes)
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Get the keep-alive session shared by API requests and token refreshes.
+
+        The session is created on first use with an `HTTPAdapter` sized by
+        `pool_connections`/`pool_maxsize`, so repeated calls to the same host reuse
+        open TCP/TLS connections instead of handshaking on every request.
+
+        Returns:
+            requests.Session: The pooled session.
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=self._pool_connections,
+                        pool_maxsize=self._pool_maxsize,
+                        pool_block=self._pool_block,
+                    )
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._session = session
+        return self._session
+
+    def close(self) -> None:
+        """
+        Close the pooled session and release its connections.
+
+        A new session is created transparently if the object is used again.
+        """
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     @property
     def base_url(self) -> str:
@@ -34,6 +141,54 @@ class BaseAuth(ABC):
             return self._sandbox_url
         raise ValueError("Sandbox or production URL not configured.")
 
+    def _is_token_valid(self) -> bool:
+        """
+        Check whether the cached access token can still be used.
+
+        A token is valid when it exists, was issued for the current environment
+        (sandbox vs production) and does not expire within `token_expiry_buffer` seconds.
+
+        Returns:
+            bool: True if the cached token can be reused.
+        """
+        return (
+            self.access_token is not None and
+            self.token_expiry is not None and
+            self._token_environment == self.use_production and
+            time.time() < self.token_expiry - self.token_expiry_buffer
+        )
+
+    def _ensure_token(self) -> None:
+        """
+        Authenticate only if the cached access token is missing or about to expire.
+        """
+        if self._is_token_valid():
+            return
+        with self._token_lock:
+            # Another thread may have refreshed the token while we waited for the lock
+            if not self._is_token_valid():
+                if self.metrics is not None:
+                    self.metrics.record_authentication(self.marketplace)
+                self.authenticate()
+
+    def _set_token_expiry(self, expires_in: Optional[float]) -> None:
+        """
+        Record when the current access token expires.
+
+        Args:
+            expires_in (Optional[float]): Token lifetime in seconds as returned by the token endpoint.
+                If None, the token is not cached and will be refreshed on the next request.
+        """
+        self.token_expiry = time.time() + float(expires_in) if expires_in else None
+        self._token_environment = self.use_production
+
+    def invalidate_token(self) -> None:
+        """
+        Discard the cached access token so the next request re-authenticates.
+        """
+        self.access_token = None
+        self.token_expiry = None
+
     @abstractmethod
     def authenticate(self) -> None:
         """
@@ -51,6 +206,72 @@ class BaseAuth(ABC):
         """
         pass
 
+    def _bind_json_decoder(self, response: requests.Response) -> None:
+        """
+        Make `response.json()` use the configured decoder backend instead of the standard library.
+        """
+        decoder = self.json_decoder
+        if type(decoder) is not JsonDecoder:
+            response.json = lambda **kwargs: decoder.loads(response.content)
+
+    @staticmethod
+    def _message_sizes(response: requests.Response, stream: bool) -> Tuple[int, int]:
+        """
+        Get the sizes of a call's request and response bodies for metrics.
+
+        The size of a streamed response is taken from its Content-Length header, so the body is not read here.
+        """
+        body = getattr(response.request, "body", None)
+        bytes_sent = len(body) if isinstance(body, (bytes, str)) else 0
+        if stream:
+            content_length = response.headers.get("Content-Length")
+            bytes_received = int(content_length) if isinstance(content_length, str) and content_length.isdigit() else 0
+        else:
+            content = response.content
+            bytes_received = len(content) if isinstance(content, bytes) else 0
+        return bytes_sent, bytes_received
+
+    def _coalesce_key(
+        self,
+        method: str,
+        url: str,
+        get_headers_callback: Callable[[], Dict[str, str]],
+        headers: Dict[str, str],
+        kwargs: Dict[str, Any],
+    ) -> Optional[Hashable]:
+        """
+        Get the key identifying interchangeable requests, or None if the request must not be coalesced.
+
+        Only non-streamed GETs without a body are coalesced. The headers callback is part of the key
+        because it selects the credentials (e.g. eBay's bearer vs IAF token); per-request headers such
+        as Walmart's correlation id are deliberately not.
+        """
+        if self.single_flight is None or method.upper() != "GET" or set(kwargs) - {"params", "timeout"}:
+            return None
+        key = (
+            url,
+            self._freeze(kwargs.get("params")),
+            self._freeze(headers),
+            self._freeze(kwargs.get("timeout")),
+            get_headers_callback,
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    @staticmethod
+    def _freeze(value: Any) -> Any:
+        """
+        Convert params/headers into a hashable value that is equal for equal contents.
+        """
+        if isinstance(value, dict):
+            return tuple(sorted(((str(key), BaseAuth._freeze(item)) for key, item in value.items()), key=repr))
+        if isinstance(value, (list, tuple)):
+            return tuple(BaseAuth._freeze(item) for item in value)
+        return value
+
     def make_request(
         self,
         method: str,
@@ -65,32 +286,180 @@ class BaseAuth(ABC):
             method (str): HTTP method (e.g., 'GET', 'POST').
             endpoint (str): Endpoint relative to the base URL.
             get_headers_callback: Callable that returns headers dictionary. Defaults to `self.get_headers`.
-            **kwargs: Additional arguments to pass to the `requests.request` method.
+            **kwargs: Additional arguments to pass to the `requests.Session.request` method.
 
         Returns:
-            dict: The response JSON as a dictionary.
+            requests.Response: The response object.
+
+        Transient failures are retried according to `self.retry_policy`; once retries are exhausted
+        the last response is returned (or the last transport error raised). With `coalesce_gets`,
+        a GET identical to one already in flight waits for it and returns the same response.
 
         Raises:
-            RequestError: If the request fails or returns a non-200 status code.
+            RequestError: If the request fails at the transport level.
         """
         if get_headers_callback is None:
             get_headers_callback = self.get_headers
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        
-        # Merge default headers with any headers passed in kwargs
         headers = kwargs.pop("headers", {})
-        headers.update(get_headers_callback())
 
-        try:
-            response = requests.request(
-                method=method.lower(),
-                url=url,
-                headers=headers,
-                **kwargs,
+        key = self._coalesce_key(method, url, get_headers_callback, headers, kwargs)
+        if key is not None:
+            response, _ = self.single_flight.do(
+                key, lambda: self._send_request(method, endpoint, url, headers, get_headers_callback, kwargs)
             )
             return response
+        return self._send_request(method, endpoint, url, headers, get_headers_callback, kwargs)
+
+    def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        headers: Dict[str, str],
+        get_headers_callback: Callable[[], Dict[str, str]],
+        kwargs: Dict[str, Any],
+    ) -> requests.Response:
+        """
+        Send a request, retrying transient failures according to `self.retry_policy`.
+        """
+        # Merge default headers with any headers passed in kwargs
+        headers = {**headers, **get_headers_callback()}
+
+        attempts = RequestAttempts(self, method, endpoint)
+
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(method, endpoint)
+
+            started = time.perf_counter()
+            try:
+                response = self.session.request(
+                    method=method.lower(),
+                    url=url,
+                    headers=headers,
+                    **kwargs,
+                )
+            except requests.exceptions.RequestException as e:
+                retryable = isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+                delay = attempts.failed(e, time.perf_counter() - started, retryable)
+                if delay is None:
+                    raise RequestError(f"Request failed: {e}")
+            except ValueError as e:
+                raise RequestError(f"Failed to parse response JSON: {e}")
+            else:
+                sizes = self._message_sizes(response, kwargs.get("stream", False)) if self.metrics is not None else ()
+                attempts.received(response.status_code, response.headers, time.perf_counter() - started, *sizes)
 
-        except requests.exceptions.RequestException as e:
-            raise RequestError(f"Request failed: {e}")
-        except ValueError as e:
-            raise RequestError(f"Failed to parse response JSON: {e}")
+                if attempts.refresh_token(response.status_code):
+                    response.close()
+                    headers.update(get_headers_callback())
+                    continue
+
+                delay = attempts.retry_delay(status_code=response.status_code, headers=response.headers)
+                if delay is None:
+                    self._bind_json_decoder(response)
+                    return response
+                response.close()
+
+            time.sleep(delay)
+
+
+class RequestAttempts:
+    """
+    Retry, rate-limit, token refresh and metrics bookkeeping for one logical request.
+
+    Shared by `BaseAuth` and `AsyncBaseAuth`, so the sync and async request loops only send,
+    wait and rebuild headers, and make the same decisions about every response.
+    """
+
+    def __init__(self, auth: BaseAuth, method: str, endpoint: str, bytes_sent: int = 0):
+        """
+        Initialize the RequestAttempts object.
+
+        Args:
+            auth (BaseAuth): The auth object whose rate limiter, retry policy and metrics apply.
+            method (str): HTTP method of the request.
+            endpoint (str): Endpoint relative to the base URL.
+            bytes_sent (int): Size of the request body, recorded when `received` is not given one.
+        """
+        self.auth = auth
+        self.method = method
+        self.endpoint = endpoint
+        self.bytes_sent = bytes_sent
+        # Retries made so far and seconds slept between them
+        self.attempt = 0
+        self.slept = 0.0
+        self.token_refreshed = False
+
+    def failed(self, error: Exception, duration: float, retryable: bool = True) -> Optional[float]:
+        """
+        Record a call that failed at the transport level and decide whether to retry it.
+
+        Args:
+            error (Exception): The transport error.
+            duration (float): Seconds from sending the request to the failure.
+            retryable (bool): Whether the error may be transient, e.g. a connection error or timeout.
+
+        Returns:
+            Optional[float]: Seconds to wait before retrying, or None to give up.
+        """
+        if self.auth.metrics is not None:
+            self.auth.metrics.record_request(self.auth.marketplace, self.method, self.endpoint, None, duration)
+        return self.retry_delay(error=error) if retryable else None
+
+    def received(
+        self,
+        status_code: int,
+        headers: Mapping[str, str],
+        duration: float,
+        bytes_sent: Optional[int] = None,
+        bytes_received: int = 0,
+    ) -> None:
+        """
+        Record a response in the metrics and feed its rate-limit headers and 429s to the rate limiter.
+        """
+        auth = self.auth
+        if auth.metrics is not None:
+            auth.metrics.record_request(
+                auth.marketplace, self.method, self.endpoint, status_code, duration,
+                self.bytes_sent if bytes_sent is None else bytes_sent, bytes_received,
+            )
+        if auth.rate_limiter is not None:
+            auth.rate_limiter.update_from_headers(self.method, self.endpoint, headers)
+            if status_code == 429:
+                auth.rate_limiter.on_throttled(self.method, self.endpoint)
+
+    def refresh_token(self, status_code: int) -> bool:
+        """
+        Discard the access token after a 401, once per request, if the auth refreshes tokens on 401.
+
+        Returns:
+            bool: Whether the caller should rebuild its headers and resend the request at once.
+        """
+        if status_code != 401 or not self.auth.refresh_token_on_401 or self.token_refreshed:
+            return False
+        self.token_refreshed = True
+        self.auth.retry_policy.stats.record_token_refresh()
+        self.auth.invalidate_token()
+        return True
+
+    def retry_delay(
+        self,
+        status_code: Optional[int] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        error: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """
+        Decide whether to retry according to the auth's retry policy. A returned delay counts as a retry.
+
+        Returns:
+            Optional[float]: Seconds to wait before retrying, or None to give up and keep the outcome.
+        """
+        delay = self.auth.retry_policy.get_retry_delay(
+            self.method, self.attempt, self.slept, status_code=status_code, headers=headers, error=error
+        )
+        if delay is not None:
+            self.slept += delay
+            self.attempt += 1
+        return delay
@@ -1,4 +1,3 @@
-import time
 import requests
 from typing import Optional, Callable, Dict
 from JegBridge.auth.base_auth import BaseAuth
@@ -9,6 +8,10 @@ class EbayAuth(BaseAuth):
     """
     eBay-specific authentication using API keys.
     """
+    marketplace = "ebay"
+    endpoint_routes = [r"sell/fulfillment/v1/order/[^/]+"]
+    refresh_token_on_401 = True
+
     def __init__(
         self,
         dev_client_id: str,
@@ -20,6 +23,7 @@ class EbayAuth(BaseAuth):
         use_production: bool = False,
         sandbox_url: str = None,
         production_url: str = None,
+        **kwargs,
     ):
         """
         Initialize the EbayAuth object.
@@ -34,12 +38,13 @@ class EbayAuth(BaseAuth):
             use_production (bool): Whether to use the production environment.
             sandbox_url (str): Optional custom sandbox URL.
             production_url (str): Optional custom production URL.
+            **kwargs: Additional options passed to `BaseAuth` (e.g. connection pool sizing).
         """
         # Set marketplace-specific default URLs
         sandbox_url = sandbox_url or "https://api.sandbox.ebay.com/"
         production_url = production_url or "https://api.ebay.com/"
 
-        super().__init__(use_production, sandbox_url, production_url)
+        super().__init__(use_production, sandbox_url, production_url, **kwargs)
 
         self._dev_client_id = dev_client_id
         self._dev_client_secret = dev_client_secret
@@ -47,8 +52,6 @@ class EbayAuth(BaseAuth):
         self._prod_client_id = prod_client_id
         self._prod_client_secret = prod_client_secret
         self._prod_refresh_token = prod_refresh_token
-        self.access_token: Optional[str] = None
-        self.token_expiry: Optional[float] = None
 
     @property
     def client_id(self) -> str:
@@ -61,17 +64,6 @@ class EbayAuth(BaseAuth):
     @property
     def refresh_token(self) -> str:
         return self._prod_refresh_token if self.use_production else self._dev_refresh_token
-    
-    def _is_token_valid(self) -> bool:
-        return (
-            self.access_token is not None and
-            self.token_expiry is not None and
-            time.time() < self.token_expiry - 60  # leave 60s buffer
-        )
-
-    def _ensure_token(self) -> None:
-        if not self._is_token_valid():
-            self.authenticate()
 
     def authenticate(self):
         """
@@ -98,7 +90,7 @@ class EbayAuth(BaseAuth):
 
         try:
 
-            response = requests.post(refresh_url,headers=headers,data=body)
+            response = self.session.post(refresh_url,headers=headers,data=body)
             response.raise_for_status()
 
             data = response.json()
@@ -111,8 +103,8 @@ class EbayAuth(BaseAuth):
                     "Authentication succeeded but 'access_token' is missing in the response. "
                     "Check the API response format or credentials."
                 )
-            
-            self.token_expiry = time.time() + expires_in if expires_in else None
+
+            self._set_token_expiry(expires_in)
 
         except requests.exceptions.RequestException as e:
             raise AuthenticationError(
@@ -1,6 +1,5 @@
 import uuid
 import requests
-from typing import Optional
 from JegBridge.auth.base_auth import BaseAuth
 from JegBridge.utils.custom_exceptions import AuthenticationError, TokenMissingError
 from JegBridge.utils.base64_utils import encode_base64
@@ -9,6 +8,9 @@ class WalmartMPAuth(BaseAuth):
     """
     WalmartMP-specific authentication using OAuth2.
     """
+    marketplace = "walmartmp"
+    endpoint_routes = [r"v3/orders/[^/]+"]
+    refresh_token_on_401 = True
 
     def __init__(
         self,
@@ -19,6 +21,7 @@ class WalmartMPAuth(BaseAuth):
         use_production: bool = False,
         sandbox_url: str = None,
         production_url: str = None,
+        **kwargs,
     ):
         """
         Initialize the WalmartAuth object.
@@ -30,18 +33,18 @@ class WalmartMPAuth(BaseAuth):
             use_production (bool): Whether to use the production environment.
             sandbox_url (str): Optional custom sandbox URL.
             production_url (str): Optional custom production URL.
+            **kwargs: Additional options passed to `BaseAuth` (e.g. connection pool sizing).
         """
         # Set marketplace-specific default URLs
         sandbox_url = sandbox_url or "https://sandbox.walmartapis.com/"
         production_url = production_url or "https://marketplace.walmartapis.com/"
 
-        super().__init__(use_production, sandbox_url, production_url)
+        super().__init__(use_production, sandbox_url, production_url, **kwargs)
 
         self._dev_client_id = dev_client_id
         self._dev_client_secret = dev_client_secret
         self._prod_client_id = prod_client_id
         self._prod_client_secret = prod_client_secret
-        self.access_token: Optional[str] = None
 
     @property
     def client_id(self) -> str:
@@ -74,7 +77,7 @@ class WalmartMPAuth(BaseAuth):
         }
 
         try:
-            response = requests.post(token_url, headers=headers, data=request_data)
+            response = self.session.post(token_url, headers=headers, data=request_data)
             response.raise_for_status()
 
             response_data = response.json()
@@ -86,6 +89,8 @@ class WalmartMPAuth(BaseAuth):
                     "Check the API response format or credentials."
                 )
 
+            self._set_token_expiry(response_data.get("expires_in"))
+
         except requests.exceptions.RequestException as e:
             raise AuthenticationError(
                 f"Failed to authenticate with Amazon API. Check your network connection, API URL, "
@@ -109,7 +114,7 @@ class WalmartMPAuth(BaseAuth):
         Raises:
             AuthenticationError: If the access token is missing or invalid.
         """
-        self.authenticate()
+        self._ensure_token()
 
         # Ensure the access token exists before returning headers
         if not self.access_token:
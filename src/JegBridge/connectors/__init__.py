@@ -1,7 +1,18 @@
-from .base_connector import BaseConnector
+from .base_connector import BaseConnector, OrderLookup
 from .ebay_connector import EbayConnector
 from .amazon_connector import AmazonConnector
 from .walmartmp_connector import WalmartMPConnector
 from .backmarket_connector import BackmarketConnector
+from .cached_connector import CachedConnector
+from .order_aggregator import OrderAggregator, TaggedOrder, AggregatedOrders
+from .async_base_connector import AsyncBaseConnector
+from .async_amazon_connector import AsyncAmazonConnector
+from .async_ebay_connector import AsyncEbayConnector
+from .async_walmartmp_connector import AsyncWalmartMPConnector
+from .async_backmarket_connector import AsyncBackmarketConnector
 
-__all__ = ["BaseConnector", "EbayConnector", "AmazonConnector", "WalmartMPConnector", "BackmarketConnector"]
+__all__ = [
+    "BaseConnector", "OrderLookup", "EbayConnector", "AmazonConnector", "WalmartMPConnector", "BackmarketConnector",
+    "CachedConnector", "OrderAggregator", "TaggedOrder", "AggregatedOrders", "AsyncBaseConnector", "AsyncAmazonConnector", "AsyncEbayConnector", "AsyncWalmartMPConnector",
+    "AsyncBackmarketConnector",
+]
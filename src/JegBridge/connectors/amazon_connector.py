@@ -1,24 +1,78 @@
 import requests
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Dict, Any
-from JegBridge.connectors.base_connector import BaseConnector
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple, Union
+from JegBridge.connectors.base_connector import BaseConnector, OrderLookup
 from JegBridge.auth.base_auth import BaseAuth
+from JegBridge.models.order import OrderMapping
+from JegBridge.utils.checkpoint_store import PaginationCheckpoint
+from JegBridge.utils.concurrency import bounded_map, chunked
 from JegBridge.mixins.amazon_report_handler import AmazonReportHandler
 from JegBridge.mixins.amazon_listing_handler import AmazonListingHandler
-
-class AmazonConnector(BaseConnector, AmazonReportHandler, AmazonListingHandler):
+from JegBridge.mixins.amazon_report_scheduler import AmazonReportScheduler
+
+DEFAULT_MARKETPLACE_IDS = ["ATVPDKIKX0DER", "A2EUQ1WTGCTBG2"]
+AMAZON_DATE_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+# getOrders accepts at most 50 AmazonOrderIds per request
+ORDER_IDS_PER_REQUEST = 50
+# Statuses of orders that still have to be shipped, and how far back iter_open_orders looks for them.
+OPEN_ORDER_STATUSES = ["Unshipped", "PartiallyShipped"]
+OPEN_ORDERS_LOOKBACK = timedelta(days=30)
+# How far back getOrders looks when neither created_after nor last_updated_after is given
+DEFAULT_ORDERS_LOOKBACK = timedelta(days=7)
+
+class AmazonConnector(BaseConnector, AmazonReportHandler, AmazonReportScheduler, AmazonListingHandler):
     """
     Amazon-specific implementation of the connector.
     """
+    marketplace = "amazon"
+    order_id_field = "AmazonOrderId"
+    order_status_field = "OrderStatus"
+    order_created_field = "PurchaseDate"
+    order_modified_field = "LastUpdateDate"
+    orders_page_path = ("payload", "Orders")
+    order_mapping = OrderMapping(
+        order_id="AmazonOrderId",
+        status="OrderStatus",
+        created_at="PurchaseDate",
+        modified_at="LastUpdateDate",
+        total="OrderTotal.Amount",
+        currency="OrderTotal.CurrencyCode",
+    )
 
     def __init__(self, auth: BaseAuth, seller_id: str):
         super().__init__(auth)
         self.seller_id = seller_id
 
-
-    def get_orders(self) -> list:
+    @property
+    def account_id(self) -> str:
+        return self.seller_id
+
+
+    def get_orders(
+        self,
+        created_after: Optional[Union[datetime, str]] = None,
+        created_before: Optional[Union[datetime, str]] = None,
+        last_updated_after: Optional[Union[datetime, str]] = None,
+        last_updated_before: Optional[Union[datetime, str]] = None,
+        order_statuses: Optional[Union[List[str], str]] = ("Unshipped",),
+        marketplace_ids: Optional[List[str]] = None,
+        checkpoint: Optional[PaginationCheckpoint] = None,
+    ) -> list:
         """
-        Get unshipped orders from Amazon created in the last 7 days.
+        Get orders from Amazon, following NextToken across all pages.
+
+        With no arguments, returns unshipped orders created in the last 7 days.
+
+        Args:
+            created_after (Optional[Union[datetime, str]]): Only orders created after this time.
+            created_before (Optional[Union[datetime, str]]): Only orders created before this time.
+            last_updated_after (Optional[Union[datetime, str]]): Only orders updated after this time.
+            last_updated_before (Optional[Union[datetime, str]]): Only orders updated before this time.
+            order_statuses (Optional[Union[List[str], str]]): Order statuses to include. Defaults to Unshipped.
+            marketplace_ids (Optional[List[str]]): Marketplaces to search. Defaults to US and CA.
+            checkpoint (Optional[PaginationCheckpoint]): Optional checkpoint to resume an interrupted fetch.
+                Orders saved by earlier runs are returned first.
 
         Returns:
             list: A list of order objects as returned by the Amazon SP-API.
@@ -29,19 +83,392 @@ class AmazonConnector(BaseConnector, AmazonReportHandler, AmazonListingHandler):
         Reference:
             https://developer-docs.amazon.com/sp-api/docs/orders-api-v0-reference#getorders
         """
+        saved_orders = checkpoint.items() if checkpoint is not None else []
+        return saved_orders + list(self.iter_orders(
+            created_after=created_after,
+            created_before=created_before,
+            last_updated_after=last_updated_after,
+            last_updated_before=last_updated_before,
+            order_statuses=order_statuses,
+            marketplace_ids=marketplace_ids,
+            checkpoint=checkpoint,
+        ))
+
+    def iter_orders(
+        self,
+        created_after: Optional[Union[datetime, str]] = None,
+        created_before: Optional[Union[datetime, str]] = None,
+        last_updated_after: Optional[Union[datetime, str]] = None,
+        last_updated_before: Optional[Union[datetime, str]] = None,
+        order_statuses: Optional[Union[List[str], str]] = None,
+        marketplace_ids: Optional[List[str]] = None,
+        max_results_per_page: int = 100,
+        checkpoint: Optional[PaginationCheckpoint] = None,
+    ) -> Iterator[dict]:
+        """
+        Stream orders from Amazon page by page, following NextToken until the last page.
+
+        Orders are yielded as each page arrives, so memory use does not grow with the number of
+        orders. Page requests go through `auth.make_request`, whose rate limiter spaces them
+        according to the getOrders usage plan.
+
+        With a `checkpoint`, every page and the request for the next one are saved once the caller has
+        consumed the page's last order, and a rerun with the same arguments resumes from the saved
+        NextToken instead of starting over. A page interrupted midway is fetched again, so its first
+        orders may be delivered twice. The checkpoint is cleared once the last page has been consumed.
+
+        Args:
+            created_after (Optional[Union[datetime, str]]): Only orders created after this time. Defaults to
+                7 days ago when neither `created_after` nor `last_updated_after` is given.
+            created_before (Optional[Union[datetime, str]]): Only orders created before this time.
+            last_updated_after (Optional[Union[datetime, str]]): Only orders updated after this time.
+                Cannot be combined with `created_after`.
+            last_updated_before (Optional[Union[datetime, str]]): Only orders updated before this time.
+            order_statuses (Optional[Union[List[str], str]]): Order statuses to include. Defaults to all statuses.
+            marketplace_ids (Optional[List[str]]): Marketplaces to search. Defaults to US and CA.
+            max_results_per_page (int): Page size, at most 100. Defaults to 100.
+            checkpoint (Optional[PaginationCheckpoint]): Optional checkpoint to save progress to and resume from.
+
+        Yields:
+            dict: Order objects as returned by the Amazon SP-API.
+
+        Raises:
+            KeyError: If the response structure is unexpected.
+
+        Reference:
+            https://developer-docs.amazon.com/sp-api/docs/orders-api-v0-reference#getorders
+        """
+        query = None
+        if checkpoint is not None:
+            # Keyed on the arguments as given, so the default window below does not shift between runs
+            query = self._build_orders_params(
+                created_after=created_after,
+                created_before=created_before,
+                last_updated_after=last_updated_after,
+                last_updated_before=last_updated_before,
+                order_statuses=order_statuses,
+                marketplace_ids=marketplace_ids,
+                max_results_per_page=max_results_per_page,
+            )
+            state = checkpoint.load(query)
+            if state is not None:
+                if state["done"]:
+                    checkpoint.clear()
+                    return
+                yield from self._iter_orders_pages(state["cursor"], query, checkpoint)
+                return
+
+        params = self._first_page_params(
+            created_after=created_after,
+            created_before=created_before,
+            last_updated_after=last_updated_after,
+            last_updated_before=last_updated_before,
+            order_statuses=order_statuses,
+            marketplace_ids=marketplace_ids,
+            max_results_per_page=max_results_per_page,
+        )
+        yield from self._iter_orders_pages(params, query, checkpoint)
+
+    def _iter_orders_pages(
+        self,
+        params: Dict[str, Any],
+        query: Optional[Dict[str, Any]] = None,
+        checkpoint: Optional[PaginationCheckpoint] = None,
+    ) -> Iterator[dict]:
+        """
+        Follow NextToken from `params`, saving each page to `checkpoint` when one is given.
+        """
+        while True:
+            orders, next_token = self._get_orders_page(params)
+            if next_token:
+                params = self._next_page_params(params, next_token)
+            yield from orders
+            if checkpoint is not None:
+                checkpoint.save(query, orders, params if next_token else None, done=not next_token)
+            if not next_token:
+                break
+
+        if checkpoint is not None:
+            checkpoint.clear()
+
+    def iter_open_orders(self) -> Iterator[dict]:
+        """
+        Stream the Unshipped and PartiallyShipped orders created in the last 30 days.
+
+        Yields:
+            dict: Order objects as returned by the Amazon SP-API.
+        """
+        created_after = datetime.now(timezone.utc) - OPEN_ORDERS_LOOKBACK
+        return self.iter_orders(created_after=created_after, order_statuses=OPEN_ORDER_STATUSES)
+
+    def iter_orders_modified_since(self, since: datetime) -> Iterator[dict]:
+        """
+        Stream orders of any status created or updated since a point in time.
+
+        Args:
+            since (datetime): Only orders whose LastUpdateDate is at or after this time.
+
+        Yields:
+            dict: Order objects as returned by the Amazon SP-API.
+        """
+        return self.iter_orders(last_updated_after=since)
+
+    def get_orders_by_ids(
+        self,
+        order_ids: Iterable[str],
+        max_workers: int = 4,
+        marketplace_ids: Optional[List[str]] = None,
+    ) -> OrderLookup:
+        """
+        Look up many specific orders with getOrders' AmazonOrderIds filter, 50 ids per request.
+
+        Args:
+            order_ids (Iterable[str]): The Amazon order ids to look up. Duplicates are looked up once.
+            max_workers (int): Maximum number of batches requested at once. Defaults to 4.
+            marketplace_ids (Optional[List[str]]): Marketplaces to search. Defaults to US and CA.
+
+        Returns:
+            OrderLookup: The orders found, keyed by AmazonOrderId, and the ids that were not found.
+
+        Raises:
+            KeyError: If the response structure is unexpected.
+
+        Reference:
+            https://developer-docs.amazon.com/sp-api/docs/orders-api-v0-reference#getorders
+        """
+        order_ids = list(dict.fromkeys(str(order_id) for order_id in order_ids))
+        marketplaces = ",".join(marketplace_ids or DEFAULT_MARKETPLACE_IDS)
+
+        def fetch_batch(batch: List[str]) -> list:
+            params = {"MarketplaceIds": marketplaces, "AmazonOrderIds": ",".join(batch)}
+            return list(self._iter_orders_pages(params))
+
+        orders = {}
+        for batch_orders in bounded_map(fetch_batch, chunked(order_ids, ORDER_IDS_PER_REQUEST), max_workers=max_workers):
+            for order in batch_orders:
+                orders[order["AmazonOrderId"]] = order
+        return self._build_order_lookup(order_ids, orders)
+
+    def backfill_orders(
+        self,
+        created_after: datetime,
+        created_before: Optional[datetime] = None,
+        window: timedelta = timedelta(days=7),
+        min_window: timedelta = timedelta(hours=6),
+        max_workers: int = 4,
+        order_statuses: Optional[Union[List[str], str]] = None,
+        marketplace_ids: Optional[List[str]] = None,
+    ) -> Iterator[dict]:
+        """
+        Fetch a long range of orders by splitting it into time windows fetched concurrently.
+
+        The `created_after`..`created_before` range is cut into windows of `window` length, and each
+        window is fetched by its own NextToken chain in a worker thread. A window whose first page
+        reports more pages is dense: its first page is kept, and the rest of the window (after the
+        page's latest PurchaseDate) is split in half and queued again, so dense periods are spread
+        over more workers without fetching any page twice. All workers share `auth`, whose thread-safe rate limiter keeps the
+        combined traffic within the seller's getOrders quota. Orders are yielded as windows complete,
+        without duplicates, in no particular order.
+
+        Args:
+            created_after (datetime): Start of the range. Naive datetimes are taken as UTC.
+            created_before (Optional[datetime]): End of the range. Defaults to 2 minutes ago (the latest SP-API allows).
+            window (timedelta): Initial window length. Defaults to 7 days.
+            min_window (timedelta): Windows shorter than twice this length are not split further. Defaults to 6 hours.
+            max_workers (int): Maximum number of windows fetched concurrently. Defaults to 4.
+            order_statuses (Optional[Union[List[str], str]]): Order statuses to include. Defaults to all statuses.
+            marketplace_ids (Optional[List[str]]): Marketplaces to search. Defaults to US and CA.
+
+        Yields:
+            dict: Order objects as returned by the Amazon SP-API.
+
+        Raises:
+            KeyError: If a response structure is unexpected.
+        """
+        if created_before is None:
+            created_before = datetime.now(timezone.utc) - timedelta(minutes=2)
+        created_after = self._to_utc(created_after)
+        created_before = self._to_utc(created_before)
+
+        filters = {"order_statuses": order_statuses, "marketplace_ids": marketplace_ids}
+        seen_order_ids = set()
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending = set()
+
+        def submit(start: datetime, end: datetime) -> None:
+            pending.add(executor.submit(self._fetch_backfill_window, start, end, min_window, filters))
+
+        try:
+            start = created_after
+            while start < created_before:
+                end = min(start + window, created_before)
+                submit(start, end)
+                start = end
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.discard(future)
+                    orders, sub_windows = future.result()
+                    for sub_start, sub_end in sub_windows:
+                        submit(sub_start, sub_end)
+                    for order in orders:
+                        order_id = order.get("AmazonOrderId")
+                        if order_id in seen_order_ids:
+                            continue
+                        seen_order_ids.add(order_id)
+                        yield order
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _fetch_backfill_window(
+        self,
+        start: datetime,
+        end: datetime,
+        min_window: timedelta,
+        filters: Dict[str, Any],
+    ) -> Tuple[list, List[Tuple[datetime, datetime]]]:
+        """
+        Fetch one backfill window, or its first page plus a split of the rest of the window if it is dense.
+
+        Returns:
+            Tuple[list, List[Tuple[datetime, datetime]]]: The fetched orders and the sub-windows still to fetch.
+        """
+        params = self._build_orders_params(created_after=start, created_before=end, **filters)
+        orders, next_token = self._get_orders_page(params)
+
+        # A NextToken on the first page means the window is dense: keep the page, split what it did not
+        # cover and let other workers help. CreatedAfter is inclusive, so orders sharing the page's last
+        # PurchaseDate are fetched again and dropped as duplicates.
+        covered = self._covered_until(orders) if next_token and end - start >= 2 * min_window else None
+        if covered is not None and start < covered < end:
+            if end - covered < 2 * min_window:
+                return orders, [(covered, end)]
+            middle = covered + (end - covered) / 2
+            return orders, [(covered, middle), (middle, end)]
+
+        while next_token:
+            page, next_token = self._get_orders_page(self._next_page_params(params, next_token))
+            orders.extend(page)
+        return orders, []
+
+    @staticmethod
+    def _covered_until(orders: List[dict]) -> Optional[datetime]:
+        """
+        Get the PurchaseDate up to which a page covers its window, or None if the page is not in PurchaseDate order.
+        """
+        latest = None
+        for order in orders:
+            try:
+                purchase_date = datetime.fromisoformat(order["PurchaseDate"].replace("Z", "+00:00"))
+            except (KeyError, AttributeError, ValueError):
+                return None
+            if purchase_date.tzinfo is None:
+                purchase_date = purchase_date.replace(tzinfo=timezone.utc)
+            if latest is not None and purchase_date < latest:
+                return None
+            latest = purchase_date
+        return latest
+
+    @staticmethod
+    def _to_utc(value: datetime) -> datetime:
+        """
+        Convert a datetime to an aware UTC datetime, taking naive values as UTC.
+        """
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+
+    @staticmethod
+    def _build_orders_params(
+        created_after: Optional[Union[datetime, str]] = None,
+        created_before: Optional[Union[datetime, str]] = None,
+        last_updated_after: Optional[Union[datetime, str]] = None,
+        last_updated_before: Optional[Union[datetime, str]] = None,
+        order_statuses: Optional[Union[List[str], str]] = None,
+        marketplace_ids: Optional[List[str]] = None,
+        max_results_per_page: int = 100,
+    ) -> Dict[str, Any]:
+        """
+        Build getOrders query parameters, dropping filters that are not set.
+        """
+        if isinstance(order_statuses, str):
+            order_statuses = [order_statuses]
+
         params = {
-            "MarketplaceIds": ["ATVPDKIKX0DER", "A2EUQ1WTGCTBG2"],
-            "CreatedAfter": (datetime.now(timezone.utc) - timedelta(days=7)).strftime("%Y-%m-%dT%H:%M:%SZ"),
-            "OrderStatuses": "Unshipped",
+            "MarketplaceIds": ",".join(marketplace_ids or DEFAULT_MARKETPLACE_IDS),
+            "CreatedAfter": AmazonConnector._format_date(created_after),
+            "CreatedBefore": AmazonConnector._format_date(created_before),
+            "LastUpdatedAfter": AmazonConnector._format_date(last_updated_after),
+            "LastUpdatedBefore": AmazonConnector._format_date(last_updated_before),
+            "OrderStatuses": ",".join(order_statuses) if order_statuses else None,
+            "MaxResultsPerPage": max_results_per_page,
         }
+        return {key: value for key, value in params.items() if value is not None}
+
+    @staticmethod
+    def _first_page_params(
+        created_after: Optional[Union[datetime, str]] = None,
+        last_updated_after: Optional[Union[datetime, str]] = None,
+        **filters: Any,
+    ) -> Dict[str, Any]:
+        """
+        Build the getOrders query parameters of a first page, defaulting to orders created in the last 7 days.
+        """
+        if created_after is None and last_updated_after is None:
+            created_after = datetime.now(timezone.utc) - DEFAULT_ORDERS_LOOKBACK
+        return AmazonConnector._build_orders_params(
+            created_after=created_after, last_updated_after=last_updated_after, **filters
+        )
+
+    @staticmethod
+    def _next_page_params(params: Dict[str, Any], next_token: str) -> Dict[str, Any]:
+        """
+        Build the parameters for a follow-up page; the original filters are implied by NextToken.
+        """
+        return {"MarketplaceIds": params["MarketplaceIds"], "NextToken": next_token}
 
+    def _get_orders_page(self, params: Dict[str, Any]) -> Tuple[list, Optional[str]]:
+        """
+        Fetch one page of getOrders.
+
+        Args:
+            params (Dict[str, Any]): Query parameters for the request.
+
+        Returns:
+            Tuple[list, Optional[str]]: The orders on the page and the NextToken for the following page, if any.
+
+        Raises:
+            KeyError: If the response structure is unexpected.
+        """
         response = self.auth.make_request("GET", endpoint="orders/v0/orders", params=params)
-        data = response.json()
+        return self._read_orders_page(response.json())
+
+    @staticmethod
+    def _read_orders_page(data: dict) -> Tuple[list, Optional[str]]:
+        """
+        Get the orders and the NextToken from a decoded getOrders response.
 
+        Raises:
+            KeyError: If the response structure is unexpected.
+        """
         if "payload" not in data or "Orders" not in data["payload"]:
             raise KeyError(f"Unexpected response structure from Amazon orders API: {data}")
 
-        return data["payload"]["Orders"]
+        return data["payload"]["Orders"], data["payload"].get("NextToken")
+
+    @staticmethod
+    def _format_date(value: Optional[Union[datetime, str]]) -> Optional[str]:
+        """
+        Format a datetime as the ISO 8601 UTC string SP-API expects. Strings are passed through.
+        """
+        if value is None or isinstance(value, str):
+            return value
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return value.strftime(AMAZON_DATE_FORMAT)
     
     def get_order(self, order_id: str) -> dict:
         """
@@ -61,8 +488,16 @@ class AmazonConnector(BaseConnector, AmazonReportHandler, AmazonListingHandler):
         """
         endpoint = f"/orders/v0/orders/{order_id}"
         response = self.auth.make_request("GET", endpoint=endpoint)
-        data = response.json()
+        return self._read_order(response.json())
 
+    @staticmethod
+    def _read_order(data: dict) -> dict:
+        """
+        Get the order from a decoded getOrder response.
+
+        Raises:
+            KeyError: If the response structure is unexpected.
+        """
         if "payload" not in data:
             raise KeyError(f"Unexpected response structure from Amazon get_order API: {data}")
 
@@ -87,8 +522,6 @@ class AmazonConnector(BaseConnector, AmazonReportHandler, AmazonListingHandler):
 
 if __name__ == "__main__":
     import os
-    import csv
-    import io
     from dotenv import load_dotenv
     from JegBridge.auth.amazon_auth import AmazonAuth
 
@@ -132,29 +565,8 @@ if __name__ == "__main__":
     print(f"report_document_id: {report_document_id}")
 
     if report_document_id:
-        doc_response = connector.get_doc_url(report_document_id)
-        doc_info = doc_response.json()
-        print(f"doc_info: {doc_info}")
-
-        presigned_url = doc_info.get("url")
-        # print(f"presigned_url: {presigned_url}")
-
-        if presigned_url:
-            report_response = requests.get(presigned_url)
-            if report_response.status_code == 200:
-                report_data_bytes = report_response.content
-                # print(f"report_data: {report_data[:500]}")
-                print(type(report_data_bytes))
-                report_data_str = report_data_bytes.decode("iso-8859-1")
-                print(type(report_data_str))
-                report_data_str_io = io.StringIO(report_data_str)
-                report_data_csv = csv.reader(report_data_str_io, delimiter="\t")
-                for row in report_data_csv:
-                    print(row)
-
-
-            else:
-                print(f"Failed to download report. Status code: {report_response.status_code}")
+        for row in connector.stream_report_rows(report_document_id, as_dicts=False):
+            print(row)
 
 
 #testing getting listings
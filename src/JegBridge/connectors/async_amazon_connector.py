@@ -0,0 +1,97 @@
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Union
+from JegBridge.connectors.amazon_connector import AmazonConnector
+from JegBridge.connectors.async_base_connector import AsyncBaseConnector
+from JegBridge.auth.async_base_auth import AsyncBaseAuth, AsyncResponse
+
+
+class AsyncAmazonConnector(AsyncBaseConnector):
+    """
+    Asyncio implementation of the Amazon connector.
+    """
+
+    def __init__(self, auth: AsyncBaseAuth, seller_id: str):
+        super().__init__(auth)
+        self.seller_id = seller_id
+
+    async def get_orders(
+        self,
+        created_after: Optional[Union[datetime, str]] = None,
+        created_before: Optional[Union[datetime, str]] = None,
+        last_updated_after: Optional[Union[datetime, str]] = None,
+        last_updated_before: Optional[Union[datetime, str]] = None,
+        order_statuses: Optional[Union[List[str], str]] = ("Unshipped",),
+        marketplace_ids: Optional[List[str]] = None,
+    ) -> list:
+        """
+        Get orders from Amazon, following NextToken across all pages.
+
+        With no arguments, returns unshipped orders created in the last 7 days.
+
+        Args:
+            created_after (Optional[Union[datetime, str]]): Only orders created after this time. Defaults to
+                7 days ago when neither `created_after` nor `last_updated_after` is given.
+            created_before (Optional[Union[datetime, str]]): Only orders created before this time.
+            last_updated_after (Optional[Union[datetime, str]]): Only orders updated after this time.
+            last_updated_before (Optional[Union[datetime, str]]): Only orders updated before this time.
+            order_statuses (Optional[Union[List[str], str]]): Order statuses to include. Defaults to Unshipped.
+            marketplace_ids (Optional[List[str]]): Marketplaces to search. Defaults to US and CA.
+
+        Returns:
+            list: A list of order objects as returned by the Amazon SP-API.
+
+        Raises:
+            KeyError: If the response structure is unexpected.
+
+        Reference:
+            https://developer-docs.amazon.com/sp-api/docs/orders-api-v0-reference#getorders
+        """
+        params = AmazonConnector._first_page_params(
+            created_after=created_after,
+            created_before=created_before,
+            last_updated_after=last_updated_after,
+            last_updated_before=last_updated_before,
+            order_statuses=order_statuses,
+            marketplace_ids=marketplace_ids,
+        )
+
+        all_orders = []
+        while True:
+            response = await self.auth.make_request("GET", endpoint="orders/v0/orders", params=params)
+            orders, next_token = AmazonConnector._read_orders_page(response.json())
+            all_orders.extend(orders)
+            if not next_token:
+                return all_orders
+            params = AmazonConnector._next_page_params(params, next_token)
+
+    async def get_order(self, order_id: str) -> dict:
+        """
+        Get specific order from Amazon.
+
+        Args:
+            order_id(str): the order id to search for
+
+        Returns:
+            dict: The order object.
+
+        Raises:
+            KeyError: If the response structure is unexpected.
+
+        Reference:
+            https://developer-docs.amazon.com/sp-api/docs/orders-api-v0-reference#getorder
+        """
+        endpoint = f"/orders/v0/orders/{order_id}"
+        response = await self.auth.make_request("GET", endpoint=endpoint)
+        return AmazonConnector._read_order(response.json())
+
+    async def search_returns(self, filter_params: Optional[Dict[str, Any]]) -> AsyncResponse:
+        """
+        Search for returns for a given marketplace with a given list of params
+
+        Args:
+            filter_params (Optional[Dict[str,Any]]): dictionary of filter paramaters to send in request.
+
+        Returns:
+            list: list of return objects
+        """
+        raise NotImplementedError("Amazon API does not support searching for returns")
@@ -0,0 +1,103 @@
+from typing import Optional, Dict, Any
+from JegBridge.connectors.async_base_connector import AsyncBaseConnector
+from JegBridge.connectors.backmarket_connector import ORDERS_PAGE_SIZE, BackmarketConnector
+from JegBridge.auth.async_base_auth import AsyncBaseAuth, AsyncResponse
+from JegBridge.utils.concurrency import bounded_gather
+
+
+class AsyncBackmarketConnector(AsyncBaseConnector):
+    """
+    Asyncio implementation of the Backmarket connector.
+    """
+
+    def __init__(self, auth: AsyncBaseAuth):
+        super().__init__(auth)
+
+    async def get_orders(
+        self,
+        filter_params: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None,
+        max_workers: int = 4,
+    ) -> list:
+        """
+        Get orders from Backmarket, in page order.
+
+        Pages are planned like `BackmarketConnector.iter_orders`: when the first page has a `count`,
+        the remaining pages are requested by number with at most `max_workers` in flight, otherwise
+        the `next` URLs are followed one at a time.
+
+        Args:
+            filter_params (Optional[Dict[str, Any]]): API filter params (e.g. state, date_creation, country_code).
+            max_pages (Optional[int]): Maximum number of pages to fetch. Defaults to None (all pages).
+            max_workers (int): Maximum number of pages requested at once. Defaults to 4.
+
+        Returns:
+            list: A list of order objects as returned by the Backmarket API.
+
+        Raises:
+            KeyError: If the response structure is unexpected.
+
+        Reference:
+            https://api.backmarket.dev/#/operations/get-ws-orders
+        """
+        endpoint = "ws/orders"
+        params = {**(filter_params or {}), "page-size": ORDERS_PAGE_SIZE}
+
+        data = await self._get_orders_page(endpoint, params)
+        all_orders = list(data["results"])
+        cursor = BackmarketConnector._next_page_cursor(data, 1, max_pages, len(data["results"]))
+
+        if cursor is not None and "total_pages" in cursor:
+            pages = await bounded_gather(
+                lambda page: self._get_orders_page(endpoint, {**params, "page": page}),
+                range(cursor["page"] + 1, cursor["total_pages"] + 1),
+                max_workers=max_workers,
+            )
+            for page_data in pages:
+                all_orders.extend(page_data["results"])
+        else:
+            while cursor is not None:
+                data = await self._get_orders_page(BackmarketConnector._endpoint_from_url(cursor["next"]), {})
+                all_orders.extend(data["results"])
+                cursor = BackmarketConnector._next_page_cursor(data, cursor["page"] + 1, max_pages, len(data["results"]))
+
+        return all_orders
+
+    async def _get_orders_page(self, endpoint: str, params: Dict[str, Any]) -> dict:
+        """
+        Fetch and decode one page of orders.
+
+        Raises:
+            KeyError: If the response structure is unexpected.
+        """
+        response = await self.auth.make_request("GET", endpoint=endpoint, params=params)
+        return BackmarketConnector._read_orders_page(response.json())
+
+    async def get_order(self, order_id: str) -> dict:
+        """
+        Get specific order from Backmarket.
+
+        Args:
+            order_id(str): the order id to search for
+
+        Returns:
+            dict: The order object.
+
+        Reference:
+            https://api.backmarket.dev/#/operations/get-ws-specific-order
+        """
+        endpoint = f"ws/orders/{order_id}"
+        response = await self.auth.make_request("GET", endpoint=endpoint)
+        return response.json()
+
+    async def search_returns(self, filter_params: Optional[Dict[str, Any]]) -> AsyncResponse:
+        """
+        Search for returns for a given marketplace with a given list of params
+
+        Args:
+            filter_params (Optional[Dict[str,Any]]): dictionary of filter paramaters to send in request.
+
+        Returns:
+            list: list of return objects
+        """
+        raise NotImplementedError("Backmarket API does not support searching for returns")
@@ -0,0 +1,63 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Dict, Any
+from JegBridge.auth.async_base_auth import AsyncBaseAuth
+
+
+class AsyncBaseConnector(ABC):
+    """
+    Abstract base class for asyncio marketplace connectors.
+
+    Async connectors mirror the sync connectors' methods as coroutines, so many order lookups
+    across marketplaces can run concurrently from a single event loop.
+    """
+
+    def __init__(self, auth: AsyncBaseAuth):
+        self.auth = auth
+
+    async def close(self) -> None:
+        """
+        Close the underlying aiohttp session.
+        """
+        await self.auth.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    @abstractmethod
+    async def get_orders(self) -> list:
+        """
+        Get orders from the marketplace.
+
+        Returns:
+            list: A list of orders as returned by the marketplace API.
+        """
+        pass
+
+    @abstractmethod
+    async def get_order(self, order_id: str) -> dict:
+        """
+        Get specific order from marketplace.
+
+        Args:
+            order_id (str): The order id to search for.
+
+        Returns:
+            dict: The marketplace order object.
+        """
+        pass
+
+    @abstractmethod
+    async def search_returns(self, filter_params: Optional[Dict[str, Any]]) -> list:
+        """
+        Search for returns for a given marketplace with a given list of params.
+
+        Args:
+            filter_params (Optional[Dict[str, Any]]): dictionary of filter parameters to send in request.
+
+        Returns:
+            list: list of return objects.
+        """
+        pass
@@ -0,0 +1,103 @@
+from typing import Optional, Dict, Any, List, Union
+from JegBridge.connectors.async_base_connector import AsyncBaseConnector
+from JegBridge.connectors.ebay_connector import ORDERS_PAGE_SIZE
+from JegBridge.auth.async_base_auth import AsyncBaseAuth, AsyncResponse
+from JegBridge.utils.concurrency import bounded_gather
+
+
+class AsyncEbayConnector(AsyncBaseConnector):
+    """
+    Asyncio implementation of the eBay connector.
+    """
+
+    def __init__(self, auth: AsyncBaseAuth):
+        super().__init__(auth)
+
+    async def get_orders(
+        self,
+        filter: Optional[str] = None,
+        field_groups: Optional[Union[List[str], str]] = None,
+        limit: int = ORDERS_PAGE_SIZE,
+        max_workers: int = 4,
+    ) -> list:
+        """
+        Get all matching orders from eBay, in page order.
+
+        The first page's `total` determines the remaining offsets, which are requested with at most
+        `max_workers` in flight.
+
+        Args:
+            filter (Optional[str]): Fulfillment API filter, e.g. from `EbayConnector.build_order_filter`.
+            field_groups (Optional[Union[List[str], str]]): Extra field groups, e.g. "TAX_BREAKDOWN".
+            limit (int): Page size, at most 200. Defaults to 200.
+            max_workers (int): Maximum number of pages requested at once. Defaults to 4.
+
+        Returns:
+            list: A list of order objects as returned by the eBay Fulfillment API.
+
+        Reference:
+            https://developer.ebay.com/api-docs/sell/fulfillment/resources/order/methods/getOrders
+        """
+        if isinstance(field_groups, (list, tuple)):
+            field_groups = ",".join(field_groups)
+        params = {"filter": filter, "fieldGroups": field_groups, "limit": limit}
+        params = {key: value for key, value in params.items() if value is not None}
+
+        data = await self._get_orders_page({**params, "offset": 0})
+        all_orders = list(data.get("orders", []))
+
+        pages = await bounded_gather(
+            lambda offset: self._get_orders_page({**params, "offset": offset}),
+            range(limit, data.get("total") or 0, limit),
+            max_workers=max_workers,
+        )
+        for page_data in pages:
+            all_orders.extend(page_data.get("orders", []))
+        return all_orders
+
+    async def _get_orders_page(self, params: Dict[str, Any]) -> dict:
+        """
+        Fetch and decode one page of orders.
+        """
+        response = await self.auth.make_request(
+            "GET",
+            endpoint="sell/fulfillment/v1/order",
+            get_headers_callback=self.auth.get_headers_with_bearer,
+            params=params,
+        )
+        return response.json()
+
+    async def get_order(self, order_id: str) -> dict:
+        """
+        Get specific order from eBay.
+
+        Args:
+            order_id(str): the order id to search for
+
+        Returns:
+            dict: The order object.
+
+        Reference:
+            https://developer.ebay.com/api-docs/sell/fulfillment/resources/order/methods/getOrder
+        """
+        endpoint = f"sell/fulfillment/v1/order/{order_id}"
+        response = await self.auth.make_request("GET", endpoint=endpoint, get_headers_callback=self.auth.get_headers_with_bearer)
+        return response.json()
+
+    async def search_returns(self, filter_params: Optional[Dict[str, Any]]) -> AsyncResponse:
+        """
+        Search for eBay returns using the eBay Post-Order API.
+
+        Args:
+            filter_params (Optional[Dict[str,Any]]): dictionary of filter paramaters to send in request.
+
+        Returns:
+            AsyncResponse: The response object returned by the eBay API.
+
+        Reference:
+            https://developer.ebay.com/Devzone/post-order/post-order_v2_return_search__get.html
+        """
+        endpoint = "post-order/v2/return/search"
+
+        response = await self.auth.make_request("GET", endpoint=endpoint, get_headers_callback=self.auth.get_headers_with_iaf, params=filter_params)
+        return response
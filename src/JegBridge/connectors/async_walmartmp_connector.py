@@ -0,0 +1,90 @@
+from typing import Optional, Dict, Any
+from JegBridge.connectors.async_base_connector import AsyncBaseConnector
+from JegBridge.connectors.walmartmp_connector import ORDERS_PAGE_SIZE, WalmartMPConnector
+from JegBridge.auth.async_base_auth import AsyncBaseAuth, AsyncResponse
+
+
+class AsyncWalmartMPConnector(AsyncBaseConnector):
+    """
+    Asyncio implementation of the Walmart Marketplace connector.
+    """
+
+    def __init__(self, auth: AsyncBaseAuth):
+        super().__init__(auth)
+
+    async def get_orders(self, filter_params: Optional[Dict[str, Any]] = None, max_pages: Optional[int] = None) -> list:
+        """
+        Get orders from Walmart Marketplace, following nextCursor until the last page.
+
+        Pagination stops on the same conditions as `WalmartMPConnector.iter_orders`, including
+        when Walmart repeats a cursor.
+
+        Args:
+            filter_params (Optional[Dict[str, Any]]): API filter params (e.g. status, createdStartDate).
+            max_pages (Optional[int]): Maximum number of pages to fetch. Defaults to None (all pages).
+
+        Returns:
+            list: A list of order objects as returned by the Walmart MP API.
+
+        Raises:
+            KeyError: If the response structure is unexpected.
+
+        Reference:
+            https://developer.walmart.com/api/us/mp/orders#operation/getAllOrders
+        """
+        all_orders = []
+        params = {**(filter_params or {}), "limit": ORDERS_PAGE_SIZE}
+        pages_fetched = 0
+        prev_cursor = None
+
+        while params is not None and (max_pages is None or pages_fetched < max_pages):
+            response = await self.auth.make_request("GET", endpoint="v3/orders", params=params)
+            orders, next_cursor = WalmartMPConnector._read_orders_page(response.json())
+            all_orders.extend(orders)
+            pages_fetched += 1
+            params, prev_cursor = WalmartMPConnector._next_page_params(next_cursor, prev_cursor, len(orders))
+
+        return all_orders
+
+    async def get_order(self, purchase_order_id: str) -> dict:
+        """
+        Get specific order from Walmart.
+
+        Args:
+            purchase_order_id(str): the purchase order id to search for
+
+        Returns:
+            dict: The order object.
+
+        Raises:
+            KeyError: If the response structure is unexpected.
+
+        Reference:
+            https://developer.walmart.com/api/us/mp/orders#operation/getAnOrder
+        """
+        endpoint = f"v3/orders/{purchase_order_id}"
+        response = await self.auth.make_request("GET", endpoint=endpoint)
+        data = response.json()
+
+        if "order" not in data:
+            raise KeyError(f"Unexpected response structure from Walmart get_order API: {data}")
+
+        return data["order"]
+
+    async def search_returns(self, filter_params: Optional[Dict[str, Any]]) -> AsyncResponse:
+        """
+        Search for Walmart returns using the Walmart Marketplace Returns API.
+
+        Args:
+            filter_params (Optional[Dict[str,Any]]): dictionary of filter paramaters to send in request.
+
+        Returns:
+            AsyncResponse: The response object returned by the WalmartMP API.
+
+        Reference:
+            https://developer.walmart.com/api/us/mp/returns#operation/getReturns
+        """
+        endpoint = "v3/returns"
+
+        response = await self.auth.make_request("GET", endpoint=endpoint, params=filter_params)
+        return response
@@ -1,28 +1,66 @@
+import math
+from datetime import datetime, timezone
 import requests
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator
 from urllib.parse import urlparse
 from JegBridge.connectors.base_connector import BaseConnector
 from JegBridge.auth.base_auth import BaseAuth
+from JegBridge.models.order import OrderMapping
+from JegBridge.utils.checkpoint_store import PaginationCheckpoint
+from JegBridge.utils.concurrency import bounded_map
+
+ORDERS_PAGE_SIZE = 50
+# States of orders that still have to be shipped: 1 awaits acceptance, 3 is accepted. The API takes one state per request.
+OPEN_ORDER_STATES = [1, 3]
 
 #TODO manage access token so don't have to create new one each instance
 class BackmarketConnector(BaseConnector):
     """
     Amazon-specific implementation of the connector.
     """
+    marketplace = "backmarket"
+    order_id_field = "order_id"
+    order_status_field = "state"
+    order_created_field = "date_creation"
+    order_modified_field = "date_modification"
+    orders_page_path = ("results",)
+    order_mapping = OrderMapping(
+        order_id="order_id",
+        status="state",
+        created_at="date_creation",
+        modified_at="date_modification",
+        total="price",
+        currency="currency",
+        lines="orderlines",
+        line_id="id",
+        line_sku="listing",
+        line_title="product",
+        line_quantity="quantity",
+        line_price="price",
+    )
 
     def __init__(self, auth: BaseAuth):
         super().__init__(auth)
 
-    def get_orders(self, filter_params: Optional[Dict[str, Any]] = None, max_pages: int = 3) -> list:
+    def get_orders(
+        self,
+        filter_params: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None,
+        max_workers: int = 4,
+        checkpoint: Optional[PaginationCheckpoint] = None,
+    ) -> list:
         """
-        Get orders from Backmarket.
+        Get orders from Backmarket, fetching pages concurrently.
 
         Args:
             filter_params (Optional[Dict[str, Any]]): API filter params (e.g. state, date_creation, country_code).
-            max_pages (int): Maximum number of pages to fetch. Defaults to 3 (150 orders).
+            max_pages (Optional[int]): Maximum number of pages to fetch. Defaults to None (all pages).
+            max_workers (int): Maximum number of pages requested at once. Defaults to 4.
+            checkpoint (Optional[PaginationCheckpoint]): Optional checkpoint to resume an interrupted fetch.
+                Orders saved by earlier runs are returned first.
 
         Returns:
-            list: A list of order objects as returned by the Backmarket API.
+            list: A list of order objects as returned by the Backmarket API, in page order.
 
         Raises:
             KeyError: If the response structure is unexpected.
@@ -30,30 +68,207 @@ class BackmarketConnector(BaseConnector):
         Reference:
             https://api.backmarket.dev/#/operations/get-ws-orders
         """
-        all_orders = []
+        saved_orders = checkpoint.items() if checkpoint is not None else []
+        return saved_orders + list(self.iter_orders(
+            filter_params=filter_params,
+            max_pages=max_pages,
+            max_workers=max_workers,
+            checkpoint=checkpoint,
+        ))
+
+    def iter_orders(
+        self,
+        filter_params: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None,
+        max_workers: int = 4,
+        checkpoint: Optional[PaginationCheckpoint] = None,
+        stream: bool = False,
+    ) -> Iterator[dict]:
+        """
+        Stream orders from Backmarket in page order.
+
+        The first page's `count` tells how many pages exist, so the remaining pages are requested
+        by page number with at most `max_workers` in flight, and yielded in order as they complete.
+        If the response has no `count`, the `next` URLs are followed one at a time instead.
+
+        With a `checkpoint`, every page and the position after it are saved once the caller has
+        consumed the page's last order, and a rerun with the same filters resumes after the last saved
+        page. A page interrupted midway is fetched again, so its first orders may be delivered twice.
+        The checkpoint is cleared once the last page has been consumed.
+
+        With `stream=True`, each page is parsed incrementally as it is read from the socket and its
+        orders are yielded one by one while the rest of the page is still downloading. Pages are then
+        fetched one at a time, and only about one order is held in memory instead of a whole page.
+
+        Args:
+            filter_params (Optional[Dict[str, Any]]): API filter params (e.g. state, date_creation, country_code).
+            max_pages (Optional[int]): Maximum number of pages to fetch. Defaults to None (all pages).
+            max_workers (int): Maximum number of pages requested at once. Defaults to 4.
+            checkpoint (Optional[PaginationCheckpoint]): Optional checkpoint to save progress to and resume from.
+            stream (bool): Whether to parse pages incrementally. Cannot be combined with `checkpoint`,
+                which saves whole pages. Defaults to False.
+
+        Yields:
+            dict: Order objects as returned by the Backmarket API.
+
+        Raises:
+            KeyError: If the response structure is unexpected.
+            ValueError: If both `stream` and `checkpoint` are given.
+
+        Reference:
+            https://api.backmarket.dev/#/operations/get-ws-orders
+        """
         endpoint = "ws/orders"
-        params = {**(filter_params or {}), "page-size": 50}
-        pages_fetched = 0
+        params = {**(filter_params or {}), "page-size": ORDERS_PAGE_SIZE}
 
-        while endpoint and pages_fetched < max_pages:
-            response = self.auth.make_request("GET", endpoint=endpoint, params=params)
-            data = response.json()
+        if stream:
+            if checkpoint is not None:
+                raise ValueError("stream cannot be combined with checkpoint")
+            page = yield from self._stream_orders_page(endpoint, params)
+            cursor = self._next_page_cursor(page.envelope, 1, max_pages, page.count)
+            while cursor is not None:
+                pages_fetched = cursor["page"] + 1
+                if "total_pages" in cursor:
+                    yield from self._stream_orders_page(endpoint, {**params, "page": pages_fetched})
+                    cursor = {**cursor, "page": pages_fetched} if pages_fetched < cursor["total_pages"] else None
+                else:
+                    page = yield from self._stream_orders_page(self._endpoint_from_url(cursor["next"]), {})
+                    cursor = self._next_page_cursor(page.envelope, pages_fetched, max_pages, page.count)
+            return
 
-            if "results" not in data:
-                raise KeyError(f"Unexpected response structure from Backmarket orders API: {data}")
+        state = checkpoint.load(params) if checkpoint is not None else None
+        if state is not None:
+            if state["done"]:
+                checkpoint.clear()
+                return
+            cursor = state["cursor"]
+        else:
+            data = self._get_orders_page(endpoint, params)
+            cursor = self._next_page_cursor(data, 1, max_pages, len(data["results"]))
+            yield from data["results"]
+            if checkpoint is not None:
+                checkpoint.save(params, data["results"], cursor, done=cursor is None)
 
-            all_orders.extend(data["results"])
-            pages_fetched += 1
+        if cursor is not None and "total_pages" in cursor:
+            total_pages = cursor["total_pages"]
+            pages = bounded_map(
+                lambda page: self._get_orders_page(endpoint, {**params, "page": page}),
+                range(cursor["page"] + 1, total_pages + 1),
+                max_workers=max_workers,
+            )
+            for page, page_data in enumerate(pages, start=cursor["page"] + 1):
+                yield from page_data["results"]
+                if checkpoint is not None:
+                    done = page >= total_pages
+                    checkpoint.save(params, page_data["results"], {"page": page, "total_pages": total_pages}, done=done)
+        elif cursor is not None:
+            # Without a total count, fall back to following the `next` links sequentially
+            while cursor is not None:
+                pages_fetched = cursor["page"] + 1
+                data = self._get_orders_page(self._endpoint_from_url(cursor["next"]), {})
+                cursor = self._next_page_cursor(data, pages_fetched, max_pages, len(data["results"]))
+                yield from data["results"]
+                if checkpoint is not None:
+                    checkpoint.save(params, data["results"], cursor, done=cursor is None)
 
-            next_url = data.get("next")
-            if next_url:
-                parsed = urlparse(next_url)
-                endpoint = (parsed.path + ("?" + parsed.query if parsed.query else "")).lstrip("/")
-                params = {}
-            else:
-                endpoint = None
+        if checkpoint is not None:
+            checkpoint.clear()
 
-        return all_orders
+    @staticmethod
+    def _next_page_cursor(
+        data: dict,
+        pages_fetched: int,
+        max_pages: Optional[int],
+        page_length: int,
+    ) -> Optional[dict]:
+        """
+        Describe where to continue after a page: a page range after the first page when `count` is
+        known, else the `next` URL.
+
+        The range is sized by the number of orders on the first page (`page_length`) rather than the
+        requested page-size, in case Backmarket serves fewer orders per page than asked for.
+        """
+        count = data.get("count")
+        if count is not None and pages_fetched == 1 and page_length:
+            total_pages = math.ceil(count / page_length)
+            if max_pages is not None:
+                total_pages = min(total_pages, max_pages)
+            if pages_fetched >= total_pages:
+                return None
+            return {"page": pages_fetched, "total_pages": total_pages}
+
+        next_url = data.get("next")
+        if not next_url or (max_pages is not None and pages_fetched >= max_pages):
+            return None
+        return {"page": pages_fetched, "next": next_url}
+
+    def iter_open_orders(self) -> Iterator[dict]:
+        """
+        Stream the orders awaiting acceptance (state 1) or shipment (state 3), one state after the other.
+
+        An order that changes state between the requests is yielded once.
+
+        Yields:
+            dict: Order objects as returned by the Backmarket API.
+        """
+        seen = set()
+        for state in OPEN_ORDER_STATES:
+            for order in self.iter_orders(filter_params={"state": state}):
+                order_id = order.get(self.order_id_field)
+                if order_id not in seen:
+                    seen.add(order_id)
+                    yield order
+
+    def iter_orders_modified_since(self, since: datetime) -> Iterator[dict]:
+        """
+        Stream orders created or modified since a point in time.
+
+        Args:
+            since (datetime): Only orders whose date_modification is at or after this time.
+
+        Yields:
+            dict: Order objects as returned by the Backmarket API.
+        """
+        since = since.astimezone(timezone.utc) if since.tzinfo else since
+        return self.iter_orders(filter_params={"date_modification": since.strftime("%Y-%m-%d %H:%M:%S")})
+
+    def _get_orders_page(self, endpoint: str, params: Dict[str, Any]) -> dict:
+        """
+        Fetch and decode one page of orders.
+
+        Args:
+            endpoint (str): Orders endpoint, possibly including a query string from a `next` URL.
+            params (Dict[str, Any]): Query parameters for the request.
+
+        Returns:
+            dict: The decoded page, including `results`.
+
+        Raises:
+            KeyError: If the response structure is unexpected.
+        """
+        response = self.auth.make_request("GET", endpoint=endpoint, params=params)
+        return self._read_orders_page(response.json())
+
+    @staticmethod
+    def _read_orders_page(data: dict) -> dict:
+        """
+        Check that a decoded orders response holds a page of `results`.
+
+        Raises:
+            KeyError: If the response structure is unexpected.
+        """
+        if "results" not in data:
+            raise KeyError(f"Unexpected response structure from Backmarket orders API: {data}")
+
+        return data
+
+    @staticmethod
+    def _endpoint_from_url(url: str) -> str:
+        """
+        Convert an absolute `next` URL into an endpoint relative to the base URL.
+        """
+        parsed = urlparse(url)
+        return (parsed.path + ("?" + parsed.query if parsed.query else "")).lstrip("/")
     
     def get_order(self, order_id: str) -> dict:
         """
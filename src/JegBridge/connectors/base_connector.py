@@ -1,16 +1,55 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from datetime import datetime, timezone, timedelta
+from typing import Optional, Dict, Any, Generator, Iterable, Iterator, List, NamedTuple, Tuple, Union
 from JegBridge.auth.base_auth import BaseAuth
+from JegBridge.models.order import Order, OrderMapping
+from JegBridge.utils.checkpoint_store import CheckpointStore
+from JegBridge.utils.concurrency import bounded_map
+from JegBridge.utils.json_stream import JsonItemStream
+
+# Bytes read from the socket at a time when an orders page is streamed
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class OrderLookup(NamedTuple):
+    """
+    Result of a bulk order lookup.
+    """
+    # Orders keyed by the requested id, in request order.
+    found: Dict[str, dict]
+    # Requested ids the marketplace did not return.
+    missing: List[str]
 
 
 class BaseConnector(ABC):
     """
     Abstract base class for marketplace connectors.
     """
+    # Short marketplace name used to key checkpoints and caches (e.g. "amazon").
+    marketplace: str = None
+    # Fields of the marketplace order object used to index cached orders (see CachedConnector).
+    order_id_field: str = None
+    order_status_field: str = None
+    order_created_field: str = None
+    order_modified_field: str = None
+    # Where the marketplace order object keeps the fields of the normalized Order model.
+    order_mapping: OrderMapping = None
+    # Keys leading to the list of orders in a getOrders response body.
+    orders_page_path: Tuple[str, ...] = None
 
     def __init__(self, auth: BaseAuth):
         self.auth = auth
 
+    @property
+    def account_id(self) -> str:
+        """
+        Identify the marketplace account this connector reads from, for keying checkpoints.
+
+        Returns:
+            str: The account id. Defaults to "default" for marketplaces with one account per credential set.
+        """
+        return "default"
+
     @abstractmethod
     def get_orders(self) -> list:
         """
@@ -46,3 +85,187 @@ class BaseConnector(ABC):
             list: list of return objects.
         """
         pass
+
+    def to_order(self, order: Union[dict, bytes, str]) -> Order:
+        """
+        Convert a marketplace order object into the compact, normalized Order model.
+
+        Args:
+            order (Union[dict, bytes, str]): An order as returned by this connector, decoded or as JSON.
+
+        Returns:
+            Order: The normalized order. Marketplace-specific fields stay available through `Order.get`.
+        """
+        if self.order_mapping is None:
+            raise NotImplementedError(f"{type(self).__name__} has no order mapping")
+        return Order(self.marketplace, order, self.order_mapping)
+
+    def parse_orders_page(self, content: bytes) -> List[Order]:
+        """
+        Decode a raw getOrders response body straight into Order models.
+
+        Uses the auth object's JSON decoder. With the msgspec backend only the page envelope is
+        decoded; each order stays a raw JSON slice until the Order reads its normalized fields.
+
+        Args:
+            content (bytes): The response body, e.g. `response.content`.
+
+        Returns:
+            List[Order]: The orders on the page.
+
+        Raises:
+            KeyError: If the response structure is unexpected.
+        """
+        if self.orders_page_path is None or self.order_mapping is None:
+            raise NotImplementedError(f"{type(self).__name__} does not support decoding order pages")
+        decoder = self.auth.json_decoder
+        items = decoder.loads_items(content, self.orders_page_path)
+        return [Order(self.marketplace, item, self.order_mapping, json_decoder=decoder) for item in items]
+
+    def _stream_orders_page(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        required: bool = True,
+        **kwargs
+    ) -> Generator[dict, None, JsonItemStream]:
+        """
+        Fetch one page of orders and yield each order as soon as it has been parsed from the response body.
+
+        The body is read from the socket in `STREAM_CHUNK_SIZE` chunks and parsed incrementally, so the
+        first order is available before the page has finished downloading and only about one order is
+        held in memory at a time. Use with `page = yield from self._stream_orders_page(...)`.
+
+        Args:
+            endpoint (str): Orders endpoint relative to the base URL.
+            params (Dict[str, Any]): Query parameters for the request.
+            required (bool): Whether a page without the `orders_page_path` list is an error. Defaults to True.
+            **kwargs: Additional arguments to pass to `make_request`.
+
+        Yields:
+            dict: Order objects as returned by the marketplace API.
+
+        Returns:
+            JsonItemStream: The finished stream: `envelope` holds the rest of the page (e.g. paging
+                metadata) and `count` the number of orders.
+
+        Raises:
+            KeyError: If the response structure is unexpected.
+        """
+        response = self.auth.make_request("GET", endpoint=endpoint, params=params, stream=True, **kwargs)
+        try:
+            stream = JsonItemStream(
+                response.iter_content(chunk_size=STREAM_CHUNK_SIZE),
+                self.orders_page_path,
+                json_decoder=self.auth.json_decoder,
+            )
+            yield from stream
+        finally:
+            # Releases the connection even if the caller stops before the end of the page
+            response.close()
+
+        if required and not stream.found:
+            raise KeyError(f"Unexpected response structure from {self.marketplace} orders API: {stream.envelope}")
+        return stream
+
+    def get_orders_by_ids(self, order_ids: Iterable[str], max_workers: int = 4) -> OrderLookup:
+        """
+        Look up many specific orders at once.
+
+        The default implementation calls `get_order` for each id with at most `max_workers` requests
+        in flight. Connectors whose API can filter orders by id override it with batched calls.
+
+        Args:
+            order_ids (Iterable[str]): The order ids to look up. Duplicates are looked up once.
+            max_workers (int): Maximum number of concurrent requests. Defaults to 4.
+
+        Returns:
+            OrderLookup: The orders found, keyed by id, and the ids that were not found.
+        """
+        order_ids = list(dict.fromkeys(str(order_id) for order_id in order_ids))
+        orders = bounded_map(self._find_order, order_ids, max_workers=max_workers)
+        return self._build_order_lookup(order_ids, dict(zip(order_ids, orders)))
+
+    def _find_order(self, order_id: str) -> Optional[dict]:
+        """
+        Get one order, or None if the marketplace does not return it.
+        """
+        try:
+            order = self.get_order(order_id)
+        except KeyError:
+            # get_order raises KeyError when the response has no order in it, e.g. a 404 body
+            return None
+        if self.order_id_field is not None and order.get(self.order_id_field) is None:
+            return None
+        return order
+
+    @staticmethod
+    def _build_order_lookup(order_ids: List[str], orders: Dict[str, Optional[dict]]) -> OrderLookup:
+        """
+        Split looked-up orders into found and missing, keeping the requested order.
+        """
+        found = {}
+        missing = []
+        for order_id in order_ids:
+            order = orders.get(order_id)
+            if order is None:
+                missing.append(order_id)
+            else:
+                found[order_id] = order
+        return OrderLookup(found, missing)
+
+    def iter_open_orders(self) -> Iterator[dict]:
+        """
+        Stream the orders that still have to be shipped.
+
+        Yields:
+            dict: Order objects as returned by the marketplace API.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support listing open orders")
+
+    def iter_orders_modified_since(self, since: datetime) -> Iterator[dict]:
+        """
+        Stream orders created or modified since a point in time.
+
+        Args:
+            since (datetime): Only orders created or modified at or after this time.
+
+        Yields:
+            dict: Order objects as returned by the marketplace API.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support incremental order sync")
+
+    def sync_orders(
+        self,
+        store: CheckpointStore,
+        initial_lookback: timedelta = timedelta(days=7),
+        overlap: timedelta = timedelta(minutes=5),
+    ) -> list:
+        """
+        Get only the orders created or modified since the previous successful sync.
+
+        The watermark (start time of the last successful run) is stored per marketplace and account
+        in `store`. The next run asks the marketplace for orders modified since that watermark,
+        minus a small `overlap` to absorb clock skew and late index updates, so callers should
+        de-duplicate by order id. The watermark only advances once every page has been fetched.
+
+        Args:
+            store (CheckpointStore): Where watermarks are persisted.
+            initial_lookback (timedelta): How far back the first run looks. Defaults to 7 days.
+            overlap (timedelta): How far before the watermark each run starts. Defaults to 5 minutes.
+
+        Returns:
+            list: Orders created or modified since the last sync.
+        """
+        key = f"{self.marketplace}:{self.account_id}:orders"
+        run_started = datetime.now(timezone.utc)
+
+        watermark = store.get(key)
+        if watermark:
+            since = datetime.fromisoformat(watermark) - overlap
+        else:
+            since = run_started - initial_lookback
+
+        orders = list(self.iter_orders_modified_since(since))
+        store.set(key, run_started.isoformat())
+        return orders
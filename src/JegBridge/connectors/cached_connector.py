@@ -0,0 +1,187 @@
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, Iterable, Iterator, Tuple
+from JegBridge.connectors.base_connector import BaseConnector, OrderLookup
+from JegBridge.models.order import OrderMapping
+from JegBridge.utils.order_cache import OrderCache
+
+
+class CachedConnector(BaseConnector):
+    """
+    Read-through order cache around any marketplace connector.
+
+    `get_order` is answered from the local `OrderCache` while the cached copy is younger than
+    `ttl`, and only goes to the marketplace API on a miss. Every order returned by `get_orders`
+    or `iter_orders_modified_since` is written to the cache in bulk, so a daily order pull warms
+    the cache for the lookups that follow. Any other attribute is delegated to the wrapped
+    connector, so a CachedConnector can replace the connector at existing call sites.
+    """
+
+    def __init__(self, connector: BaseConnector, cache: OrderCache, ttl: timedelta = timedelta(minutes=15)):
+        """
+        Initialize the CachedConnector object.
+
+        Args:
+            connector (BaseConnector): The connector to wrap.
+            cache (OrderCache): Where orders are cached.
+            ttl (timedelta): How long a cached order is served before it is fetched again. Defaults to 15 minutes.
+        """
+        super().__init__(connector.auth)
+        self.connector = connector
+        self.cache = cache
+        self.ttl = ttl
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found on the wrapper, e.g. iter_orders or the report methods
+        if name == "connector":
+            raise AttributeError(name)
+        return getattr(self.connector, name)
+
+    @property
+    def marketplace(self) -> str:
+        return self.connector.marketplace
+
+    @property
+    def account_id(self) -> str:
+        return self.connector.account_id
+
+    @property
+    def order_mapping(self) -> OrderMapping:
+        return self.connector.order_mapping
+
+    @property
+    def orders_page_path(self) -> Tuple[str, ...]:
+        return self.connector.orders_page_path
+
+    def get_orders(self, *args, **kwargs) -> list:
+        """
+        Get orders from the wrapped connector and store them in the cache.
+
+        Takes the same arguments as the wrapped connector's `get_orders`.
+
+        Returns:
+            list: A list of orders as returned by the marketplace API.
+        """
+        orders = self.connector.get_orders(*args, **kwargs)
+        self.cache_orders(orders)
+        return orders
+
+    def get_order(self, order_id: str) -> dict:
+        """
+        Get an order from the cache, or from the marketplace if it is not cached or older than `ttl`.
+
+        Args:
+            order_id (str): The order id to search for.
+
+        Returns:
+            dict: The marketplace order object. Responses without the order id field (e.g. a 404 or
+                error body) are returned as they are but not cached.
+        """
+        order = self.cache.get(self.marketplace, order_id, max_age=self.ttl.total_seconds())
+        if order is not None:
+            return order
+
+        order = self.connector.get_order(order_id)
+        id_field = self.connector.order_id_field
+        if id_field is None or (isinstance(order, dict) and order.get(id_field) is not None):
+            self.cache.put(self.marketplace, order_id, order, **self._index_fields(order))
+        return order
+
+    def get_orders_by_ids(self, order_ids: Iterable[str], **kwargs) -> OrderLookup:
+        """
+        Look up many specific orders, only asking the marketplace for those not freshly cached.
+
+        Args:
+            order_ids (Iterable[str]): The order ids to look up.
+            **kwargs: Passed to the wrapped connector's `get_orders_by_ids` (e.g. max_workers).
+
+        Returns:
+            OrderLookup: The orders found, keyed by id, and the ids that were not found.
+        """
+        order_ids = list(dict.fromkeys(str(order_id) for order_id in order_ids))
+        max_age = self.ttl.total_seconds()
+        orders = {order_id: self.cache.get(self.marketplace, order_id, max_age=max_age) for order_id in order_ids}
+
+        uncached = [order_id for order_id, order in orders.items() if order is None]
+        if uncached:
+            lookup = self.connector.get_orders_by_ids(uncached, **kwargs)
+            self.cache.put_many(self.marketplace, [
+                {"order_id": order_id, "order": order, **self._index_fields(order)}
+                for order_id, order in lookup.found.items()
+            ])
+            orders.update(lookup.found)
+        return self._build_order_lookup(order_ids, orders)
+
+    def search_returns(self, filter_params: Optional[Dict[str, Any]]) -> list:
+        """
+        Search for returns through the wrapped connector. Returns are not cached.
+
+        Args:
+            filter_params (Optional[Dict[str, Any]]): dictionary of filter parameters to send in request.
+
+        Returns:
+            list: list of return objects.
+        """
+        return self.connector.search_returns(filter_params)
+
+    def iter_orders_modified_since(self, since: datetime) -> Iterator[dict]:
+        """
+        Stream orders created or modified since a point in time, caching each page as it is consumed.
+
+        Args:
+            since (datetime): Only orders created or modified at or after this time.
+
+        Yields:
+            dict: Order objects as returned by the marketplace API.
+        """
+        return self._cache_while_streaming(self.connector.iter_orders_modified_since(since))
+
+    def iter_open_orders(self) -> Iterator[dict]:
+        """
+        Stream the orders that still have to be shipped, caching each page as it is consumed.
+
+        Yields:
+            dict: Order objects as returned by the marketplace API.
+        """
+        return self._cache_while_streaming(self.connector.iter_open_orders())
+
+    def _cache_while_streaming(self, orders: Iterable[dict]) -> Iterator[dict]:
+        """
+        Yield orders unchanged, storing them in the cache 100 at a time.
+        """
+        batch = []
+        for order in orders:
+            batch.append(order)
+            if len(batch) >= 100:
+                self.cache_orders(batch)
+                batch = []
+            yield order
+        self.cache_orders(batch)
+
+    def cache_orders(self, orders: Iterable[dict]) -> int:
+        """
+        Store orders in the cache, skipping any without an id field.
+
+        Args:
+            orders (Iterable[dict]): Order objects as returned by the marketplace API.
+
+        Returns:
+            int: The number of orders stored.
+        """
+        id_field = self.connector.order_id_field
+        rows = [
+            {"order_id": order[id_field], "order": order, **self._index_fields(order)}
+            for order in orders
+            if order.get(id_field) is not None
+        ]
+        return self.cache.put_many(self.marketplace, rows)
+
+    def _index_fields(self, order: dict) -> dict:
+        """
+        Extract the indexed columns of an order using the wrapped connector's field names.
+        """
+        connector = self.connector
+        return {
+            "status": order.get(connector.order_status_field) if connector.order_status_field else None,
+            "created_at": order.get(connector.order_created_field) if connector.order_created_field else None,
+            "modified_at": order.get(connector.order_modified_field) if connector.order_modified_field else None,
+        }
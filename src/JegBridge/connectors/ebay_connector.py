@@ -1,33 +1,245 @@
 import requests
-from typing import Optional, Dict, Any
-from JegBridge.connectors.base_connector import BaseConnector
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Union
+from JegBridge.connectors.base_connector import BaseConnector, OrderLookup
 from JegBridge.auth.base_auth import BaseAuth
+from JegBridge.models.order import OrderMapping
+from JegBridge.utils.concurrency import bounded_map, chunked
+
+ORDERS_PAGE_SIZE = 200
+# getOrders accepts at most 50 orderIds per request
+ORDER_IDS_PER_REQUEST = 50
+# Fulfillment statuses of orders that still have to be shipped.
+OPEN_FULFILLMENT_STATUSES = ["NOT_STARTED", "IN_PROGRESS"]
 
 class EbayConnector(BaseConnector):
     """
     Ebay-specific implementation of the connector.
     """
+    marketplace = "ebay"
+    order_id_field = "orderId"
+    order_status_field = "orderFulfillmentStatus"
+    order_created_field = "creationDate"
+    order_modified_field = "lastModifiedDate"
+    orders_page_path = ("orders",)
+    order_mapping = OrderMapping(
+        order_id="orderId",
+        status="orderFulfillmentStatus",
+        created_at="creationDate",
+        modified_at="lastModifiedDate",
+        total="pricingSummary.total.value",
+        currency="pricingSummary.total.currency",
+        lines="lineItems",
+        line_id="lineItemId",
+        line_sku="sku",
+        line_title="title",
+        line_quantity="quantity",
+        line_price="lineItemCost.value",
+    )
 
     def __init__(self, auth: BaseAuth):
         super().__init__(auth)
 
-    def get_orders(self) -> list:
+    def get_orders(
+        self,
+        filter: Optional[str] = None,
+        field_groups: Optional[Union[List[str], str]] = None,
+        max_workers: int = 4,
+    ) -> list:
+        """
+        Get orders from eBay, fetching every page concurrently.
+
+        Args:
+            filter (Optional[str]): Fulfillment API filter, e.g. from `build_order_filter`.
+            field_groups (Optional[Union[List[str], str]]): Extra field groups, e.g. "TAX_BREAKDOWN".
+            max_workers (int): Maximum number of pages requested at once. Defaults to 4.
+
+        Returns:
+            list: A list of order objects as returned by the eBay Fulfillment API, in page order.
+
+        Reference:
+            https://developer.ebay.com/api-docs/sell/fulfillment/resources/order/methods/getOrders
+        """
+        return list(self.iter_orders(filter=filter, field_groups=field_groups, max_workers=max_workers))
+
+    def iter_orders(
+        self,
+        filter: Optional[str] = None,
+        field_groups: Optional[Union[List[str], str]] = None,
+        limit: int = ORDERS_PAGE_SIZE,
+        max_workers: int = 4,
+        stream: bool = False,
+    ) -> Iterator[dict]:
+        """
+        Stream orders from eBay in page order.
+
+        The first page's `total` determines the remaining offsets, which are requested with at most
+        `max_workers` in flight and yielded in order as they complete.
+
+        With `stream=True`, each page is parsed incrementally as it is read from the socket and its
+        orders are yielded one by one while the rest of the page is still downloading. Pages are then
+        fetched one at a time, and only about one order is held in memory instead of a whole page.
+
+        Args:
+            filter (Optional[str]): Fulfillment API filter, e.g. from `build_order_filter`.
+            field_groups (Optional[Union[List[str], str]]): Extra field groups, e.g. "TAX_BREAKDOWN".
+            limit (int): Page size, at most 200. Defaults to 200.
+            max_workers (int): Maximum number of pages requested at once. Defaults to 4.
+            stream (bool): Whether to parse pages incrementally. Defaults to False.
+
+        Yields:
+            dict: Order objects as returned by the eBay Fulfillment API.
+
+        Reference:
+            https://developer.ebay.com/api-docs/sell/fulfillment/resources/order/methods/getOrders
+        """
+        if isinstance(field_groups, (list, tuple)):
+            field_groups = ",".join(field_groups)
+        params = {"filter": filter, "fieldGroups": field_groups, "limit": limit}
+        params = {key: value for key, value in params.items() if value is not None}
+
+        if stream:
+            offset = 0
+            while True:
+                page = yield from self._stream_orders_page(
+                    "sell/fulfillment/v1/order",
+                    {**params, "offset": offset},
+                    required=False,
+                    get_headers_callback=self.auth.get_headers_with_bearer,
+                )
+                offset += limit
+                if offset >= (page.envelope.get("total") or 0):
+                    return
+
+        data = self._get_orders_page({**params, "offset": 0})
+        yield from data.get("orders", [])
+
+        total = data.get("total") or 0
+        pages = bounded_map(
+            lambda offset: self._get_orders_page({**params, "offset": offset}),
+            range(limit, total, limit),
+            max_workers=max_workers,
+        )
+        for page_data in pages:
+            yield from page_data.get("orders", [])
+
+    def iter_open_orders(self) -> Iterator[dict]:
+        """
+        Stream the orders whose fulfillment has not started or is in progress.
+
+        Yields:
+            dict: Order objects as returned by the eBay Fulfillment API.
+        """
+        return self.iter_orders(filter=self.build_order_filter(fulfillment_statuses=OPEN_FULFILLMENT_STATUSES))
+
+    def iter_orders_modified_since(self, since: datetime) -> Iterator[dict]:
+        """
+        Stream orders created or modified since a point in time.
+
+        Args:
+            since (datetime): Only orders whose lastModifiedDate is at or after this time.
+
+        Yields:
+            dict: Order objects as returned by the eBay Fulfillment API.
+        """
+        return self.iter_orders(filter=self.build_order_filter(last_modified_date_from=since))
+
+    def get_orders_by_ids(
+        self,
+        order_ids: Iterable[str],
+        max_workers: int = 4,
+        field_groups: Optional[Union[List[str], str]] = None,
+    ) -> OrderLookup:
         """
-        Get orders from eBay.
+        Look up many specific orders with getOrders' orderIds parameter, 50 ids per request.
+
+        Args:
+            order_ids (Iterable[str]): The eBay order ids to look up. Duplicates are looked up once.
+            max_workers (int): Maximum number of batches requested at once. Defaults to 4.
+            field_groups (Optional[Union[List[str], str]]): Extra field groups, e.g. "TAX_BREAKDOWN".
 
         Returns:
-            list: A list of order objects as returned by the eBay Fulfillment API.
+            OrderLookup: The orders found, keyed by orderId, and the ids that were not found.
 
         Reference:
             https://developer.ebay.com/api-docs/sell/fulfillment/resources/order/methods/getOrders
         """
+        order_ids = list(dict.fromkeys(str(order_id) for order_id in order_ids))
+        if isinstance(field_groups, (list, tuple)):
+            field_groups = ",".join(field_groups)
+
+        def fetch_batch(batch: List[str]) -> dict:
+            params = {"orderIds": ",".join(batch), "fieldGroups": field_groups}
+            return self._get_orders_page({key: value for key, value in params.items() if value is not None})
+
+        orders = {}
+        for page_data in bounded_map(fetch_batch, chunked(order_ids, ORDER_IDS_PER_REQUEST), max_workers=max_workers):
+            for order in page_data.get("orders", []):
+                orders[order["orderId"]] = order
+        return self._build_order_lookup(order_ids, orders)
+
+    def _get_orders_page(self, params: Dict[str, Any]) -> dict:
+        """
+        Fetch and decode one page of orders.
+
+        Args:
+            params (Dict[str, Any]): Query parameters for the request, including `offset` and `limit`.
+
+        Returns:
+            dict: The decoded page, including `orders` and `total`.
+        """
         response = self.auth.make_request(
             "GET",
             endpoint="sell/fulfillment/v1/order",
             get_headers_callback=self.auth.get_headers_with_bearer,
-            params={"limit": 100}
+            params=params,
         )
-        return response.json().get("orders", [])
+        return response.json()
+
+    @staticmethod
+    def build_order_filter(
+        creation_date_from: Optional[datetime] = None,
+        creation_date_to: Optional[datetime] = None,
+        last_modified_date_from: Optional[datetime] = None,
+        last_modified_date_to: Optional[datetime] = None,
+        fulfillment_statuses: Optional[List[str]] = None,
+    ) -> Optional[str]:
+        """
+        Build a getOrders `filter` value.
+
+        Args:
+            creation_date_from (Optional[datetime]): Only orders created at or after this time.
+            creation_date_to (Optional[datetime]): Only orders created at or before this time.
+            last_modified_date_from (Optional[datetime]): Only orders modified at or after this time.
+            last_modified_date_to (Optional[datetime]): Only orders modified at or before this time.
+            fulfillment_statuses (Optional[List[str]]): e.g. ["NOT_STARTED", "IN_PROGRESS"].
+
+        Returns:
+            Optional[str]: The filter string, or None if no criteria were given.
+        """
+        def date_range(name: str, start: Optional[datetime], end: Optional[datetime]) -> Optional[str]:
+            if start is None and end is None:
+                return None
+            return f"{name}:[{EbayConnector._format_date(start)}..{EbayConnector._format_date(end)}]"
+
+        filters = [
+            date_range("creationdate", creation_date_from, creation_date_to),
+            date_range("lastmodifieddate", last_modified_date_from, last_modified_date_to),
+            f"orderfulfillmentstatus:{{{'|'.join(fulfillment_statuses)}}}" if fulfillment_statuses else None,
+        ]
+        filters = [item for item in filters if item]
+        return ",".join(filters) if filters else None
+
+    @staticmethod
+    def _format_date(value: Optional[datetime]) -> str:
+        """
+        Format a datetime as the UTC ISO 8601 string eBay expects (empty for an open range end).
+        """
+        if value is None:
+            return ""
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return value.strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}Z"
     
     def get_order(self, order_id: str) -> dict:
         """
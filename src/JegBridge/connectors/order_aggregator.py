@@ -0,0 +1,196 @@
+import queue
+import threading
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+from JegBridge.connectors.base_connector import BaseConnector
+
+
+class TaggedOrder(NamedTuple):
+    """
+    An order together with the connector it came from.
+    """
+    marketplace: str
+    account_id: str
+    order: dict
+
+
+class AggregatedOrders(NamedTuple):
+    """
+    Orders collected from several connectors.
+    """
+    orders: List[TaggedOrder]
+    # Exceptions (including TimeoutError) keyed by "<marketplace>:<account_id>", for connectors that did not finish.
+    errors: Dict[str, Exception]
+
+
+def _default_fetch(connector: BaseConnector) -> Iterable[dict]:
+    return connector.iter_open_orders()
+
+
+class OrderAggregator:
+    """
+    Fetch orders from several marketplace connectors at once and merge them into one stream.
+
+    Every connector is read on its own thread and its orders are yielded as soon as they arrive,
+    tagged with the marketplace and account. Each connector has its own deadline: when it fails or
+    runs out of time, the orders it already produced are kept and the others carry on.
+
+    A connector that runs out of time, or whose stream is abandoned by the consumer, stops before
+    requesting its next page, but a request already in flight is not cancelled: its thread finishes
+    it in the background and discards the result. Orders waiting to be consumed are buffered up to
+    `buffer_size`, beyond which the connector threads wait for the consumer.
+    """
+
+    def __init__(
+        self,
+        connectors: Iterable[BaseConnector],
+        timeout: Optional[float] = 120,
+        timeouts: Optional[Dict[str, float]] = None,
+        buffer_size: int = 1000,
+    ):
+        """
+        Initialize the OrderAggregator object.
+
+        Args:
+            connectors (Iterable[BaseConnector]): The connectors to read from.
+            timeout (Optional[float]): Seconds each connector may take before its results are cut off.
+                None waits indefinitely. Defaults to 120.
+            timeouts (Optional[Dict[str, float]]): Per-marketplace overrides of `timeout`, e.g. {"walmartmp": 300}.
+            buffer_size (int): Maximum number of orders read ahead of the consumer, across all
+                connectors. Defaults to 1000.
+
+        Raises:
+            ValueError: If two connectors read from the same marketplace and account, since their
+                orders and errors could not be told apart.
+        """
+        self.connectors = list(connectors)
+        keys = [self._key(connector) for connector in self.connectors]
+        duplicates = sorted({key for key in keys if keys.count(key) > 1})
+        if duplicates:
+            raise ValueError(f"Several connectors read from the same marketplace account: {', '.join(duplicates)}")
+        self.timeout = timeout
+        self.timeouts = timeouts or {}
+        self.buffer_size = buffer_size
+        # Failures of the most recent iter_orders run, keyed like AggregatedOrders.errors
+        self.last_errors: Dict[str, Exception] = {}
+
+    def get_orders(self, fetch: Optional[Callable[[BaseConnector], Iterable[dict]]] = None) -> AggregatedOrders:
+        """
+        Collect orders from all connectors.
+
+        Args:
+            fetch (Optional[Callable[[BaseConnector], Iterable[dict]]]): How to read orders from one
+                connector, e.g. `lambda connector: connector.iter_orders_modified_since(since)`.
+                Defaults to the connector's `iter_open_orders()`.
+
+        Returns:
+            AggregatedOrders: The tagged orders, in arrival order, and the errors of connectors that did not finish.
+        """
+        orders = list(self.iter_orders(fetch))
+        return AggregatedOrders(orders, dict(self.last_errors))
+
+    def iter_orders(self, fetch: Optional[Callable[[BaseConnector], Iterable[dict]]] = None) -> Iterator[TaggedOrder]:
+        """
+        Stream orders from all connectors as they arrive.
+
+        Failures and timeouts do not interrupt the stream; they are recorded in `last_errors`,
+        which is complete once the iterator is exhausted.
+
+        Args:
+            fetch (Optional[Callable[[BaseConnector], Iterable[dict]]]): How to read orders from one
+                connector. Defaults to the connector's `iter_open_orders()`.
+
+        Yields:
+            TaggedOrder: Orders tagged with their marketplace and account.
+        """
+        fetch = fetch or _default_fetch
+        self.last_errors = {}
+        results = queue.Queue(maxsize=self.buffer_size)
+        started = time.monotonic()
+        active = {}
+        deadlines = {}
+
+        for connector in self.connectors:
+            key = self._key(connector)
+            stop = threading.Event()
+            active[key] = stop
+            timeout = self.timeouts.get(connector.marketplace, self.timeout)
+            if timeout is not None:
+                deadlines[key] = (started + timeout, timeout)
+            # Daemon threads, so a hung marketplace can never keep the process alive
+            threading.Thread(
+                target=self._read_connector,
+                args=(connector, key, fetch, results, stop),
+                name=f"order-aggregator-{key}",
+                daemon=True,
+            ).start()
+
+        try:
+            while active:
+                now = time.monotonic()
+                for key in [key for key in active if key in deadlines and deadlines[key][0] <= now]:
+                    active.pop(key).set()
+                    self.last_errors[key] = TimeoutError(f"{key} did not finish within {deadlines[key][1]} seconds")
+                pending = [deadlines[key][0] for key in active if key in deadlines]
+                wait_time = max(0.0, min(pending) - now) if pending else None
+                if not active:
+                    break  # every remaining connector just timed out
+                try:
+                    kind, key, payload = results.get(timeout=wait_time)
+                except queue.Empty:
+                    continue
+                if key not in active:
+                    continue
+                if kind == "order":
+                    yield payload
+                elif kind == "error":
+                    self.last_errors[key] = payload
+                    del active[key]
+                else:
+                    del active[key]
+        finally:
+            for stop in active.values():
+                stop.set()
+
+    @staticmethod
+    def _key(connector: BaseConnector) -> str:
+        return f"{connector.marketplace}:{connector.account_id}"
+
+    @staticmethod
+    def _read_connector(
+        connector: BaseConnector,
+        key: str,
+        fetch: Callable[[BaseConnector], Iterable[dict]],
+        results: queue.Queue,
+        stop: threading.Event,
+    ) -> None:
+        """
+        Read one connector's orders onto the shared queue until done, failed or stopped.
+        """
+        orders = iter(fetch(connector))
+        try:
+            for order in orders:
+                if not OrderAggregator._put(results, ("order", key, TaggedOrder(connector.marketplace, connector.account_id, order)), stop):
+                    return
+        except Exception as e:
+            OrderAggregator._put(results, ("error", key, e), stop)
+            return
+        finally:
+            # Stop a generator-based fetch from paginating further
+            close = getattr(orders, "close", None)
+            if close is not None:
+                close()
+        OrderAggregator._put(results, ("done", key, None), stop)
+
+    @staticmethod
+    def _put(results: queue.Queue, item: tuple, stop: threading.Event, poll_interval: float = 0.1) -> bool:
+        """
+        Put an item on the bounded queue, waiting for room unless the reader is stopped. False if it was stopped.
+        """
+        while not stop.is_set():
+            try:
+                results.put(item, timeout=poll_interval)
+                return True
+            except queue.Full:
+                continue
+        return False
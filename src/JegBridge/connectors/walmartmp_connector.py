@@ -1,25 +1,57 @@
 import requests
 import urllib.parse
-from typing import Optional, Dict, Any
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Iterator, Tuple
 from JegBridge.connectors.base_connector import BaseConnector
 from JegBridge.auth.base_auth import BaseAuth
+from JegBridge.models.order import OrderMapping
+from JegBridge.utils.checkpoint_store import PaginationCheckpoint
+
+ORDERS_PAGE_SIZE = 100
+# Statuses of orders that still have to be shipped. getAllOrders takes one status per request.
+OPEN_ORDER_STATUSES = ["Created", "Acknowledged"]
 
 #TODO manage access token so don't have to create new one each instance
 class WalmartMPConnector(BaseConnector):
     """
     Amazon-specific implementation of the connector.
     """
+    marketplace = "walmartmp"
+    order_id_field = "purchaseOrderId"
+    order_created_field = "orderDate"
+    orders_page_path = ("list", "elements", "order")
+    # Walmart has no order-level status or total; the first line's status and currency stand in
+    order_mapping = OrderMapping(
+        order_id="purchaseOrderId",
+        status="orderLines.orderLine.0.orderLineStatuses.orderLineStatus.0.status",
+        created_at="orderDate",
+        currency="orderLines.orderLine.0.charges.charge.0.chargeAmount.currency",
+        lines="orderLines.orderLine",
+        line_id="lineNumber",
+        line_sku="item.sku",
+        line_title="item.productName",
+        line_quantity="orderLineQuantity.amount",
+        line_price="charges.charge.0.chargeAmount.amount",
+    )
 
     def __init__(self, auth: BaseAuth):
         super().__init__(auth)
 
-    def get_orders(self, filter_params: Optional[Dict[str, Any]] = None, max_pages: int = 5) -> list:
+    def get_orders(
+        self,
+        filter_params: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None,
+        checkpoint: Optional[PaginationCheckpoint] = None,
+    ) -> list:
         """
-        Get orders from Walmart Marketplace.
+        Get orders from Walmart Marketplace, following nextCursor across all pages.
 
         Args:
             filter_params (Optional[Dict[str, Any]]): API filter params (e.g. status, createdStartDate).
-            max_pages (int): Maximum number of pages to fetch. Defaults to 5 (500 orders).
+            max_pages (Optional[int]): Maximum number of pages to fetch. Defaults to None (all pages).
+            checkpoint (Optional[PaginationCheckpoint]): Optional checkpoint to resume an interrupted fetch.
+                Orders saved by earlier runs are returned first.
 
         Returns:
             list: A list of order objects as returned by the Walmart MP API.
@@ -30,36 +62,194 @@ class WalmartMPConnector(BaseConnector):
         Reference:
             https://developer.walmart.com/api/us/mp/orders#operation/getAllOrders
         """
-        all_orders = []
-        params = {**(filter_params or {}), "limit": 100}
+        saved_orders = checkpoint.items() if checkpoint is not None else []
+        return saved_orders + list(self.iter_orders(filter_params=filter_params, max_pages=max_pages, checkpoint=checkpoint))
+
+    def iter_orders(
+        self,
+        filter_params: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None,
+        checkpoint: Optional[PaginationCheckpoint] = None,
+        stream: bool = False,
+    ) -> Iterator[dict]:
+        """
+        Stream orders from Walmart Marketplace, prefetching the next page while the current one is consumed.
+
+        As soon as a page's nextCursor is known, the request for the following page is started in a
+        background thread (which also decodes its JSON), so network wait overlaps with the caller's
+        processing of the current page. Pagination stops on the last page or when Walmart repeats a cursor.
+
+        With a `checkpoint`, every page and the cursor after it are saved once the caller has consumed
+        the page's last order, and a rerun resumes after the last saved page (yielding only new orders).
+        A page interrupted midway is fetched again, so its first orders may be delivered twice. The
+        checkpoint is cleared once the last page has been consumed.
+
+        With `stream=True`, each page is parsed incrementally as it is read from the socket and its
+        orders are yielded one by one while the rest of the page is still downloading. Pages are then
+        fetched one at a time, and only about one order is held in memory instead of a whole page.
+
+        Args:
+            filter_params (Optional[Dict[str, Any]]): API filter params (e.g. status, createdStartDate).
+            max_pages (Optional[int]): Maximum number of pages to fetch in this run. Defaults to None (all pages).
+            checkpoint (Optional[PaginationCheckpoint]): Optional checkpoint to save progress to and resume from.
+            stream (bool): Whether to parse pages incrementally. Cannot be combined with `checkpoint`,
+                which saves whole pages. Defaults to False.
+
+        Yields:
+            dict: Order objects as returned by the Walmart MP API.
+
+        Raises:
+            KeyError: If the response structure is unexpected.
+            ValueError: If both `stream` and `checkpoint` are given.
+
+        Reference:
+            https://developer.walmart.com/api/us/mp/orders#operation/getAllOrders
+        """
+        query = {**(filter_params or {}), "limit": ORDERS_PAGE_SIZE}
+        if stream:
+            if checkpoint is not None:
+                raise ValueError("stream cannot be combined with checkpoint")
+            yield from self._iter_streamed_orders(query, max_pages)
+            return
+
+        params = query
         pages_fetched = 0
         prev_cursor = None
 
-        while pages_fetched < max_pages:
-            response = self.auth.make_request("GET", endpoint="v3/orders", params=params)
-            data = response.json()
+        if checkpoint is not None:
+            state = checkpoint.load(query)
+            if state is not None:
+                if state["done"]:
+                    checkpoint.clear()
+                    return
+                params = state["cursor"]["params"]
+                prev_cursor = state["cursor"]["prev_cursor"]
 
-            try:
-                orders = data["list"]["elements"]["order"]
-                all_orders.extend(orders)
+        executor = ThreadPoolExecutor(max_workers=1)
+        next_page = executor.submit(self._get_orders_page, params)
+        try:
+            while next_page is not None:
+                orders, next_cursor = next_page.result()
                 pages_fetched += 1
-                next_cursor = data["list"]["meta"].get("nextCursor")
-            except KeyError:
-                raise KeyError(f"Unexpected response structure from Walmart orders API: {data}")
+                next_page = None
+                next_parsed, prev_cursor = self._next_page_params(next_cursor, prev_cursor, len(orders))
+
+                if next_parsed is not None and (max_pages is None or pages_fetched < max_pages):
+                    next_page = executor.submit(self._get_orders_page, next_parsed)
+
+                yield from orders
+
+                if checkpoint is not None:
+                    cursor = {"params": next_parsed, "prev_cursor": prev_cursor}
+                    checkpoint.save(query, orders, cursor, done=next_parsed is None)
+        finally:
+            # Do not wait for a prefetched page the caller no longer wants
+            if next_page is not None:
+                next_page.cancel()
+            executor.shutdown(wait=False)
+
+        if checkpoint is not None and next_parsed is None:
+            checkpoint.clear()
+
+    def iter_open_orders(self) -> Iterator[dict]:
+        """
+        Stream the Created and Acknowledged orders, one status after the other.
+
+        An order that changes status between the requests is yielded once.
+
+        Yields:
+            dict: Order objects as returned by the Walmart MP API.
+        """
+        seen = set()
+        for status in OPEN_ORDER_STATUSES:
+            for order in self.iter_orders(filter_params={"status": status}):
+                order_id = order.get(self.order_id_field)
+                if order_id not in seen:
+                    seen.add(order_id)
+                    yield order
+
+    def iter_orders_modified_since(self, since: datetime) -> Iterator[dict]:
+        """
+        Stream orders created or modified since a point in time.
+
+        Args:
+            since (datetime): Only orders last modified at or after this time.
 
-            if not next_cursor or len(orders) < 100:
-                break
+        Yields:
+            dict: Order objects as returned by the Walmart MP API.
+        """
+        since = since.astimezone(timezone.utc) if since.tzinfo else since
+        return self.iter_orders(filter_params={"lastModifiedStartDate": since.strftime("%Y-%m-%dT%H:%M:%SZ")})
 
-            next_parsed = dict(urllib.parse.parse_qsl(next_cursor.lstrip('?')))
+    def _iter_streamed_orders(self, params: Dict[str, Any], max_pages: Optional[int]) -> Iterator[dict]:
+        """
+        Follow nextCursor page by page, parsing each page incrementally as it downloads.
+        """
+        pages_fetched = 0
+        prev_cursor = None
+        while params is not None:
+            page = yield from self._stream_orders_page("v3/orders", params)
+            pages_fetched += 1
+            next_cursor = page.envelope["list"].get("meta", {}).get("nextCursor")
+            params, prev_cursor = self._next_page_params(next_cursor, prev_cursor, page.count)
+            if max_pages is not None and pages_fetched >= max_pages:
+                params = None
+
+    @staticmethod
+    def _next_page_params(
+        next_cursor: Optional[str],
+        prev_cursor: Optional[str],
+        page_length: int,
+    ) -> Tuple[Optional[Dict[str, str]], Optional[str]]:
+        """
+        Decide whether to follow a page's nextCursor.
+
+        Args:
+            next_cursor (Optional[str]): The page's nextCursor query string.
+            prev_cursor (Optional[str]): The nextCursor that led to the page, if any.
+            page_length (int): Number of orders on the page.
+
+        Returns:
+            Tuple[Optional[Dict[str, str]], Optional[str]]: Query parameters of the next page (None on the
+                last page or when Walmart repeats a cursor) and the cursor to compare the next page against.
+        """
+        if next_cursor and page_length >= ORDERS_PAGE_SIZE:
+            parsed = dict(urllib.parse.parse_qsl(next_cursor.lstrip('?')))
             prev_parsed = dict(urllib.parse.parse_qsl((prev_cursor or '').lstrip('?')))
-            if next_parsed.get('cursor') == prev_parsed.get('cursor'):
-                break
+            if parsed.get('cursor') != prev_parsed.get('cursor'):
+                return parsed, next_cursor
+        return None, prev_cursor
 
-            prev_cursor = next_cursor
-            params = next_parsed
+    def _get_orders_page(self, params: Dict[str, Any]) -> Tuple[list, Optional[str]]:
+        """
+        Fetch and decode one page of orders.
+
+        Args:
+            params (Dict[str, Any]): Query parameters for the request.
+
+        Returns:
+            Tuple[list, Optional[str]]: The orders on the page and the nextCursor query string, if any.
+
+        Raises:
+            KeyError: If the response structure is unexpected.
+        """
+        response = self.auth.make_request("GET", endpoint="v3/orders", params=params)
+        return self._read_orders_page(response.json())
+
+    @staticmethod
+    def _read_orders_page(data: dict) -> Tuple[list, Optional[str]]:
+        """
+        Get the orders and the nextCursor query string from a decoded getAllOrders response.
 
+        Raises:
+            KeyError: If the response structure is unexpected.
+        """
+        try:
+            orders = data["list"]["elements"]["order"]
+        except KeyError:
+            raise KeyError(f"Unexpected response structure from Walmart orders API: {data}")
 
-        return all_orders
+        return orders, data["list"].get("meta", {}).get("nextCursor")
     
     def get_order(self, purchase_order_id: str) -> dict:
         """
@@ -1,3 +1,4 @@
 from .amazon_report_handler import AmazonReportHandler
+from .amazon_report_scheduler import AmazonReportScheduler, ReportRequest, ReportResult
 
-__all__ = ["AmazonReportHandler"]
+__all__ = ["AmazonReportHandler", "AmazonReportScheduler", "ReportRequest", "ReportResult"]
@@ -1,8 +1,12 @@
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Protocol
+from JegBridge.utils.concurrency import bounded_map, chunked
 
 if TYPE_CHECKING:
     from JegBridge.auth.base_auth import BaseAuth
 
+# searchListingsItems accepts at most 20 identifiers per request
+SKUS_PER_SEARCH = 20
+
 
 class HasAuthAndSeller(Protocol):
     auth: "BaseAuth"
@@ -36,3 +40,51 @@ class AmazonListingHandler:
         }
         response = self.auth.make_request("GET", endpoint=endpoint, params=params)
         return response.json()
+
+    def get_listings(
+        self: "HasAuthAndSeller",
+        skus: Iterable[str],
+        max_workers: int = 4,
+        marketplace_ids: Optional[List[str]] = None,
+        included_data: str = "fulfillmentAvailability,attributes,summaries",
+    ) -> Iterator[dict]:
+        """
+        Stream listing information for many SKUs, 20 SKUs per searchListingsItems request.
+
+        Batches are requested concurrently (at most `max_workers` at once, further spaced by the
+        auth rate limiter) and their listings are yielded as each batch arrives, so the order of
+        results does not follow `skus`. SKUs without a listing are simply not yielded.
+
+        Args:
+            skus (Iterable[str]): The seller SKUs to look up.
+            max_workers (int): Maximum number of batches requested at once. Defaults to 4.
+            marketplace_ids (Optional[List[str]]): Marketplaces to search. Defaults to US.
+            included_data (str): Comma-separated data sets to include for each listing.
+
+        Yields:
+            dict: Listing items as returned by the Amazon Listings API, each including its `sku`.
+
+        Raises:
+            KeyError: If the response structure is unexpected.
+
+        Reference:
+            https://developer-docs.amazon.com/sp-api/docs/listings-items-api-v2021-08-01-reference#searchlistingsitems
+        """
+        endpoint = f"/listings/2021-08-01/items/{self.seller_id}"
+        params = {
+            "marketplaceIds": ",".join(marketplace_ids or ["ATVPDKIKX0DER"]),
+            "issueLocale": "en_US",
+            "includedData": included_data,
+            "identifiersType": "SKU",
+            "pageSize": SKUS_PER_SEARCH,
+        }
+
+        def search_batch(batch: List[str]) -> list:
+            response = self.auth.make_request("GET", endpoint=endpoint, params={**params, "identifiers": ",".join(batch)})
+            data = response.json()
+            if "items" not in data:
+                raise KeyError(f"Unexpected response structure from Amazon searchListingsItems API: {data}")
+            return data["items"]
+
+        for items in bounded_map(search_batch, chunked(skus, SKUS_PER_SEARCH), max_workers=max_workers, ordered=False):
+            yield from items
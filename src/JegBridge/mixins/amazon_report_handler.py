@@ -1,10 +1,39 @@
-from typing import Optional, Dict, List, TYPE_CHECKING, Protocol
+from typing import Optional, BinaryIO, Dict, Iterable, List, Iterator, Sequence, Union, TYPE_CHECKING, Protocol
+import csv
+import gzip
+import io
 import json
+from contextlib import contextmanager
 from datetime import datetime
+from JegBridge.utils.columnar import ColumnarTable
+from JegBridge.utils.report_cache import ReportCache, ReportDocument
 
 if TYPE_CHECKING:
     from JegBridge.auth.base_auth import BaseAuth
 
+# Columns of GET_FLAT_FILE_RETURNS_DATA_BY_RETURN_DATE: table column -> (report header, kind)
+RETURNS_REPORT_SCHEMA = {
+    "order_id": ("Order ID", "text"),
+    "order_date": ("Order date", "date"),
+    "return_request_date": ("Return request date", "date"),
+    "return_request_status": ("Return request status", "str"),
+    "amazon_rma_id": ("Amazon RMA ID", "text"),
+    "label_cost": ("Label cost", "float"),
+    "currency_code": ("Currency code", "str"),
+    "asin": ("ASIN", "str"),
+    "sku": ("Merchant SKU", "str"),
+    "item_name": ("Item Name", "text"),
+    "return_quantity": ("Return quantity", "int"),
+    "return_reason": ("Return reason", "str"),
+    "in_policy": ("In policy", "str"),
+    "return_type": ("Return type", "str"),
+    "resolution": ("Resolution", "str"),
+    "return_delivery_date": ("Return delivery date", "date"),
+    "order_amount": ("Order Amount", "float"),
+    "order_quantity": ("Order quantity", "int"),
+    "refunded_amount": ("Refunded Amount", "float"),
+}
+
 class HasAuth(Protocol):
     auth: "BaseAuth"
 
@@ -72,12 +101,156 @@ class AmazonReportHandler:
         response = self.auth.make_request("GET", endpoint)
         return response
 
+    @contextmanager
+    def open_report_document(self: "HasAuth", report_document_id: str, timeout: float = 60) -> Iterator[BinaryIO]:
+        """
+        Open a report document as a decompressed binary stream, downloading it in chunks.
+
+        The presigned document URL is read over the auth session's pooled connections and gunzipped
+        on the fly when `compressionAlgorithm` is GZIP.
+
+        Args:
+            report_document_id (str): The reportDocumentId from `get_report_info`.
+            timeout (float): Seconds to wait for the download to connect or send data. Defaults to 60.
+
+        Yields:
+            BinaryIO: The decompressed document. The download is closed when the context exits.
+
+        Raises:
+            KeyError: If the document response has no download url.
+            requests.HTTPError: If the download fails.
+
+        Reference:
+            https://developer-docs.amazon.com/sp-api/docs/reports-api-v2021-06-30-reference#getreportdocument
+        """
+        document = self.get_doc_url(report_document_id).json()
+        if "url" not in document:
+            raise KeyError(f"Unexpected response structure from Amazon getReportDocument API: {document}")
+
+        # The presigned url carries its own credentials, so it is fetched without auth headers
+        response = self.auth.session.get(document["url"], stream=True, timeout=timeout)
+        try:
+            response.raise_for_status()
+            # Undo any transport Content-Encoding; the document's own compression is handled below
+            response.raw.decode_content = True
+            stream = response.raw
+            if document.get("compressionAlgorithm") == "GZIP":
+                stream = gzip.GzipFile(fileobj=stream)
+            yield stream
+        finally:
+            response.close()
+
+    def get_cached_report(
+        self: "HasAuth",
+        report_document_id: str,
+        cache: ReportCache,
+        encoding: str = "iso-8859-1",
+        timeout: float = 60,
+    ) -> ReportDocument:
+        """
+        Get a report document from the local cache, downloading it into the cache on a miss.
+
+        Args:
+            report_document_id (str): The reportDocumentId from `get_report_info`.
+            cache (ReportCache): The on-disk report cache.
+            encoding (str): Text encoding of the document. Defaults to "iso-8859-1".
+            timeout (float): Seconds to wait for the download to connect or send data. Defaults to 60.
+
+        Returns:
+            ReportDocument: Memory-mapped document with random access to its rows. Close it when done.
+        """
+        document = cache.open(report_document_id, encoding=encoding)
+        if document is None:
+            with self.open_report_document(report_document_id, timeout=timeout) as stream:
+                cache.store(report_document_id, stream)
+            document = cache.open(report_document_id, encoding=encoding)
+        return document
+
+    def stream_report_rows(
+        self: "HasAuth",
+        report_document_id: str,
+        as_dicts: bool = True,
+        encoding: str = "iso-8859-1",
+        timeout: float = 60,
+        cache: Optional[ReportCache] = None,
+    ) -> Iterator[Union[Dict[str, str], List[str]]]:
+        """
+        Stream the rows of a tab-separated report document without loading it into memory.
+
+        The document is downloaded in chunks (see `open_report_document`), decoded incrementally
+        and parsed as TSV, so memory use stays constant regardless of report size. With a `cache`,
+        the decompressed document is kept on disk and later calls read it from there.
+
+        Args:
+            report_document_id (str): The reportDocumentId from `get_report_info`.
+            as_dicts (bool): Yield dicts keyed by the header row instead of lists. Defaults to True.
+            encoding (str): Text encoding of the document. Defaults to "iso-8859-1", used by flat file reports.
+            timeout (float): Seconds to wait for the download to connect or send data. Defaults to 60.
+            cache (Optional[ReportCache]): Optional on-disk cache to read the document from and store it in.
+
+        Yields:
+            Union[Dict[str, str], List[str]]: One report row at a time (the header row is consumed when `as_dicts`).
+
+        Raises:
+            KeyError: If the document response has no download url.
+            requests.HTTPError: If the download fails.
 
-    def parse_returns(self):
+        Reference:
+            https://developer-docs.amazon.com/sp-api/docs/reports-api-v2021-06-30-reference#getreportdocument
         """
-        Parse the returns report data.
+        if cache is not None:
+            self.get_cached_report(report_document_id, cache, encoding=encoding, timeout=timeout).close()
+            source = open(cache.path_for(report_document_id), "rb")
+        else:
+            source = self.open_report_document(report_document_id, timeout=timeout)
+
+        with source as stream:
+            text = io.TextIOWrapper(stream, encoding=encoding, newline="")
+            # Flat file reports are plain TSV; quotes inside values are literal characters
+            reader = csv.reader(text, delimiter="\t", quoting=csv.QUOTE_NONE)
+
+            if not as_dicts:
+                yield from reader
+                return
+            header = next(reader, None)
+            if header is None:
+                return
+            for row in reader:
+                yield dict(zip(header, row))
+
+    def parse_returns(
+        self: "HasAuth",
+        report_document_id: Optional[str] = None,
+        rows: Optional[Iterable[Sequence[str]]] = None,
+    ) -> ColumnarTable:
+        """
+        Parse a GET_FLAT_FILE_RETURNS_DATA_BY_RETURN_DATE report into a columnar table.
+
+        The document is streamed and converted in a single pass: quantities go into integer arrays,
+        amounts and dates (UTC epoch seconds) into float arrays, ASINs, SKUs, reasons and other
+        repetitive text into dictionary-encoded string columns, and order ids, RMA ids and item names
+        into plain string columns. See `RETURNS_REPORT_SCHEMA` for the column names.
+
+        Example:
+            returns = connector.parse_returns(report_document_id)
+            defective = returns.filter(return_reason="DEFECTIVE")
+            quantity_by_sku = defective.sum_by("sku", "return_quantity")
+
+        Args:
+            report_document_id (Optional[str]): The reportDocumentId of a returns report to download.
+            rows (Optional[Iterable[Sequence[str]]]): Already available report rows, header first, instead
+                of downloading a document.
 
         Returns:
-            list: List of Amazon returns.
+            ColumnarTable: The returns, one row per returned item.
+
+        Raises:
+            ValueError: If neither `report_document_id` nor `rows` is given.
         """
-        pass
\ No newline at end of file
+        if rows is None:
+            if report_document_id is None:
+                raise ValueError("parse_returns needs a report_document_id or rows")
+            rows = self.stream_report_rows(report_document_id, as_dicts=False)
+        rows = iter(rows)
+        header = next(rows, None) or []
+        return ColumnarTable.from_rows(header, rows, RETURNS_REPORT_SCHEMA)
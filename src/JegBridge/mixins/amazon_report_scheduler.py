@@ -0,0 +1,233 @@
+import heapq
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, TYPE_CHECKING, Protocol, Union
+from JegBridge.utils.report_cache import ReportCache, ReportDocument
+
+if TYPE_CHECKING:
+    from JegBridge.auth.base_auth import BaseAuth
+
+# processingStatus values after which a report no longer changes
+FINAL_PROCESSING_STATUSES = frozenset({"DONE", "CANCELLED", "FATAL"})
+# Ways run_reports can hand over finished documents
+DOWNLOAD_MODES = ("stream", "document", "list")
+
+
+class HasReportHandler(Protocol):
+    auth: "BaseAuth"
+
+    def create_report(self, report_type: str, marketplaces: List[str] = None, data_start_date: Optional[datetime] = None,
+                      data_end_date: Optional[datetime] = None, report_options: Optional[Dict] = None): ...
+
+    def get_report_info(self, report_id): ...
+
+    def stream_report_rows(self, report_document_id: str) -> Iterator[Dict[str, str]]: ...
+
+    def get_cached_report(self, report_document_id: str, cache: ReportCache) -> ReportDocument: ...
+
+
+class ReportRequest(NamedTuple):
+    """
+    One report to generate, with the arguments of `create_report`.
+    """
+    report_type: str
+    marketplaces: Optional[List[str]] = None
+    data_start_date: Optional[datetime] = None
+    data_end_date: Optional[datetime] = None
+    report_options: Optional[Dict] = None
+
+
+class ReportResult(NamedTuple):
+    """
+    Outcome of one scheduled report.
+    """
+    request: ReportRequest
+    report_id: Optional[str]
+    # Last processingStatus seen (DONE, CANCELLED, FATAL, ...), or None if the report was never created.
+    processing_status: Optional[str]
+    report_document_id: Optional[str]
+    # Rows of the document as dicts, when the report finished: an iterator over the open download with
+    # download="stream", a list with download="list".
+    rows: Optional[Union[Iterator[Dict[str, str]], List[Dict[str, str]]]]
+    # Exception that stopped this report, if any.
+    error: Optional[Exception]
+    # The cached document, when the report finished and download="document". Close it when done.
+    document: Optional[ReportDocument] = None
+
+
+class _ReportJob:
+    """
+    Mutable progress of one report while it is being scheduled.
+    """
+    __slots__ = ("request", "report_id", "processing_status", "report_document_id", "poll_interval", "deadline")
+
+    def __init__(self, request: ReportRequest):
+        self.request = request
+        self.report_id = None
+        self.processing_status = None
+        self.report_document_id = None
+        self.poll_interval = None
+        self.deadline = None
+
+    def result(
+        self,
+        rows: Optional[Iterable] = None,
+        error: Optional[Exception] = None,
+        document: Optional[ReportDocument] = None,
+    ) -> ReportResult:
+        return ReportResult(
+            self.request, self.report_id, self.processing_status, self.report_document_id, rows, error, document
+        )
+
+
+class AmazonReportScheduler:
+    """
+    Mixin that runs many Amazon reports through create, poll and download concurrently.
+    Requires the host class to provide the AmazonReportHandler methods.
+    """
+
+    def run_reports(
+        self: "HasReportHandler",
+        report_requests: Iterable[ReportRequest],
+        download: Union[str, bool, None] = "stream",
+        cache: Optional[ReportCache] = None,
+        max_workers: int = 4,
+        poll_interval: float = 15,
+        max_poll_interval: float = 120,
+        timeout: float = 3600,
+    ) -> Iterator[ReportResult]:
+        """
+        Generate many reports concurrently and yield each one as soon as it is finished.
+
+        Reports are created one after another on a dedicated thread, so the auth rate limiter can
+        space createReport calls without holding up polling. Each pending report is polled on its
+        own schedule: the interval starts at `poll_interval`, doubles while the report is IN_QUEUE
+        and grows by half while it is IN_PROGRESS, up to `max_poll_interval`.
+
+        Finished documents are downloaded on the worker threads while other reports are still being
+        polled. By default the download is only opened there (getReportDocument, the connection and
+        the first row) and a finished report's `rows` parses the rest of it as it is consumed, so no
+        document is held in memory. With download="document", documents are downloaded into `cache`
+        and handed over as memory-mapped `ReportDocument`s. Only download="list" loads every row
+        into memory.
+
+        Args:
+            report_requests (Iterable[ReportRequest]): The reports to generate.
+            download (Union[str, bool, None]): How to hand over finished documents: "stream" (the default),
+                "document" or "list". None or False skips them; True is the same as "list".
+            cache (Optional[ReportCache]): The on-disk cache documents are downloaded into. Required
+                with download="document".
+            max_workers (int): Maximum number of polls and downloads running at once. Defaults to 4.
+            poll_interval (float): Seconds before the first status check of a report. Defaults to 15.
+            max_poll_interval (float): Upper bound for the interval between status checks. Defaults to 120.
+            timeout (float): Seconds after creation before a report is given up on. Defaults to 3600.
+
+        Yields:
+            ReportResult: One result per request, in completion order. Failures are reported in
+                `ReportResult.error` instead of being raised, so one bad report does not stop the batch.
+                With download="stream", only a connection dropping after the download was opened is
+                raised, while `rows` is consumed.
+
+        Raises:
+            ValueError: If `download` is not a known mode, or is "document" without a `cache`.
+
+        Reference:
+            https://developer-docs.amazon.com/sp-api/docs/reports-api-v2021-06-30-reference
+        """
+        if download is True:
+            download = "list"
+        elif download is False:
+            download = None
+        if download is not None and download not in DOWNLOAD_MODES:
+            raise ValueError(f"download must be one of {DOWNLOAD_MODES} or None, got {download!r}")
+        if download == "document" and cache is None:
+            raise ValueError('download="document" requires a cache')
+
+        due_polls = []  # heap of (due time, sequence, job)
+        sequence = itertools.count()
+        in_flight = {}
+
+        def create(job: _ReportJob) -> None:
+            request = job.request
+            response = self.create_report(
+                report_type=request.report_type,
+                marketplaces=request.marketplaces,
+                data_start_date=request.data_start_date,
+                data_end_date=request.data_end_date,
+                report_options=request.report_options,
+            )
+            data = response.json()
+            if "reportId" not in data:
+                raise KeyError(f"Unexpected response structure from Amazon createReport API: {data}")
+            job.report_id = data["reportId"]
+
+        def poll(job: _ReportJob) -> None:
+            data = self.get_report_info(job.report_id).json()
+            if "processingStatus" not in data:
+                raise KeyError(f"Unexpected response structure from Amazon getReport API: {data}")
+            job.processing_status = data["processingStatus"]
+            job.report_document_id = data.get("reportDocumentId")
+
+        def fetch(job: _ReportJob) -> ReportResult:
+            if download == "document":
+                return job.result(document=self.get_cached_report(job.report_document_id, cache))
+            rows = self.stream_report_rows(job.report_document_id)
+            if download == "list":
+                return job.result(rows=list(rows))
+            # Open the download here, so that getReportDocument and connection failures end up in `error`
+            first = next(rows, None)
+            return job.result(rows=rows if first is None else itertools.chain((first,), rows))
+
+        def schedule_poll(job: _ReportJob, delay: float) -> None:
+            heapq.heappush(due_polls, (time.monotonic() + delay, next(sequence), job))
+
+        with ThreadPoolExecutor(max_workers=1) as create_executor, \
+                ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                for request in report_requests:
+                    job = _ReportJob(request)
+                    in_flight[create_executor.submit(create, job)] = ("create", job)
+
+                while in_flight or due_polls:
+                    now = time.monotonic()
+                    busy = sum(1 for kind, _ in in_flight.values() if kind != "create")
+                    while due_polls and due_polls[0][0] <= now and busy < max_workers:
+                        _, _, job = heapq.heappop(due_polls)
+                        in_flight[executor.submit(poll, job)] = ("poll", job)
+                        busy += 1
+
+                    wait_time = max(0.0, due_polls[0][0] - now) if due_polls and busy < max_workers else None
+                    if not in_flight:
+                        time.sleep(wait_time)
+                        continue
+                    done, _ = wait(in_flight, timeout=wait_time, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        kind, job = in_flight.pop(future)
+                        error = future.exception()
+                        if error is not None:
+                            yield job.result(error=error)
+                        elif kind == "create":
+                            job.poll_interval = poll_interval
+                            job.deadline = time.monotonic() + timeout
+                            schedule_poll(job, poll_interval)
+                        elif kind == "download":
+                            yield future.result()
+                        elif job.processing_status in FINAL_PROCESSING_STATUSES:
+                            if not (download and job.processing_status == "DONE" and job.report_document_id):
+                                yield job.result()
+                            else:
+                                in_flight[executor.submit(fetch, job)] = ("download", job)
+                        elif time.monotonic() + job.poll_interval > job.deadline:
+                            yield job.result(error=TimeoutError(
+                                f"Report {job.report_id} still {job.processing_status} after {timeout} seconds"
+                            ))
+                        else:
+                            growth = 2 if job.processing_status == "IN_QUEUE" else 1.5
+                            job.poll_interval = min(job.poll_interval * growth, max_poll_interval)
+                            schedule_poll(job, job.poll_interval)
+            finally:
+                for future in in_flight:
+                    future.cancel()
@@ -0,0 +1,3 @@
+from .order import Order, OrderLine, OrderMapping
+
+__all__ = ["Order", "OrderLine", "OrderMapping"]
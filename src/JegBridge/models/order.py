@@ -0,0 +1,193 @@
+import json
+import sys
+from typing import Any, Iterator, List, NamedTuple, Optional, Union
+from JegBridge.utils.json_decoder import JsonDecoder
+from JegBridge.utils.time_formatter import normalize_date
+
+
+def get_path(data: Any, path: Optional[str]) -> Any:
+    """
+    Read a nested value by dotted path, e.g. "pricingSummary.total.value" or "charges.charge.0.chargeAmount".
+
+    Args:
+        data (Any): Decoded JSON.
+        path (Optional[str]): Dotted path; numeric parts index into lists.
+
+    Returns:
+        Any: The value, or None if the path is not set or any part of it is missing.
+    """
+    if path is None:
+        return None
+    for part in path.split("."):
+        if isinstance(data, dict):
+            data = data.get(part)
+        elif isinstance(data, list) and part.isdigit() and int(part) < len(data):
+            data = data[int(part)]
+        else:
+            return None
+        if data is None:
+            return None
+    return data
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_text(value: Any) -> Optional[str]:
+    return None if value is None else sys.intern(str(value))
+
+
+class OrderMapping(NamedTuple):
+    """
+    Where a marketplace keeps the normalized order fields, as dotted paths into its raw order object.
+    """
+    order_id: str
+    status: Optional[str] = None
+    created_at: Optional[str] = None
+    modified_at: Optional[str] = None
+    total: Optional[str] = None
+    currency: Optional[str] = None
+    # Path of the list of order lines, and paths inside each line.
+    lines: Optional[str] = None
+    line_id: Optional[str] = None
+    line_sku: Optional[str] = None
+    line_title: Optional[str] = None
+    line_quantity: Optional[str] = None
+    line_price: Optional[str] = None
+
+
+class OrderLine:
+    """
+    One normalized order line.
+    """
+    __slots__ = ("line_id", "sku", "title", "quantity", "price")
+
+    def __init__(
+        self,
+        line_id: Optional[str],
+        sku: Optional[str],
+        title: Optional[str],
+        quantity: Optional[float],
+        price: Optional[float],
+    ):
+        self.line_id = line_id
+        self.sku = sku
+        self.title = title
+        self.quantity = quantity
+        self.price = price
+
+    def __repr__(self) -> str:
+        return f"OrderLine(line_id={self.line_id!r}, sku={self.sku!r}, quantity={self.quantity!r}, price={self.price!r})"
+
+
+class Order:
+    """
+    Compact, normalized order from any marketplace.
+
+    The fields needed to sort and filter orders (id, status, dates, total) are extracted once and
+    stored in slots; the full marketplace object is kept as compact JSON bytes and only decoded,
+    with the decoder the order was built with, when `raw`, `lines` or `get` is used. Decoded data
+    is not kept, so a large number of orders stays small in memory. When the decoder supports it
+    (msgspec), orders given as JSON are decoded straight into a Struct holding only the mapped fields.
+    """
+    __slots__ = ("marketplace", "order_id", "status", "created_at", "modified_at", "total", "currency",
+                 "_raw_bytes", "_mapping", "_json_decoder")
+
+    def __init__(
+        self,
+        marketplace: str,
+        raw: Union[dict, bytes, str],
+        mapping: OrderMapping,
+        json_decoder: Optional[JsonDecoder] = None,
+    ):
+        """
+        Initialize the Order object.
+
+        Args:
+            marketplace (str): The marketplace name, e.g. "amazon".
+            raw (Union[dict, bytes, str]): The marketplace order object, decoded or as JSON.
+            mapping (OrderMapping): Where the marketplace keeps the normalized fields.
+            json_decoder (Optional[JsonDecoder]): Decoder used to read the order's JSON, now and whenever
+                `raw` is accessed. Defaults to the standard library.
+        """
+        # Paths of order_id, status, created_at, modified_at, total and currency
+        paths = mapping[:6]
+        values = None
+        if isinstance(raw, dict):
+            data = raw
+            raw_bytes = json.dumps(raw, separators=(",", ":")).encode("utf-8")
+        else:
+            raw_bytes = raw.encode("utf-8") if isinstance(raw, str) else bytes(raw)
+            read_fields = json_decoder.fields_decoder(paths) if json_decoder is not None else None
+            values = read_fields(raw_bytes) if read_fields is not None else None
+            if values is None:
+                data = json_decoder.loads(raw_bytes) if json_decoder is not None else json.loads(raw_bytes)
+        if values is None:
+            values = [get_path(data, path) for path in paths]
+        order_id, status, created_at, modified_at, total, currency = values
+
+        self.marketplace = sys.intern(marketplace)
+        self.order_id = None if order_id is None else str(order_id)
+        self.status = _to_text(status)
+        self.created_at = normalize_date(created_at)
+        self.modified_at = normalize_date(modified_at)
+        self.total = _to_float(total)
+        self.currency = _to_text(currency)
+        self._raw_bytes = raw_bytes
+        self._mapping = mapping
+        self._json_decoder = json_decoder
+
+    @property
+    def raw(self) -> dict:
+        """
+        The full marketplace order object, decoded on every access.
+        """
+        decoder = self._json_decoder
+        return decoder.loads(self._raw_bytes) if decoder is not None else json.loads(self._raw_bytes)
+
+    @property
+    def raw_bytes(self) -> bytes:
+        """
+        The marketplace order object as compact JSON.
+        """
+        return self._raw_bytes
+
+    def get(self, path: str) -> Any:
+        """
+        Read any marketplace-specific field by dotted path, e.g. order.get("buyer.username").
+        """
+        return get_path(self.raw, path)
+
+    @property
+    def lines(self) -> List[OrderLine]:
+        """
+        The order lines, decoded on every access. Empty if the marketplace's order object has no lines
+        (e.g. Amazon getOrders, whose lines come from getOrderItems).
+        """
+        return list(self.iter_lines())
+
+    def iter_lines(self) -> Iterator[OrderLine]:
+        mapping = self._mapping
+        for line in get_path(self.raw, mapping.lines) or []:
+            yield OrderLine(
+                line_id=_to_text(get_path(line, mapping.line_id)),
+                sku=_to_text(get_path(line, mapping.line_sku)),
+                title=get_path(line, mapping.line_title),
+                quantity=_to_float(get_path(line, mapping.line_quantity)),
+                price=_to_float(get_path(line, mapping.line_price)),
+            )
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Order):
+            return NotImplemented
+        return (self.marketplace, self.order_id, self._raw_bytes) == (other.marketplace, other.order_id, other._raw_bytes)
+
+    def __hash__(self) -> int:
+        return hash((self.marketplace, self.order_id))
+
+    def __repr__(self) -> str:
+        return f"Order(marketplace={self.marketplace!r}, order_id={self.order_id!r}, status={self.status!r})"
@@ -0,0 +1,202 @@
+import json
+import os
+import threading
+from typing import Any, Optional
+
+
+class CheckpointStore:
+    """
+    Small persistent key/value store for sync watermarks, kept in a local JSON file.
+
+    Writes go to a temporary file that atomically replaces the store, so a crash mid-write never
+    leaves a corrupt or half-written checkpoint behind. The lock only serializes threads of one
+    process; processes sharing a store file may overwrite each other's updates.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the CheckpointStore object.
+
+        Args:
+            path (str): Path of the JSON file. It is created on the first write.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, "r") as json_file:
+                return json.load(json_file)
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, data: dict) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as json_file:
+            json.dump(data, json_file, indent=4)
+            json_file.flush()
+            os.fsync(json_file.fileno())
+        os.replace(tmp_path, self.path)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get a stored value.
+
+        Args:
+            key (str): The checkpoint key, e.g. "amazon:SELLER_ID".
+            default (Any): Value returned when the key is not stored.
+
+        Returns:
+            Any: The stored value or `default`.
+        """
+        with self._lock:
+            return self._read().get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a JSON-serializable value.
+
+        Args:
+            key (str): The checkpoint key.
+            value (Any): The value to store.
+        """
+        with self._lock:
+            data = self._read()
+            data[key] = value
+            self._write(data)
+
+    def delete(self, key: str) -> None:
+        """
+        Remove a stored value if present.
+
+        Args:
+            key (str): The checkpoint key.
+        """
+        with self._lock:
+            data = self._read()
+            if data.pop(key, None) is not None:
+                self._write(data)
+
+
+class PaginationCheckpoint:
+    """
+    Crash-safe progress record for one long paginated fetch.
+
+    Items from each page are appended to `<path>.items.jsonl`, then the page cursor (NextToken,
+    Walmart cursor, Backmarket page number, ...) and the size of the committed items file are
+    written atomically to `<path>`. If the process dies, a rerun with the same checkpoint continues from
+    the last saved cursor, and `items()` returns everything fetched so far. Items appended after
+    the last committed state are ignored, so a crash between the two writes cannot duplicate a page.
+
+    A checkpoint records a single fetch and has no lock: use one per fetch, from one thread.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the PaginationCheckpoint object.
+
+        Args:
+            path (str): Path of the checkpoint state file.
+        """
+        self.path = path
+        self.items_path = f"{path}.items.jsonl"
+        self._state_store = CheckpointStore(path)
+
+    def load(self, query: Any) -> Optional[dict]:
+        """
+        Load the saved progress of the fetch described by `query`.
+
+        Args:
+            query (Any): JSON-serializable description of the fetch (e.g. its filter params).
+
+        Returns:
+            Optional[dict]: None if there is no saved progress, otherwise a dict with `cursor`
+                (the connector-specific position to resume from) and `done` (whether the last page was saved).
+
+        Raises:
+            ValueError: If the checkpoint belongs to a fetch with a different query.
+        """
+        state = self._state_store._read()
+        if not state:
+            return None
+        # Round-trip through JSON so tuples/ints compare the same way they were stored
+        if state.get("query") != json.loads(json.dumps(query)):
+            raise ValueError(
+                f"Checkpoint {self.path} was saved for a different query: {state.get('query')}. "
+                f"Use another checkpoint path or clear() it first."
+            )
+        return {"cursor": state.get("cursor"), "done": state.get("done", False)}
+
+    def items(self) -> list:
+        """
+        Get every item committed so far.
+
+        Returns:
+            list: The saved items, in the order they were fetched.
+        """
+        item_count = self._state_store._read().get("item_count", 0)
+        items = []
+        if not item_count:
+            return items
+        try:
+            with open(self.items_path, "r", encoding="utf-8") as items_file:
+                for line in items_file:
+                    if len(items) >= item_count:
+                        break
+                    items.append(json.loads(line))
+        except FileNotFoundError:
+            pass
+        return items
+
+    def save(self, query: Any, items: list, cursor: Any, done: bool = False) -> None:
+        """
+        Commit one page of items together with the cursor of the next page.
+
+        If the items file has gone missing or lost committed items, it is started afresh with this
+        page; the cursor is still saved, so the fetch resumes but `items()` only returns later pages.
+
+        Args:
+            query (Any): JSON-serializable description of the fetch.
+            items (list): Items of the page just fetched.
+            cursor (Any): JSON-serializable position of the next page.
+            done (bool): Whether this was the last page.
+        """
+        state = self._state_store._read()
+        item_count = state.get("item_count", 0)
+        items_bytes = state.get("items_bytes", 0)
+        try:
+            resume = bool(state) and os.path.getsize(self.items_path) >= items_bytes
+        except FileNotFoundError:
+            resume = False
+        if not resume:
+            item_count = items_bytes = 0
+
+        # A fresh fetch starts a new file; otherwise overwrite anything written after the last commit
+        with open(self.items_path, "r+b" if resume else "wb") as items_file:
+            items_file.seek(items_bytes)
+            items_file.truncate()
+            for item in items:
+                items_file.write(json.dumps(item).encode("utf-8") + b"\n")
+            items_file.flush()
+            os.fsync(items_file.fileno())
+            items_bytes = items_file.tell()
+
+        self._state_store._write({
+            "query": query,
+            "cursor": cursor,
+            "done": done,
+            "item_count": item_count + len(items),
+            "items_bytes": items_bytes,
+        })
+
+    def clear(self) -> None:
+        """
+        Delete the checkpoint files, e.g. after the fetch completed.
+        """
+        for path in (self.path, self.items_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
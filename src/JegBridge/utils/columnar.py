@@ -0,0 +1,357 @@
+import math
+import sys
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+# Date formats seen in flat file reports, tried after ISO 8601
+REPORT_DATE_FORMATS = ("%d-%b-%Y", "%m/%d/%Y", "%Y-%m-%d %H:%M:%S", "%d.%m.%Y")
+
+
+def parse_report_date(value: str) -> float:
+    """
+    Parse a report date into a UTC epoch timestamp.
+
+    Args:
+        value (str): An ISO 8601 date/time or one of `REPORT_DATE_FORMATS`. Naive values are taken as UTC.
+
+    Returns:
+        float: Seconds since the epoch, or NaN if the value is empty or not a date.
+    """
+    value = value.strip()
+    if not value:
+        return math.nan
+    text = value[:-1] + "+00:00" if value.endswith("Z") else value
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        parsed = None
+        for date_format in REPORT_DATE_FORMATS:
+            try:
+                parsed = datetime.strptime(value, date_format)
+                break
+            except ValueError:
+                continue
+        if parsed is None:
+            return math.nan
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _parse_int(value: str) -> int:
+    try:
+        return int(float(value.replace(",", "")))
+    except (ValueError, OverflowError):
+        return 0
+
+
+def _parse_float(value: str) -> float:
+    try:
+        return float(value.replace(",", ""))
+    except ValueError:
+        return math.nan
+
+
+class StringColumn:
+    """
+    Dictionary-encoded string column: each distinct value is stored once (interned) and rows
+    hold a small integer code into `values`.
+    """
+
+    def __init__(self, values: Optional[List[str]] = None, codes: Optional[array] = None):
+        self.values = values if values is not None else []
+        self.codes = codes if codes is not None else array("I")
+        self._index = {value: code for code, value in enumerate(self.values)}
+
+    @classmethod
+    def _with_dictionary(cls, values: List[str], index: Dict[str, int], codes: array) -> "StringColumn":
+        """
+        Build a column sharing an existing dictionary, without re-indexing its values.
+        """
+        column = cls.__new__(cls)
+        column.values = values
+        column.codes = codes
+        column._index = index
+        return column
+
+    def append(self, value: str) -> None:
+        code = self._index.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(sys.intern(value))
+            self._index[value] = code
+        self.codes.append(code)
+
+    def code_of(self, value: str) -> Optional[int]:
+        """
+        Get the code of a value, or None if no row has it.
+        """
+        return self._index.get(value)
+
+    def take(self, positions: Sequence[int]) -> "StringColumn":
+        codes = self.codes
+        # Keep the dictionary so codes stay valid; it is shared with the new column, not rebuilt
+        return StringColumn._with_dictionary(self.values, self._index, array("I", [codes[position] for position in positions]))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, position: int) -> str:
+        return self.values[self.codes[position]]
+
+    def __iter__(self) -> Iterator[str]:
+        values = self.values
+        return (values[code] for code in self.codes)
+
+
+class TextColumn:
+    """
+    Plain list of strings, for columns whose values are (nearly) all distinct, such as order ids,
+    where a dictionary would only add an index entry per row.
+    """
+
+    def __init__(self, values: Optional[List[str]] = None):
+        self.values = values if values is not None else []
+
+    def append(self, value: str) -> None:
+        self.values.append(value)
+
+    def take(self, positions: Sequence[int]) -> "TextColumn":
+        values = self.values
+        return TextColumn([values[position] for position in positions])
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, position: int) -> str:
+        return self.values[position]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.values)
+
+
+class NumericColumn:
+    """
+    Column of numbers stored in a typed `array` ("q" for integers, "d" for floats and timestamps).
+    """
+
+    def __init__(self, typecode: str, data: Optional[array] = None):
+        self.typecode = typecode
+        self.data = data if data is not None else array(typecode)
+
+    def append(self, value: Union[int, float]) -> None:
+        self.data.append(value)
+
+    def take(self, positions: Sequence[int]) -> "NumericColumn":
+        data = self.data
+        return NumericColumn(self.typecode, array(self.typecode, [data[position] for position in positions]))
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, position: int) -> Union[int, float]:
+        return self.data[position]
+
+    def __iter__(self) -> Iterator[Union[int, float]]:
+        return iter(self.data)
+
+
+Column = Union[StringColumn, TextColumn, NumericColumn]
+
+# Column kinds: how to build the column and how to convert a raw report value
+COLUMN_KINDS: Dict[str, Tuple[Callable[[], Any], Callable[[str], Any]]] = {
+    "str": (StringColumn, str.strip),
+    "text": (TextColumn, str.strip),
+    "int": (lambda: NumericColumn("q"), _parse_int),
+    "float": (lambda: NumericColumn("d"), _parse_float),
+    "date": (lambda: NumericColumn("d"), parse_report_date),
+}
+
+
+class ColumnarTable:
+    """
+    Compact, typed, column-oriented table of report rows.
+
+    Numbers and dates (as UTC epoch seconds, NaN when missing) live in typed arrays and repetitive
+    strings are dictionary-encoded, so millions of rows take a fraction of the memory of a dict per row.
+    Filters scan one column per condition (string filters compare integer codes instead of
+    strings) and return a new table of the matching rows.
+    """
+
+    def __init__(self, columns: Dict[str, Column]):
+        """
+        Initialize the ColumnarTable object.
+
+        Args:
+            columns (Dict[str, Column]): Columns of equal length, keyed by name.
+        """
+        self.columns = columns
+
+    @classmethod
+    def from_rows(
+        cls,
+        header: Sequence[str],
+        rows: Iterable[Sequence[str]],
+        schema: Mapping[str, Tuple[str, str]],
+    ) -> "ColumnarTable":
+        """
+        Build a table from raw report rows in a single pass.
+
+        Args:
+            header (Sequence[str]): The report's header row.
+            rows (Iterable[Sequence[str]]): The remaining rows, e.g. from `stream_report_rows(as_dicts=False)`.
+            schema (Mapping[str, Tuple[str, str]]): Column name -> (report header, kind), where kind is
+                one of "str" (dictionary-encoded), "text" (plain strings, for values that rarely
+                repeat such as ids), "int", "float" or "date". Headers are matched case-insensitively and
+                columns whose header is missing from the report are left empty.
+
+        Returns:
+            ColumnarTable: The parsed table.
+        """
+        positions = {name.strip().lower(): position for position, name in enumerate(header)}
+        columns = {}
+        loaders = []
+        for name, (report_header, kind) in schema.items():
+            make_column, convert = COLUMN_KINDS[kind]
+            columns[name] = make_column()
+            position = positions.get(report_header.lower())
+            if position is not None:
+                loaders.append((position, convert, columns[name].append))
+
+        width = len(header)
+        for row in rows:
+            if len(row) < width:
+                row = list(row) + [""] * (width - len(row))
+            for position, convert, append in loaders:
+                append(convert(row[position]))
+
+        # Columns missing from the report are filled with empty values so every column has the same length
+        row_count = max((len(column) for column in columns.values()), default=0)
+        for name, (_, kind) in schema.items():
+            column = columns[name]
+            if len(column) < row_count:
+                _, convert = COLUMN_KINDS[kind]
+                for _ in range(row_count - len(column)):
+                    column.append(convert(""))
+        return cls(columns)
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, name: str) -> Column:
+        return self.columns[name]
+
+    def row(self, position: int) -> Dict[str, Any]:
+        """
+        Get one row as a dict, e.g. for display.
+        """
+        return {name: column[position] for name, column in self.columns.items()}
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over rows as dicts. Prefer working on columns for large tables.
+        """
+        return (self.row(position) for position in range(len(self)))
+
+    def take(self, positions: Sequence[int]) -> "ColumnarTable":
+        """
+        Get a new table with only the given rows.
+        """
+        return ColumnarTable({name: column.take(positions) for name, column in self.columns.items()})
+
+    def filter(self, **conditions: Any) -> "ColumnarTable":
+        """
+        Get the rows matching every condition.
+
+        Each keyword names a column and gives either a value (equality), a set/list/tuple of
+        accepted values, or a predicate called with each column value.
+
+        Example:
+            table.filter(return_reason={"DEFECTIVE", "DAMAGED_BY_CARRIER"}, return_quantity=lambda q: q > 1)
+
+        Returns:
+            ColumnarTable: A new table with the matching rows.
+        """
+        selected = None
+        for name, condition in conditions.items():
+            matches = self._match(self.columns[name], condition)
+            selected = matches if selected is None else [a and b for a, b in zip(selected, matches)]
+        if selected is None:
+            return self
+        return self.take([position for position, keep in enumerate(selected) if keep])
+
+    def between(self, name: str, start: Optional[float] = None, end: Optional[float] = None) -> "ColumnarTable":
+        """
+        Get the rows whose numeric or date column is in [start, end). Dates compare as epoch seconds.
+
+        Args:
+            name (str): A numeric or date column.
+            start (Optional[float]): Inclusive lower bound, or None for no bound.
+            end (Optional[float]): Exclusive upper bound, or None for no bound.
+
+        Returns:
+            ColumnarTable: A new table with the matching rows.
+        """
+        low = -math.inf if start is None else start
+        high = math.inf if end is None else end
+        data = self.columns[name].data
+        return self.take([position for position, value in enumerate(data) if low <= value < high])
+
+    def group_by(self, name: str) -> Dict[Any, "ColumnarTable"]:
+        """
+        Split the table by the values of one column, e.g. "sku", "order_id" or "return_reason".
+
+        Returns:
+            Dict[Any, ColumnarTable]: One table per distinct value, in order of first appearance.
+        """
+        column = self.columns[name]
+        groups: Dict[Any, List[int]] = {}
+        keys = self._keys(column)
+        for position, key in enumerate(keys):
+            groups.setdefault(key, []).append(position)
+        if isinstance(column, StringColumn):
+            return {column.values[code]: self.take(positions) for code, positions in groups.items()}
+        return {key: self.take(positions) for key, positions in groups.items()}
+
+    def sum_by(self, key: str, value: str) -> Dict[Any, float]:
+        """
+        Total a numeric column per distinct value of another column, without building sub-tables.
+
+        Example:
+            table.sum_by("sku", "return_quantity")
+
+        Returns:
+            Dict[Any, float]: Totals keyed by the values of `key`. NaN values are skipped.
+        """
+        column = self.columns[key]
+        is_string = isinstance(column, StringColumn)
+        keys = self._keys(column)
+        totals: Dict[Any, float] = {}
+        for group, amount in zip(keys, self.columns[value].data):
+            if amount == amount:  # skip NaN
+                totals[group] = totals.get(group, 0) + amount
+        if is_string:
+            return {column.values[code]: total for code, total in totals.items()}
+        return totals
+
+    @staticmethod
+    def _keys(column: Column) -> Sequence[Any]:
+        """
+        Grouping keys of a column: codes for dictionary-encoded strings, values otherwise.
+        """
+        if isinstance(column, StringColumn):
+            return column.codes
+        return column.values if isinstance(column, TextColumn) else column.data
+
+    @staticmethod
+    def _match(column: Column, condition: Any) -> List[bool]:
+        if callable(condition):
+            return [bool(condition(value)) for value in column]
+        accepted = condition if isinstance(condition, (set, frozenset, list, tuple)) else (condition,)
+        if isinstance(column, StringColumn):
+            # Compare integer codes instead of strings
+            codes = {column.code_of(value) for value in accepted} - {None}
+            return [code in codes for code in column.codes]
+        accepted = set(accepted)
+        return [value in accepted for value in ColumnarTable._keys(column)]
@@ -0,0 +1,113 @@
+import asyncio
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Awaitable, Callable, Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def bounded_map(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = 4,
+    ordered: bool = True,
+) -> Iterator[R]:
+    """
+    Apply `fn` to `items` in a thread pool with at most `max_workers` calls in flight.
+
+    Unlike `ThreadPoolExecutor.map`, items are submitted lazily as results are consumed, so a
+    slow consumer never has more than `max_workers` results buffered in memory.
+
+    Args:
+        fn (Callable[[T], R]): Function to call for each item.
+        items (Iterable[T]): Items to process.
+        max_workers (int): Maximum number of concurrent calls. Defaults to 4.
+        ordered (bool): Whether to yield results in item order. If False, each result is yielded
+            as soon as its call completes, so one slow call does not hold back the others. Defaults to True.
+
+    Yields:
+        R: The results, in the same order as `items` unless `ordered` is False.
+
+    Raises:
+        Exception: Re-raises the first exception raised by `fn` (in item order, or completion order
+            if `ordered` is False).
+    """
+    items = iter(items)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        in_flight = deque()
+        try:
+            for item in items:
+                in_flight.append(executor.submit(fn, item))
+                if len(in_flight) >= max_workers:
+                    break
+            while in_flight:
+                if ordered:
+                    done = [in_flight.popleft()]
+                else:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        in_flight.remove(future)
+                for future in done:
+                    result = future.result()
+                    for item in items:
+                        in_flight.append(executor.submit(fn, item))
+                        break
+                    yield result
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+
+async def bounded_gather(
+    fn: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    max_workers: int = 4,
+) -> List[R]:
+    """
+    Await `fn` for every item with at most `max_workers` calls in flight; the asyncio counterpart of `bounded_map`.
+
+    Args:
+        fn (Callable[[T], Awaitable[R]]): Coroutine function to call for each item.
+        items (Iterable[T]): Items to process.
+        max_workers (int): Maximum number of concurrent calls. Defaults to 4.
+
+    Returns:
+        List[R]: The results, in the same order as `items`.
+
+    Raises:
+        Exception: Re-raises the first exception raised by `fn`, after cancelling the other calls.
+    """
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def call(item: T) -> R:
+        async with semaphore:
+            return await fn(item)
+
+    tasks = [asyncio.ensure_future(call(item)) for item in items]
+    try:
+        return list(await asyncio.gather(*tasks))
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """
+    Split `items` into lists of at most `size` items, e.g. for batch endpoints.
+
+    Args:
+        items (Iterable[T]): Items to split.
+        size (int): Maximum number of items per chunk.
+
+    Yields:
+        List[T]: The chunks, in order.
+    """
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
@@ -0,0 +1,255 @@
+import json
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional dependency (pip install JegBridge[fastjson])
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # msgspec is an optional dependency (pip install JegBridge[fastjson])
+    msgspec = None
+
+
+class JsonDecoder:
+    """
+    Standard library JSON decoder; the base for the faster optional backends.
+
+    Besides plain decoding, `loads_items` extracts the list at a path (e.g. the orders of a
+    page) as one compact JSON document per item, ready for `Order`, and `fields_decoder` lets a
+    backend read just the fields `Order` normalizes.
+    """
+    name = "json"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decode a JSON document.
+
+        Args:
+            data (Union[bytes, str]): The JSON document, e.g. `response.content`.
+
+        Returns:
+            Any: The decoded value.
+        """
+        return json.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        """
+        Encode a value as compact UTF-8 JSON.
+        """
+        return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+    def loads_items(self, data: Union[bytes, str], path: Sequence[str]) -> List[bytes]:
+        """
+        Get each item of the list at `path` as its own JSON document.
+
+        Args:
+            data (Union[bytes, str]): The JSON document, e.g. an orders page.
+            path (Sequence[str]): Keys leading to the list, e.g. ("list", "elements", "order").
+
+        Returns:
+            List[bytes]: One JSON document per item; empty if the path is missing.
+
+        Raises:
+            KeyError: If the document is not an object.
+        """
+        value = self.loads(data)
+        if not isinstance(value, dict):
+            raise KeyError(f"Expected a JSON object, got: {type(value).__name__}")
+        for key in path:
+            value = value.get(key) if isinstance(value, dict) else None
+        return [self.dumps(item) for item in value or []]
+
+    def fields_decoder(self, paths: Sequence[Optional[str]]) -> Optional[Callable[[bytes], Optional[tuple]]]:
+        """
+        Get a function reading only the values at some dotted paths of a JSON object.
+
+        Args:
+            paths (Sequence[Optional[str]]): Dotted paths as in `get_path`, e.g. "pricingSummary.total.value".
+                None stands for a field that is not mapped.
+
+        Returns:
+            Optional[Callable[[bytes], Optional[tuple]]]: A function returning the value at each path (None
+                when missing), or None when the document does not have the expected shape. None instead of
+                a function when the backend cannot do better than `loads`, as here.
+        """
+        return None
+
+
+class OrjsonDecoder(JsonDecoder):
+    """
+    JSON decoder backed by orjson.
+    """
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonDecoder requires orjson. Install it with `pip install JegBridge[fastjson]`.")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value)
+
+
+class MsgspecDecoder(JsonDecoder):
+    """
+    JSON decoder backed by msgspec.
+
+    `loads_items` decodes only the envelope, through a Struct generated for (and cached per) the
+    list's path: the items are kept as `msgspec.Raw` slices of the input, so they are never turned
+    into Python objects. `fields_decoder` likewise decodes an order into a Struct generated for (and
+    cached per) the paths of an `OrderMapping`, skipping every field the mapping does not read.
+    """
+    name = "msgspec"
+
+    def __init__(self):
+        if msgspec is None:
+            raise ImportError("MsgspecDecoder requires msgspec. Install it with `pip install JegBridge[fastjson]`.")
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+        self._items_decoders = {}
+        self._fields_decoders: Dict[Tuple[Optional[str], ...], Callable[[bytes], Optional[tuple]]] = {}
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._decoder.decode(data)
+
+    def dumps(self, value: Any) -> bytes:
+        return self._encoder.encode(value)
+
+    def loads_items(self, data: Union[bytes, str], path: Sequence[str]) -> List[bytes]:
+        path = tuple(path)
+        decoder = self._items_decoders.get(path)
+        if decoder is None:
+            # Nested structs that only declare the keys on the path; every other field is skipped
+            schema = List[msgspec.Raw]
+            for depth, key in enumerate(reversed(path)):
+                schema = msgspec.defstruct(f"ItemsLevel{depth}", [(key, Optional[schema], None)])
+            decoder = self._items_decoders[path] = msgspec.json.Decoder(schema)
+        try:
+            value = decoder.decode(data)
+        except msgspec.ValidationError as e:
+            raise KeyError(f"Unexpected JSON structure: {e}")
+        for key in path:
+            value = getattr(value, key) if value is not None else None
+        return [bytes(item) for item in value or []]
+
+    def fields_decoder(self, paths: Sequence[Optional[str]]) -> Optional[Callable[[bytes], Optional[tuple]]]:
+        paths = tuple(paths)
+        read = self._fields_decoders.get(paths)
+        if read is None:
+            read = self._fields_decoders[paths] = self._build_fields_decoder(paths)
+        return read
+
+    @staticmethod
+    def _build_fields_decoder(paths: Tuple[Optional[str], ...]) -> Callable[[bytes], Optional[tuple]]:
+        tree: dict = {}
+        for path in paths:
+            if path is not None:
+                _merge_path(tree, path.split("."))
+        schema, names = _fields_schema(tree)
+        decoder = msgspec.json.Decoder(schema)
+        split_paths = [None if path is None else path.split(".") for path in paths]
+
+        def read(data: bytes) -> Optional[tuple]:
+            try:
+                value = decoder.decode(data)
+            except msgspec.ValidationError:
+                return None
+            return tuple(None if parts is None else _read_fields_path(value, parts, names) for parts in split_paths)
+
+        return read
+
+
+def _merge_path(tree: dict, parts: List[str]) -> None:
+    for part in parts:
+        tree = tree.setdefault(part, {})
+
+
+def _fields_schema(tree: dict) -> Tuple[Any, dict]:
+    """
+    Build the msgspec type for a tree of path parts, and the Struct attribute of each key ("{key: (attribute, names)}").
+
+    Numeric parts index into lists; a level mixing numeric and other parts is left untyped.
+    """
+    if not tree:
+        return Any, {}
+    if all(part.isdigit() for part in tree):
+        items: dict = {}
+        for subtree in tree.values():
+            for part, child in subtree.items():
+                _merge_tree(items.setdefault(part, {}), child)
+        item_type, names = _fields_schema(items)
+        return List[item_type], names
+    if any(part.isdigit() for part in tree):
+        return Any, {}
+    names = {}
+    fields = []
+    for index, (key, subtree) in enumerate(tree.items()):
+        field_type, field_names = _fields_schema(subtree)
+        # Attribute names are generated, so any JSON key works; `name` is the key it is decoded from
+        attribute = f"f{index}"
+        names[key] = (attribute, field_names)
+        fields.append((attribute, Optional[field_type], msgspec.field(default=None, name=key)))
+    return msgspec.defstruct("OrderFields", fields), names
+
+
+def _merge_tree(target: dict, tree: dict) -> None:
+    for part, child in tree.items():
+        _merge_tree(target.setdefault(part, {}), child)
+
+
+def _read_fields_path(value: Any, parts: List[str], names: dict) -> Any:
+    """
+    Follow a dotted path through a value decoded by `_fields_schema`, like `get_path` does through dicts.
+    """
+    for part in parts:
+        if isinstance(value, list):
+            if not part.isdigit() or int(part) >= len(value):
+                return None
+            value = value[int(part)]
+        elif isinstance(value, dict):
+            value = value.get(part)
+        elif part in names:
+            attribute, names = names[part]
+            value = getattr(value, attribute)
+        else:
+            return None
+        if value is None:
+            return None
+    return value
+
+
+JSON_DECODERS = {
+    JsonDecoder.name: JsonDecoder,
+    OrjsonDecoder.name: OrjsonDecoder,
+    MsgspecDecoder.name: MsgspecDecoder,
+}
+
+
+def get_json_decoder(decoder: Union[str, JsonDecoder, None] = None) -> JsonDecoder:
+    """
+    Resolve a decoder backend.
+
+    Args:
+        decoder (Union[str, JsonDecoder, None]): A decoder instance, a backend name ("json",
+            "orjson", "msgspec"), "auto" for the fastest installed backend, or None for "json".
+
+    Returns:
+        JsonDecoder: The decoder.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+        ImportError: If the requested backend is not installed.
+    """
+    if isinstance(decoder, JsonDecoder):
+        return decoder
+    if decoder is None:
+        decoder = "json"
+    if decoder == "auto":
+        decoder = "msgspec" if msgspec is not None else "orjson" if orjson is not None else "json"
+    if decoder not in JSON_DECODERS:
+        raise ValueError(f"Unknown JSON decoder {decoder!r}; expected one of {sorted(JSON_DECODERS)} or 'auto'")
+    return JSON_DECODERS[decoder]()
@@ -0,0 +1,232 @@
+import json
+import re
+from typing import Any, Iterable, Iterator, Optional, Sequence
+from JegBridge.utils.json_decoder import JsonDecoder
+
+_NON_WHITESPACE = re.compile(rb"[^ \t\r\n]")
+_STRUCTURE = re.compile(rb'[\[\]{}"]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+_SCALAR_END = re.compile(rb"[,\]} \t\r\n]")
+
+
+class JsonItemStream:
+    """
+    Incrementally parse a JSON document from chunks of bytes and yield the items of the list at `path`.
+
+    Each item is decoded as soon as its closing bracket has arrived, so only the current item (plus
+    one chunk) is held in memory rather than the whole document. Everything else in the document,
+    e.g. Walmart's `list.meta` or eBay's `total`, is decoded into `envelope`, which mirrors the
+    document without the list and is complete once iteration has finished.
+
+    Example:
+        stream = JsonItemStream(response.iter_content(65536), ("list", "elements", "order"))
+        for order in stream:
+            ...
+        next_cursor = stream.envelope["list"]["meta"]["nextCursor"]
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        path: Sequence[str],
+        json_decoder: Optional[JsonDecoder] = None,
+        decode: bool = True,
+    ):
+        """
+        Initialize the JsonItemStream object.
+
+        Args:
+            chunks (Iterable[bytes]): The document, e.g. `response.iter_content(chunk_size)`.
+            path (Sequence[str]): Keys leading to the list, e.g. ("list", "elements", "order").
+                An empty path streams a top-level array.
+            json_decoder (Optional[JsonDecoder]): Decoder for the items and the envelope. Defaults to the standard library.
+            decode (bool): Whether to yield decoded items or each item's raw JSON bytes. Defaults to True.
+        """
+        self.path = tuple(path)
+        self.json_decoder = json_decoder
+        self.decode = decode
+        # The document without the list, filled in while it is parsed.
+        self.envelope: dict = {}
+        # Whether the list at `path` was present in the document.
+        self.found = False
+        # Number of items yielded so far.
+        self.count = 0
+        self._chunks = iter(chunks)
+        self._buffer = bytearray()
+        self._pos = 0
+        self._started = False
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Yield the items of the list, in order.
+
+        Raises:
+            KeyError: If the document is not an object (or, for an empty path, not an array).
+            ValueError: If the document is malformed or truncated.
+        """
+        if self._started:
+            raise RuntimeError("A JsonItemStream can only be iterated once")
+        self._started = True
+
+        first = self._peek()
+        if not self.path:
+            if first != b"[":
+                raise KeyError(f"Expected a JSON array, got: {first!r}")
+            self.found = True
+            yield from self._read_items()
+        else:
+            if first != b"{":
+                raise KeyError(f"Expected a JSON object, got: {first!r}")
+            yield from self._read_object(0, self.envelope)
+        if self._peek() is not None:
+            raise ValueError("Unexpected data after the end of the JSON document")
+
+    def _loads(self, raw: bytes) -> Any:
+        return self.json_decoder.loads(raw) if self.json_decoder is not None else json.loads(raw)
+
+    def _read_object(self, depth: int, target: dict) -> Iterator[Any]:
+        """
+        Walk an object on the path, descending into the next path key and decoding every other member.
+        """
+        self._expect(b"{")
+        if self._peek() == b"}":
+            self._pos += 1
+            return
+        key_on_path = self.path[depth]
+        while True:
+            if self._peek() != b'"':
+                raise ValueError(f"Expected an object key at byte {self._pos} of the JSON stream")
+            key = json.loads(self._read_value())
+            self._expect(b":")
+            kind = self._peek()
+            if key == key_on_path and depth == len(self.path) - 1 and kind == b"[":
+                self.found = True
+                yield from self._read_items()
+            elif key == key_on_path and depth < len(self.path) - 1 and kind == b"{":
+                target[key] = {}
+                yield from self._read_object(depth + 1, target[key])
+            else:
+                target[key] = self._loads(self._read_value())
+
+            token = self._next_token()
+            if token == b"}":
+                return
+            if token != b",":
+                raise ValueError(f"Expected ',' or '}}' at byte {self._pos - 1} of the JSON stream, got {token!r}")
+
+    def _read_items(self) -> Iterator[Any]:
+        self._expect(b"[")
+        if self._peek() == b"]":
+            self._pos += 1
+            return
+        while True:
+            raw = self._read_value()
+            self.count += 1
+            yield self._loads(raw) if self.decode else raw
+            token = self._next_token()
+            if token == b"]":
+                return
+            if token != b",":
+                raise ValueError(f"Expected ',' or ']' at byte {self._pos - 1} of the JSON stream, got {token!r}")
+
+    def _fill(self) -> bool:
+        """
+        Append the next non-empty chunk. False at the end of the stream.
+
+        The bytes already consumed are only dropped once they make up more than half of the buffer,
+        so a large item spread over many chunks is not copied again for every chunk.
+        """
+        for chunk in self._chunks:
+            if chunk:
+                if self._pos > len(self._buffer) // 2:
+                    del self._buffer[:self._pos]
+                    self._pos = 0
+                self._buffer += chunk
+                return True
+        return False
+
+    def _peek(self) -> Optional[bytes]:
+        """
+        Skip whitespace and get the next byte without consuming it, or None at the end of the stream.
+        """
+        while True:
+            match = _NON_WHITESPACE.search(self._buffer, self._pos)
+            if match is not None:
+                self._pos = match.start()
+                return bytes(self._buffer[self._pos:self._pos + 1])
+            self._pos = len(self._buffer)
+            if not self._fill():
+                return None
+
+    def _next_token(self) -> bytes:
+        token = self._peek()
+        if token is None:
+            raise ValueError("Unexpected end of JSON stream")
+        self._pos += 1
+        return token
+
+    def _expect(self, expected: bytes) -> None:
+        token = self._next_token()
+        if token != expected:
+            raise ValueError(f"Expected {expected.decode()!r} at byte {self._pos - 1} of the JSON stream, got {token!r}")
+
+    def _read_value(self) -> bytes:
+        """
+        Consume one complete value and return its raw bytes, reading more chunks until it has ended.
+        """
+        first = self._peek()
+        if first is None:
+            raise ValueError("Unexpected end of JSON stream")
+        scalar = first not in (b"{", b"[", b'"')
+        in_string = first == b'"'
+        depth = 0
+        position = self._pos + 1 if in_string else self._pos
+
+        while True:
+            buffer = self._buffer
+            if scalar:
+                match = _SCALAR_END.search(buffer, position)
+                if match is not None:
+                    return self._consume(match.start())
+                position = len(buffer)
+            elif in_string:
+                match = _STRING_SPECIAL.search(buffer, position)
+                if match is not None and match.group() == b'"':
+                    in_string = False
+                    position = match.end()
+                    if depth == 0:
+                        return self._consume(position)
+                    continue
+                if match is not None and match.end() < len(buffer):
+                    position = match.end() + 1  # skip the escaped character
+                    continue
+                # Need more data: nothing special left, or a backslash at the very end
+                position = match.start() if match is not None else len(buffer)
+            else:
+                match = _STRUCTURE.search(buffer, position)
+                if match is not None:
+                    position = match.end()
+                    token = match.group()
+                    if token == b'"':
+                        in_string = True
+                    elif token in (b"{", b"["):
+                        depth += 1
+                    else:
+                        depth -= 1
+                        if depth == 0:
+                            return self._consume(position)
+                    continue
+                position = len(buffer)
+
+            offset = position - self._pos
+            if not self._fill():
+                if scalar:
+                    return self._consume(len(self._buffer))
+                raise ValueError("Unexpected end of JSON stream")
+            position = self._pos + offset
+
+    def _consume(self, end: int) -> bytes:
+        with memoryview(self._buffer) as view:
+            raw = bytes(view[self._pos:end])
+        self._pos = end
+        return raw
@@ -0,0 +1,307 @@
+import bisect
+import re
+import threading
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Upper bounds (seconds) of the request latency histogram buckets, Prometheus' defaults extended for slow report calls.
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Path segments that are API versions rather than ids, e.g. "v3" or Amazon's "2021-06-30".
+_VERSION_SEGMENT = re.compile(r"^(v\d+(\.\d+)*|\d{4}-\d{2}-\d{2})$")
+# Path segment wildcard in route patterns, rendered as "{id}" in templates.
+_ROUTE_WILDCARD = "[^/]+"
+
+
+@lru_cache(maxsize=4096)
+def endpoint_template(endpoint: str) -> str:
+    """
+    Reduce an endpoint to its template by dropping the query string and replacing ids with "{id}".
+
+    Any path segment containing a digit is treated as an id, except API versions. For example
+    "orders/v0/orders/123-4567890-1234567/orderItems" becomes "orders/v0/orders/{id}/orderItems".
+
+    Args:
+        endpoint (str): Endpoint relative to the base URL.
+
+    Returns:
+        str: The endpoint template.
+    """
+    path = endpoint.split("?", 1)[0].strip("/")
+    return "/".join(
+        "{id}" if any(char.isdigit() for char in segment) and not _VERSION_SEGMENT.match(segment) else segment
+        for segment in path.split("/")
+    )
+
+
+@lru_cache(maxsize=4096)
+def _route_template(routes: Tuple[Tuple["re.Pattern", str], ...], endpoint: str) -> Optional[str]:
+    """
+    Get the template of the first route matching an endpoint, or None if no route matches.
+    """
+    path = endpoint.split("?", 1)[0].strip("/")
+    for pattern, template in routes:
+        if pattern.fullmatch(path):
+            return template
+    return None
+
+
+class Histogram:
+    """
+    Cumulative-bucket histogram, as used by Prometheus. Not thread-safe on its own.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        """
+        Initialize the Histogram object.
+
+        Args:
+            buckets (Sequence[float]): Sorted upper bounds of the buckets; values above the last one
+                fall in an implicit +Inf bucket.
+        """
+        self.buckets = tuple(buckets)
+        # Observations per bucket (not cumulative); the last entry is the +Inf bucket.
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile by linear interpolation within its bucket.
+
+        Args:
+            q (float): The quantile, between 0 and 1 (e.g. 0.99 for p99).
+
+        Returns:
+            Optional[float]: The estimate, None without observations. Quantiles in the +Inf bucket
+                are reported as the last finite bound.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                if index == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[index - 1] if index else 0.0
+                return lower + (self.buckets[index] - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.buckets[-1]
+
+
+class _EndpointSeries:
+    """
+    Everything recorded for one marketplace, method and endpoint template.
+    """
+    __slots__ = ("statuses", "latency", "bytes_sent", "bytes_received")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.statuses: Dict[str, int] = {}
+        self.latency = Histogram(buckets)
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+
+class MetricsRegistry:
+    """
+    Thread-safe registry of API request metrics.
+
+    Every HTTP call made by `make_request` (including retried attempts) is recorded per marketplace,
+    method and endpoint template: its status code ("error" for transport failures), latency and
+    bytes sent and received. Token refreshes are counted per marketplace. Read the data with
+    `snapshot()` or expose it to Prometheus with `to_prometheus()`.
+
+    Pass one registry to several auth objects to collect metrics for all of them:
+
+        metrics = MetricsRegistry()
+        amazon = AmazonAuth(..., metrics=metrics)
+        ebay = EbayAuth(..., metrics=metrics)
+
+    Each auth object registers the routes of its marketplace API (see `add_routes`), so ids are
+    stripped from known endpoints whatever they look like; `template` only handles the others.
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        template: Callable[[str], str] = endpoint_template,
+        namespace: str = "jegbridge",
+    ):
+        """
+        Initialize the MetricsRegistry object.
+
+        Args:
+            buckets (Sequence[float]): Upper bounds (seconds) of the latency histogram buckets.
+            template (Callable[[str], str]): Maps an endpoint to the template it is recorded under.
+                Defaults to `endpoint_template`.
+            namespace (str): Prefix of the Prometheus metric names. Defaults to "jegbridge".
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.template = template
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._routes: Dict[str, Tuple[Tuple["re.Pattern", str], ...]] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Discard everything recorded so far.
+        """
+        with self._lock:
+            self._series: Dict[Tuple[str, str, str], _EndpointSeries] = {}
+            self._authentications: Dict[str, int] = {}
+
+    def add_routes(self, marketplace: Optional[str], patterns: Iterable[str]) -> None:
+        """
+        Register known endpoints of a marketplace, tried before `template` when recording its requests.
+
+        Args:
+            marketplace (Optional[str]): The marketplace label, e.g. "amazon".
+            patterns (Iterable[str]): Endpoint patterns relative to the base URL, with "[^/]+" standing
+                for an id, e.g. r"listings/2021-08-01/items/[^/]+/[^/]+". Such segments are recorded as "{id}".
+        """
+        routes = tuple((re.compile(pattern), pattern.replace(_ROUTE_WILDCARD, "{id}")) for pattern in patterns)
+        marketplace = marketplace or "unknown"
+        with self._lock:
+            known = self._routes.get(marketplace, ())
+            self._routes[marketplace] = known + tuple(route for route in routes if route not in known)
+
+    def record_request(
+        self,
+        marketplace: Optional[str],
+        method: str,
+        endpoint: str,
+        status: Optional[int],
+        duration: float,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+    ) -> None:
+        """
+        Record one HTTP call.
+
+        Args:
+            marketplace (Optional[str]): The marketplace label, e.g. "amazon".
+            method (str): HTTP method.
+            endpoint (str): Endpoint relative to the base URL; reduced to the template of the matching
+                route (see `add_routes`), else with `template`.
+            status (Optional[int]): Response status code, or None if the call failed at the transport level.
+            duration (float): Seconds from sending the request to receiving the response.
+            bytes_sent (int): Size of the request body.
+            bytes_received (int): Size of the response body.
+        """
+        marketplace = marketplace or "unknown"
+        routes = self._routes.get(marketplace)
+        template = _route_template(routes, endpoint) if routes else None
+        key = (marketplace, method.upper(), template if template is not None else self.template(endpoint))
+        status = "error" if status is None else str(status)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _EndpointSeries(self.buckets)
+            series.statuses[status] = series.statuses.get(status, 0) + 1
+            series.latency.observe(duration)
+            series.bytes_sent += bytes_sent
+            series.bytes_received += bytes_received
+
+    def record_authentication(self, marketplace: Optional[str]) -> None:
+        """
+        Count one call to `authenticate()`.
+        """
+        marketplace = marketplace or "unknown"
+        with self._lock:
+            self._authentications[marketplace] = self._authentications.get(marketplace, 0) + 1
+
+    def snapshot(self) -> dict:
+        """
+        Get a consistent copy of the metrics.
+
+        Returns:
+            dict: `requests` is a list with one entry per marketplace, method and endpoint template,
+                holding the call `count`, `statuses` (count per status code), `bytes_sent`,
+                `bytes_received` and `latency` (`sum`, `p50`, `p90` and `p99` in seconds, estimated
+                from the histogram). `authentications` maps marketplaces to `authenticate()` calls.
+        """
+        with self._lock:
+            requests = []
+            for (marketplace, method, endpoint), series in sorted(self._series.items()):
+                latency = series.latency
+                requests.append({
+                    "marketplace": marketplace,
+                    "method": method,
+                    "endpoint": endpoint,
+                    "count": latency.count,
+                    "statuses": dict(series.statuses),
+                    "bytes_sent": series.bytes_sent,
+                    "bytes_received": series.bytes_received,
+                    "latency": {
+                        "sum": latency.sum,
+                        "p50": latency.quantile(0.5),
+                        "p90": latency.quantile(0.9),
+                        "p99": latency.quantile(0.99),
+                    },
+                })
+            return {"requests": requests, "authentications": dict(self._authentications)}
+
+    def to_prometheus(self) -> str:
+        """
+        Render the metrics in the Prometheus text exposition format (version 0.0.4).
+
+        Returns:
+            str: The exposition, e.g. to serve on a /metrics endpoint.
+        """
+        prefix = self.namespace
+        requests_total: List[str] = []
+        duration: List[str] = []
+        sent: List[str] = []
+        received: List[str] = []
+
+        with self._lock:
+            for (marketplace, method, endpoint), series in sorted(self._series.items()):
+                labels = f'marketplace="{_escape(marketplace)}",method="{method}",endpoint="{_escape(endpoint)}"'
+                for status, count in sorted(series.statuses.items()):
+                    requests_total.append(f'{prefix}_requests_total{{{labels},status="{status}"}} {count}')
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float("inf"),), series.latency.counts):
+                    cumulative += count
+                    duration.append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="{_format_bound(bound)}"}} {cumulative}')
+                duration.append(f"{prefix}_request_duration_seconds_sum{{{labels}}} {series.latency.sum!r}")
+                duration.append(f"{prefix}_request_duration_seconds_count{{{labels}}} {series.latency.count}")
+                sent.append(f"{prefix}_request_bytes_total{{{labels}}} {series.bytes_sent}")
+                received.append(f"{prefix}_response_bytes_total{{{labels}}} {series.bytes_received}")
+            authentications = [
+                f'{prefix}_authentications_total{{marketplace="{_escape(marketplace)}"}} {count}'
+                for marketplace, count in sorted(self._authentications.items())
+            ]
+
+        lines = [
+            f"# HELP {prefix}_requests_total HTTP calls made to marketplace APIs.",
+            f"# TYPE {prefix}_requests_total counter",
+            *requests_total,
+            f"# HELP {prefix}_request_duration_seconds Latency of HTTP calls to marketplace APIs.",
+            f"# TYPE {prefix}_request_duration_seconds histogram",
+            *duration,
+            f"# HELP {prefix}_request_bytes_total Bytes sent in request bodies.",
+            f"# TYPE {prefix}_request_bytes_total counter",
+            *sent,
+            f"# HELP {prefix}_response_bytes_total Bytes received in response bodies.",
+            f"# TYPE {prefix}_response_bytes_total counter",
+            *received,
+            f"# HELP {prefix}_authentications_total Calls to authenticate() to obtain an access token.",
+            f"# TYPE {prefix}_authentications_total counter",
+            *authentications,
+        ]
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(float(bound))
@@ -0,0 +1,198 @@
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Union
+from JegBridge.utils.time_formatter import normalize_date
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS orders (
+    marketplace TEXT NOT NULL,
+    order_id TEXT NOT NULL,
+    status TEXT,
+    created_at TEXT,
+    modified_at TEXT,
+    fetched_at REAL NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (marketplace, order_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS orders_status ON orders (marketplace, status);
+CREATE INDEX IF NOT EXISTS orders_created_at ON orders (marketplace, created_at);
+CREATE INDEX IF NOT EXISTS orders_modified_at ON orders (marketplace, modified_at);
+"""
+
+
+class OrderCache:
+    """
+    Local SQLite store of raw order payloads, keyed by marketplace and order id.
+
+    Status and creation/modification dates are stored in indexed columns next to the JSON payload,
+    so cached orders can be looked up by id or filtered without decoding every payload. Dates are
+    normalized to UTC ("2025-01-15T13:45:30Z") so they compare correctly across marketplaces.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Initialize the OrderCache object.
+
+        Args:
+            path (str): Path of the SQLite database file. Defaults to ":memory:" (a process-local cache).
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            # WAL lets other processes read the cache while a bulk fill is being written
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # The format dates are stored in; also importable from JegBridge.utils.time_formatter
+    normalize_date = staticmethod(normalize_date)
+
+    def get(self, marketplace: str, order_id: str, max_age: Optional[float] = None) -> Optional[dict]:
+        """
+        Get a cached order.
+
+        Args:
+            marketplace (str): The marketplace name, e.g. "amazon".
+            order_id (str): The marketplace order id.
+            max_age (Optional[float]): Only return the order if it was stored at most this many seconds ago.
+
+        Returns:
+            Optional[dict]: The cached order payload, or None if it is missing or stale.
+        """
+        query = "SELECT payload FROM orders WHERE marketplace = ? AND order_id = ?"
+        args = [marketplace, str(order_id)]
+        if max_age is not None:
+            query += " AND fetched_at >= ?"
+            args.append(time.time() - max_age)
+        with self._lock:
+            row = self._connection.execute(query, args).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(
+        self,
+        marketplace: str,
+        order_id: str,
+        order: dict,
+        status: Optional[str] = None,
+        created_at: Optional[Union[datetime, str, int, float]] = None,
+        modified_at: Optional[Union[datetime, str, int, float]] = None,
+    ) -> None:
+        """
+        Store or replace one order.
+
+        Args:
+            marketplace (str): The marketplace name.
+            order_id (str): The marketplace order id.
+            order (dict): The raw order payload.
+            status (Optional[str]): The order status, for filtering.
+            created_at (Optional[Union[datetime, str, int, float]]): When the order was created.
+            modified_at (Optional[Union[datetime, str, int, float]]): When the order was last modified.
+        """
+        self.put_many(marketplace, [{
+            "order_id": order_id,
+            "order": order,
+            "status": status,
+            "created_at": created_at,
+            "modified_at": modified_at,
+        }])
+
+    def put_many(self, marketplace: str, rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        Store or replace many orders in a single transaction.
+
+        Args:
+            marketplace (str): The marketplace name.
+            rows (Iterable[Dict[str, Any]]): Dicts with the keyword arguments of `put` (`order_id`,
+                `order` and optionally `status`, `created_at`, `modified_at`).
+
+        Returns:
+            int: The number of orders stored.
+        """
+        fetched_at = time.time()
+        values = [
+            (
+                marketplace,
+                str(row["order_id"]),
+                row.get("status"),
+                self.normalize_date(row.get("created_at")),
+                self.normalize_date(row.get("modified_at")),
+                fetched_at,
+                json.dumps(row["order"]),
+            )
+            for row in rows
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany("INSERT OR REPLACE INTO orders VALUES (?, ?, ?, ?, ?, ?, ?)", values)
+        return len(values)
+
+    def delete(self, marketplace: str, order_id: str) -> None:
+        """
+        Remove an order from the cache if present.
+
+        Args:
+            marketplace (str): The marketplace name.
+            order_id (str): The marketplace order id.
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM orders WHERE marketplace = ? AND order_id = ?", (marketplace, str(order_id))
+            )
+
+    def query(
+        self,
+        marketplace: str,
+        status: Optional[str] = None,
+        created_after: Optional[Union[datetime, str]] = None,
+        created_before: Optional[Union[datetime, str]] = None,
+        modified_after: Optional[Union[datetime, str]] = None,
+        modified_before: Optional[Union[datetime, str]] = None,
+    ) -> list:
+        """
+        Get cached orders matching the given filters, oldest first.
+
+        Args:
+            marketplace (str): The marketplace name.
+            status (Optional[str]): Only orders with this status.
+            created_after (Optional[Union[datetime, str]]): Only orders created at or after this time.
+            created_before (Optional[Union[datetime, str]]): Only orders created before this time.
+            modified_after (Optional[Union[datetime, str]]): Only orders modified at or after this time.
+            modified_before (Optional[Union[datetime, str]]): Only orders modified before this time.
+
+        Returns:
+            list: The cached order payloads.
+        """
+        conditions = ["marketplace = ?"]
+        args = [marketplace]
+        filters = (
+            ("status = ?", status),
+            ("created_at >= ?", self.normalize_date(created_after)),
+            ("created_at < ?", self.normalize_date(created_before)),
+            ("modified_at >= ?", self.normalize_date(modified_after)),
+            ("modified_at < ?", self.normalize_date(modified_before)),
+        )
+        for condition, value in filters:
+            if value is not None:
+                conditions.append(condition)
+                args.append(value)
+
+        query = f"SELECT payload FROM orders WHERE {' AND '.join(conditions)} ORDER BY created_at"
+        with self._lock:
+            rows = self._connection.execute(query, args).fetchall()
+        return [json.loads(row[0]) for row in rows]
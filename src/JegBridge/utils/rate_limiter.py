@@ -0,0 +1,171 @@
+import re
+import time
+import threading
+from typing import Iterable, List, Mapping, Optional, Tuple
+
+RATE_LIMIT_HEADER = "x-amzn-ratelimit-limit"
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Callers reserve a token and are told how long to wait before using it. Reservations are
+    allowed to drive the balance negative, so concurrent callers queue up fairly behind each
+    other instead of all waking at the same moment and overrunning the quota.
+    """
+
+    def __init__(self, rate: float, burst: float):
+        """
+        Initialize the TokenBucket object.
+
+        Args:
+            rate (float): Tokens restored per second.
+            burst (float): Maximum number of tokens the bucket can hold.
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Take tokens from the bucket.
+
+        Args:
+            tokens (float): Number of tokens to take. Defaults to 1.
+
+        Returns:
+            float: Seconds the caller must wait before sending its request (0 if it may go now).
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def update_rate(self, rate: float) -> None:
+        """
+        Change the refill rate, e.g. after the API reported a different usage plan.
+
+        Args:
+            rate (float): New number of tokens restored per second. Non-positive values are ignored.
+        """
+        if rate <= 0:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+
+    def drain(self) -> None:
+        """
+        Empty the bucket, e.g. after the API answered 429 Too Many Requests.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, 0.0)
+
+
+class RateLimiter:
+    """
+    Per-endpoint rate limiter built from token buckets.
+
+    Each limit maps an HTTP method and endpoint pattern to its own bucket, so every operation
+    (e.g. getOrders vs getOrder) is throttled against its own usage plan. Endpoints that match
+    no pattern are not throttled.
+    """
+
+    def __init__(self, limits: Optional[Iterable[Tuple[str, str, float, float]]] = None):
+        """
+        Initialize the RateLimiter object.
+
+        Args:
+            limits (Optional[Iterable[Tuple[str, str, float, float]]]): `(method, endpoint_pattern, rate, burst)`
+                tuples. Patterns are regular expressions matched against the whole endpoint path
+                (without leading slash or query string). The first matching pattern wins.
+        """
+        self._limits: List[Tuple[str, "re.Pattern", TokenBucket]] = []
+        for method, pattern, rate, burst in limits or []:
+            self.add_limit(method, pattern, rate, burst)
+
+    def add_limit(self, method: str, pattern: str, rate: float, burst: float) -> None:
+        """
+        Register a limit for an endpoint pattern.
+
+        Args:
+            method (str): HTTP method the limit applies to.
+            pattern (str): Regular expression matched against the full endpoint path.
+            rate (float): Requests per second.
+            burst (float): Maximum burst size.
+        """
+        self._limits.append((method.upper(), re.compile(pattern), TokenBucket(rate, burst)))
+
+    def get_bucket(self, method: str, endpoint: str) -> Optional[TokenBucket]:
+        """
+        Find the bucket that governs a request.
+
+        Args:
+            method (str): HTTP method.
+            endpoint (str): Endpoint relative to the base URL.
+
+        Returns:
+            Optional[TokenBucket]: The matching bucket, or None if the endpoint is not limited.
+        """
+        method = method.upper()
+        path = endpoint.split("?", 1)[0].strip("/")
+        for limit_method, pattern, bucket in self._limits:
+            if limit_method == method and pattern.fullmatch(path):
+                return bucket
+        return None
+
+    def reserve(self, method: str, endpoint: str) -> float:
+        """
+        Reserve a request slot without blocking.
+
+        Returns:
+            float: Seconds to wait before sending the request.
+        """
+        bucket = self.get_bucket(method, endpoint)
+        return bucket.reserve() if bucket is not None else 0.0
+
+    def acquire(self, method: str, endpoint: str) -> None:
+        """
+        Block the calling thread until the request may be sent.
+        """
+        delay = self.reserve(method, endpoint)
+        if delay > 0:
+            time.sleep(delay)
+
+    def update_from_headers(self, method: str, endpoint: str, headers: Mapping[str, str]) -> None:
+        """
+        Adjust the endpoint's rate from the `x-amzn-RateLimit-Limit` response header.
+
+        Args:
+            method (str): HTTP method of the request.
+            endpoint (str): Endpoint of the request.
+            headers (Mapping[str, str]): Response headers.
+        """
+        bucket = self.get_bucket(method, endpoint)
+        if bucket is None:
+            return
+        value = next((v for k, v in headers.items() if k.lower() == RATE_LIMIT_HEADER), None)
+        if value is None:
+            return
+        try:
+            bucket.update_rate(float(value))
+        except ValueError:
+            pass
+
+    def on_throttled(self, method: str, endpoint: str) -> None:
+        """
+        Record that the API rejected a request with 429, so queued callers back off.
+        """
+        bucket = self.get_bucket(method, endpoint)
+        if bucket is not None:
+            bucket.drain()
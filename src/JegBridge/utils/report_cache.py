@@ -0,0 +1,227 @@
+import mmap
+import os
+import re
+import shutil
+import threading
+from array import array
+from typing import BinaryIO, List, Optional, Union
+
+
+class ReportDocument:
+    """
+    Read-only, memory-mapped view of a cached tab-separated report document.
+
+    The offsets of every line are indexed on first access (and saved next to the document), so
+    any row or slice of rows can be read without parsing the lines before it. The saved index
+    starts with the size of the document it was built for and is ignored if the size differs,
+    so touching the document (as `ReportCache` does to track recency) keeps it valid.
+    """
+
+    def __init__(self, path: str, encoding: str = "iso-8859-1"):
+        """
+        Initialize the ReportDocument object.
+
+        Args:
+            path (str): Path of the decompressed document.
+            encoding (str): Text encoding of the document. Defaults to "iso-8859-1".
+        """
+        self.path = path
+        self.index_path = f"{path}.idx"
+        self.encoding = encoding
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        # mmap cannot map an empty file
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self._offsets: Optional[array] = None
+
+    def close(self) -> None:
+        """
+        Unmap and close the document.
+        """
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def offsets(self) -> array:
+        """
+        Start offset of every line, plus the end of the document.
+        """
+        if self._offsets is None:
+            self._offsets = self._load_index() or self._build_index()
+        return self._offsets
+
+    def _load_index(self) -> Optional[array]:
+        try:
+            saved = array("Q")
+            with open(self.index_path, "rb") as index_file:
+                saved.frombytes(index_file.read())
+        except (FileNotFoundError, ValueError):
+            return None
+        # First entry: size of the document the index was built for
+        if len(saved) < 2 or saved[0] != len(self._data):
+            return None
+        return saved[1:]
+
+    def _build_index(self) -> array:
+        data = self._data
+        offsets = array("Q", [0])
+        position = data.find(b"\n")
+        while position != -1:
+            offsets.append(position + 1)
+            position = data.find(b"\n", position + 1)
+        if offsets[-1] != len(data):
+            # Last line has no trailing newline
+            offsets.append(len(data))
+        try:
+            tmp_path = f"{self.index_path}.tmp"
+            with open(tmp_path, "wb") as index_file:
+                array("Q", [len(data)]).tofile(index_file)
+                offsets.tofile(index_file)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            pass  # The index is only an optimization; keep the in-memory copy
+        return offsets
+
+    def __len__(self) -> int:
+        """
+        Number of lines, including the header.
+        """
+        return len(self.offsets) - 1
+
+    def line(self, position: int) -> bytes:
+        """
+        Get one raw line without its line ending.
+        """
+        offsets = self.offsets
+        if position < 0:
+            position += len(offsets) - 1
+        if not 0 <= position < len(offsets) - 1:
+            raise IndexError("report line out of range")
+        return self._data[offsets[position]:offsets[position + 1]].rstrip(b"\r\n")
+
+    def row(self, position: int) -> List[str]:
+        """
+        Get one line split into its tab-separated fields.
+        """
+        return self.line(position).decode(self.encoding).split("\t")
+
+    @property
+    def header(self) -> List[str]:
+        return self.row(0) if len(self) else []
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[List[str], List[List[str]]]:
+        if isinstance(key, slice):
+            return [self.row(position) for position in range(*key.indices(len(self)))]
+        return self.row(key)
+
+
+class ReportCache:
+    """
+    Local directory of decompressed report documents keyed by reportDocumentId.
+
+    Total size is bounded: when a new document pushes the cache over `max_bytes`, the least
+    recently used documents are deleted. Recency is the file modification time, which is
+    refreshed on every access, so it survives restarts.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 2 * 1024 ** 3):
+        """
+        Initialize the ReportCache object.
+
+        Args:
+            directory (str): Where documents are stored. Created if missing.
+            max_bytes (int): Maximum total size of cached documents and their indexes. Defaults to 2 GiB.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def path_for(self, report_document_id: str) -> str:
+        """
+        Get the file path a document is cached at.
+        """
+        safe_id = re.sub(r"[^A-Za-z0-9._-]", "_", report_document_id)
+        return os.path.join(self.directory, f"{safe_id}.tsv")
+
+    def __contains__(self, report_document_id: str) -> bool:
+        return os.path.exists(self.path_for(report_document_id))
+
+    def store(self, report_document_id: str, stream: BinaryIO) -> str:
+        """
+        Copy a decompressed document into the cache, then evict old documents if needed.
+
+        Args:
+            report_document_id (str): The reportDocumentId.
+            stream (BinaryIO): Readable binary stream of the decompressed document.
+
+        Returns:
+            str: Path of the cached document.
+        """
+        path = self.path_for(report_document_id)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as document_file:
+            shutil.copyfileobj(stream, document_file, 1024 * 1024)
+        os.replace(tmp_path, path)
+        # A stale index from an earlier copy of the document must not be reused
+        try:
+            os.remove(f"{path}.idx")
+        except FileNotFoundError:
+            pass
+        self.evict(keep=path)
+        return path
+
+    def open(self, report_document_id: str, encoding: str = "iso-8859-1") -> Optional[ReportDocument]:
+        """
+        Open a cached document and mark it as recently used.
+
+        Args:
+            report_document_id (str): The reportDocumentId.
+            encoding (str): Text encoding of the document. Defaults to "iso-8859-1".
+
+        Returns:
+            Optional[ReportDocument]: The memory-mapped document, or None if it is not cached.
+        """
+        path = self.path_for(report_document_id)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return ReportDocument(path, encoding=encoding)
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        """
+        Delete least recently used documents until the cache fits in `max_bytes`.
+
+        Args:
+            keep (Optional[str]): Path of a document that must not be evicted (e.g. the one just stored).
+        """
+        with self._lock:
+            entries = []
+            total = 0
+            for entry in os.scandir(self.directory):
+                if not entry.name.endswith(".tsv"):
+                    continue
+                index_path = f"{entry.path}.idx"
+                size = entry.stat().st_size + (os.path.getsize(index_path) if os.path.exists(index_path) else 0)
+                entries.append((entry.stat().st_mtime, entry.path, size))
+                total += size
+
+            for _, path, size in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                if path == keep:
+                    continue
+                for stale_path in (path, f"{path}.idx"):
+                    try:
+                        os.remove(stale_path)
+                    except FileNotFoundError:
+                        pass
+                total -= size
@@ -0,0 +1,178 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Collection, Dict, Mapping, Optional
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class RetryStats:
+    """
+    Thread-safe counters describing how much work and time is lost to retries.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Reset all counters to zero.
+        """
+        with self._lock:
+            self.retries = 0
+            self.retry_sleep_seconds = 0.0
+            self.token_refreshes = 0
+            self.giveups = 0
+            self.retries_by_reason: Dict[str, int] = {}
+
+    def record_retry(self, reason: str, delay: float) -> None:
+        with self._lock:
+            self.retries += 1
+            self.retry_sleep_seconds += delay
+            self.retries_by_reason[reason] = self.retries_by_reason.get(reason, 0) + 1
+
+    def record_giveup(self) -> None:
+        with self._lock:
+            self.giveups += 1
+
+    def record_token_refresh(self) -> None:
+        with self._lock:
+            self.token_refreshes += 1
+
+    def snapshot(self) -> dict:
+        """
+        Get a consistent copy of the counters.
+
+        Returns:
+            dict: Counters keyed by name; `retries_by_reason` maps status codes or error names to counts.
+        """
+        with self._lock:
+            return {
+                "retries": self.retries,
+                "retry_sleep_seconds": self.retry_sleep_seconds,
+                "token_refreshes": self.token_refreshes,
+                "giveups": self.giveups,
+                "retries_by_reason": dict(self.retries_by_reason),
+            }
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter for transient HTTP failures.
+
+    Only idempotent methods are retried by default. A `Retry-After` header (seconds or HTTP date)
+    takes precedence over the computed backoff, and the total time slept for a single request is
+    capped by `max_retry_time` so a struggling API cannot stall a job indefinitely.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30,
+        max_retry_time: float = 60,
+        jitter: bool = True,
+        retry_statuses: Collection[int] = RETRY_STATUSES,
+        retry_methods: Collection[str] = IDEMPOTENT_METHODS,
+        respect_retry_after: bool = True,
+    ):
+        """
+        Initialize the RetryPolicy object.
+
+        Args:
+            max_retries (int): Maximum number of retries per request. 0 disables retries. Defaults to 3.
+            backoff_factor (float): Base delay in seconds; attempt n waits up to `backoff_factor * 2**n`.
+            max_backoff (float): Upper bound for a single computed backoff in seconds. Defaults to 30.
+            max_retry_time (float): Maximum total seconds spent sleeping between retries of one request.
+            jitter (bool): Whether to randomize each backoff between 0 and its computed value. Defaults to True.
+            retry_statuses (Collection[int]): Status codes that trigger a retry. Defaults to 429, 500, 502, 503, 504.
+            retry_methods (Collection[str]): HTTP methods that may be retried. Defaults to idempotent methods.
+            respect_retry_after (bool): Whether to honor the `Retry-After` response header. Defaults to True.
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_retry_time = max_retry_time
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(method.upper() for method in retry_methods)
+        self.respect_retry_after = respect_retry_after
+        self.stats = RetryStats()
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """
+        Parse a `Retry-After` header value.
+
+        Args:
+            value (Optional[str]): Either a number of seconds or an HTTP date.
+
+        Returns:
+            Optional[float]: Seconds to wait, or None if the value is missing or invalid.
+        """
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def compute_backoff(self, attempt: int) -> float:
+        """
+        Compute the backoff before retry number `attempt` (starting at 0).
+        """
+        backoff = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+    def get_retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        elapsed: float,
+        status_code: Optional[int] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        error: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """
+        Decide whether a request should be retried and how long to wait first.
+
+        Args:
+            method (str): HTTP method of the request.
+            attempt (int): Number of retries already made for this request.
+            elapsed (float): Seconds already spent sleeping between retries of this request.
+            status_code (Optional[int]): Response status code, if a response was received.
+            headers (Optional[Mapping[str, str]]): Response headers, if a response was received.
+            error (Optional[Exception]): Transport error, if no response was received.
+
+        Returns:
+            Optional[float]: Seconds to sleep before retrying, or None if the request should not be retried.
+        """
+        if error is not None:
+            reason = type(error).__name__
+        elif status_code in self.retry_statuses:
+            reason = str(status_code)
+        else:
+            return None
+
+        if method.upper() not in self.retry_methods:
+            return None
+
+        delay = self.compute_backoff(attempt)
+        if self.respect_retry_after and headers is not None:
+            retry_after = self.parse_retry_after(headers.get("Retry-After"))
+            if retry_after is not None:
+                delay = retry_after
+
+        if attempt >= self.max_retries or elapsed + delay > self.max_retry_time:
+            self.stats.record_giveup()
+            return None
+
+        self.stats.record_retry(reason, delay)
+        return delay
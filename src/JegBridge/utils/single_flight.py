@@ -0,0 +1,76 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Call:
+    """
+    One in-flight call and its outcome.
+    """
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Thread-safe duplicate call suppression.
+
+    While a call for a key is running, other callers with the same key wait for it and share
+    its result (or its exception) instead of running the call again. Once the call has finished,
+    the next caller for that key starts a fresh one; results are never cached.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        # Number of callers that were given another caller's result instead of running their own call.
+        self.shared_calls = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run `fn`, unless a call with the same key is already running, in which case wait for its outcome.
+
+        Args:
+            key (Hashable): Identifies calls that are interchangeable.
+            fn (Callable[[], Any]): The call to run.
+
+        Returns:
+            Tuple[Any, bool]: The result, and whether it came from another caller's call.
+
+        Raises:
+            Exception: Whatever `fn` raised, in the caller that ran it and in every caller sharing it.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared_calls += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def in_flight(self) -> int:
+        """
+        Number of keys with a call currently running.
+        """
+        with self._lock:
+            return len(self._calls)
@@ -1,4 +1,38 @@
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Optional, Union
+
+# Sortable UTC format shared by the order cache and the Order model, e.g. "2025-01-15T13:45:30Z".
+NORMALIZED_DATE_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def normalize_date(value: Optional[Union[datetime, str, int, float]]) -> Optional[str]:
+    """
+    Convert a marketplace timestamp to a sortable UTC string.
+
+    Args:
+        value (Optional[Union[datetime, str, int, float]]): A datetime, an ISO 8601 string,
+            or epoch milliseconds (as used by Walmart).
+
+    Returns:
+        Optional[str]: The normalized timestamp, the original string if it could not be parsed,
+            or None if no value was given.
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        value = datetime.fromtimestamp(value / 1000, tz=timezone.utc)
+    elif isinstance(value, str):
+        text = value.replace(" ", "T", 1)
+        if text.endswith("Z"):
+            text = text[:-1] + "+00:00"
+        try:
+            value = datetime.fromisoformat(text)
+        except ValueError:
+            return value
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).strftime(NORMALIZED_DATE_FORMAT)
+
 
 class TimeFormatter:
     """
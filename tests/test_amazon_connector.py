@@ -1,5 +1,13 @@
+import gzip
+import io
+import os
+import pytest
+from datetime import datetime, timezone, timedelta
 from unittest.mock import MagicMock
 from JegBridge.connectors.amazon_connector import AmazonConnector
+from JegBridge.mixins.amazon_report_scheduler import ReportRequest
+from JegBridge.utils.checkpoint_store import PaginationCheckpoint
+from JegBridge.utils.report_cache import ReportCache
 
 
 def make_connector():
@@ -50,6 +58,217 @@ def test_get_orders_calls_correct_endpoint():
     assert call_kwargs[1]["endpoint"] == "orders/v0/orders"
 
 
+def test_get_orders_follows_next_token():
+    connector, mock_auth = make_connector()
+    mock_auth.make_request.return_value.json.side_effect = [
+        {"payload": {"Orders": [{"AmazonOrderId": "111"}], "NextToken": "page-2"}},
+        {"payload": {"Orders": [{"AmazonOrderId": "222"}]}},
+    ]
+    orders = connector.get_orders()
+    assert [order["AmazonOrderId"] for order in orders] == ["111", "222"]
+    second_call_params = mock_auth.make_request.call_args_list[1][1]["params"]
+    assert second_call_params["NextToken"] == "page-2"
+    assert "CreatedAfter" not in second_call_params
+
+
+def test_get_orders_resumes_from_checkpoint(tmp_path):
+    connector, mock_auth = make_connector()
+    checkpoint = PaginationCheckpoint(str(tmp_path / "amazon.json"))
+    mock_auth.make_request.return_value.json.side_effect = [
+        {"payload": {"Orders": [{"AmazonOrderId": "111"}], "NextToken": "page-2"}},
+        {"error": "QuotaExceeded"},
+    ]
+    try:
+        connector.get_orders(checkpoint=checkpoint)
+        assert False, "Expected KeyError"
+    except KeyError:
+        pass
+
+    mock_auth.make_request.reset_mock()
+    mock_auth.make_request.return_value.json.side_effect = [{"payload": {"Orders": [{"AmazonOrderId": "222"}]}}]
+    orders = connector.get_orders(checkpoint=checkpoint)
+    assert [order["AmazonOrderId"] for order in orders] == ["111", "222"]
+    assert mock_auth.make_request.call_count == 1
+    assert mock_auth.make_request.call_args[1]["params"]["NextToken"] == "page-2"
+
+
+def test_iter_orders_saves_page_only_after_it_is_consumed(tmp_path):
+    connector, mock_auth = make_connector()
+    checkpoint = PaginationCheckpoint(str(tmp_path / "amazon.json"))
+    mock_auth.make_request.return_value.json.side_effect = [
+        {"payload": {"Orders": [{"AmazonOrderId": "111"}, {"AmazonOrderId": "112"}], "NextToken": "page-2"}},
+    ]
+    orders = connector.iter_orders(checkpoint=checkpoint)
+    next(orders)
+    orders.close()
+    assert not os.path.exists(checkpoint.path)
+
+
+def test_get_orders_defaults_to_unshipped_last_7_days():
+    connector, mock_auth = make_connector()
+    mock_auth.make_request.return_value.json.return_value = {"payload": {"Orders": []}}
+    connector.get_orders()
+    params = mock_auth.make_request.call_args[1]["params"]
+    assert params["OrderStatuses"] == "Unshipped"
+    assert "CreatedAfter" in params
+
+
+# --- iter_orders ---
+
+def test_iter_orders_passes_filters():
+    connector, mock_auth = make_connector()
+    mock_auth.make_request.return_value.json.return_value = {"payload": {"Orders": []}}
+    list(connector.iter_orders(
+        created_after=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        created_before="2025-01-31T00:00:00Z",
+        order_statuses=["Unshipped", "PartiallyShipped"],
+        marketplace_ids=["ATVPDKIKX0DER"],
+    ))
+    params = mock_auth.make_request.call_args[1]["params"]
+    assert params["CreatedAfter"] == "2025-01-01T00:00:00Z"
+    assert params["CreatedBefore"] == "2025-01-31T00:00:00Z"
+    assert params["OrderStatuses"] == "Unshipped,PartiallyShipped"
+    assert params["MarketplaceIds"] == "ATVPDKIKX0DER"
+
+
+def test_iter_orders_is_lazy():
+    connector, mock_auth = make_connector()
+    mock_auth.make_request.return_value.json.side_effect = [
+        {"payload": {"Orders": [{"AmazonOrderId": "111"}], "NextToken": "page-2"}},
+        {"payload": {"Orders": [{"AmazonOrderId": "222"}]}},
+    ]
+    orders = connector.iter_orders()
+    assert next(orders)["AmazonOrderId"] == "111"
+    assert mock_auth.make_request.call_count == 1
+
+
+def test_iter_orders_with_last_updated_after_omits_created_after():
+    connector, mock_auth = make_connector()
+    mock_auth.make_request.return_value.json.return_value = {"payload": {"Orders": []}}
+    list(connector.iter_orders(last_updated_after="2025-01-01T00:00:00Z"))
+    params = mock_auth.make_request.call_args[1]["params"]
+    assert params["LastUpdatedAfter"] == "2025-01-01T00:00:00Z"
+    assert "CreatedAfter" not in params
+
+
+# --- backfill_orders ---
+
+def make_backfill_response(orders, next_token=None):
+    """Helper to build a mock getOrders page response."""
+    response = MagicMock()
+    payload = {"Orders": orders}
+    if next_token:
+        payload["NextToken"] = next_token
+    response.json.return_value = {"payload": payload}
+    return response
+
+
+def test_backfill_orders_fetches_every_window():
+    connector, mock_auth = make_connector()
+
+    def fake_request(method, endpoint, params):
+        return make_backfill_response([{"AmazonOrderId": params["CreatedAfter"]}])
+
+    mock_auth.make_request.side_effect = fake_request
+    orders = list(connector.backfill_orders(
+        created_after=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        created_before=datetime(2025, 1, 29, tzinfo=timezone.utc),
+    ))
+    assert sorted(order["AmazonOrderId"] for order in orders) == [
+        "2025-01-01T00:00:00Z", "2025-01-08T00:00:00Z", "2025-01-15T00:00:00Z", "2025-01-22T00:00:00Z",
+    ]
+
+
+def test_backfill_orders_splits_dense_windows_without_duplicates():
+    connector, mock_auth = make_connector()
+
+    def fake_request(method, endpoint, params):
+        if params["CreatedAfter"] == "2025-01-01T00:00:00Z":
+            orders = [{"AmazonOrderId": "early", "PurchaseDate": "2025-01-01T06:00:00Z"}]
+            return make_backfill_response(orders, next_token="more")
+        if params["CreatedAfter"] == "2025-01-01T06:00:00Z":
+            return make_backfill_response([{"AmazonOrderId": "early", "PurchaseDate": "2025-01-01T06:00:00Z"}])
+        return make_backfill_response([{"AmazonOrderId": "late"}])
+
+    mock_auth.make_request.side_effect = fake_request
+    orders = list(connector.backfill_orders(
+        created_after=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        created_before=datetime(2025, 1, 3, tzinfo=timezone.utc),
+        window=timedelta(days=7),
+        min_window=timedelta(hours=12),
+    ))
+    assert sorted(order["AmazonOrderId"] for order in orders) == ["early", "late"]
+    # The dense window's first page is kept; only the part after its last order is split and fetched
+    windows = sorted((call[1]["params"]["CreatedAfter"], call[1]["params"]["CreatedBefore"])
+                     for call in mock_auth.make_request.call_args_list)
+    assert windows == [
+        ("2025-01-01T00:00:00Z", "2025-01-03T00:00:00Z"),
+        ("2025-01-01T06:00:00Z", "2025-01-02T03:00:00Z"),
+        ("2025-01-02T03:00:00Z", "2025-01-03T00:00:00Z"),
+    ]
+
+
+def test_backfill_orders_follows_next_token_when_page_is_unordered():
+    connector, mock_auth = make_connector()
+
+    def fake_request(method, endpoint, params):
+        if "NextToken" in params:
+            return make_backfill_response([{"AmazonOrderId": "222"}])
+        return make_backfill_response([{"AmazonOrderId": "111"}], next_token="more")
+
+    mock_auth.make_request.side_effect = fake_request
+    orders = list(connector.backfill_orders(
+        created_after=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        created_before=datetime(2025, 1, 3, tzinfo=timezone.utc),
+        min_window=timedelta(hours=6),
+    ))
+    assert sorted(order["AmazonOrderId"] for order in orders) == ["111", "222"]
+    assert mock_auth.make_request.call_count == 2
+
+
+def test_backfill_orders_accepts_naive_datetimes():
+    connector, mock_auth = make_connector()
+    mock_auth.make_request.return_value = make_backfill_response([{"AmazonOrderId": "111"}])
+    created_after = datetime.now() - timedelta(days=1)
+    orders = list(connector.backfill_orders(created_after=created_after.replace(tzinfo=None)))
+    assert [order["AmazonOrderId"] for order in orders] == ["111"]
+
+
+def test_backfill_orders_follows_next_token_in_small_windows():
+    connector, mock_auth = make_connector()
+
+    def fake_request(method, endpoint, params):
+        if "NextToken" in params:
+            return make_backfill_response([{"AmazonOrderId": "222"}])
+        return make_backfill_response([{"AmazonOrderId": "111"}], next_token="more")
+
+    mock_auth.make_request.side_effect = fake_request
+    orders = list(connector.backfill_orders(
+        created_after=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        created_before=datetime(2025, 1, 1, 12, tzinfo=timezone.utc),
+    ))
+    assert sorted(order["AmazonOrderId"] for order in orders) == ["111", "222"]
+
+
+# --- get_orders_by_ids ---
+
+def test_get_orders_by_ids_batches_50_ids_per_request():
+    connector, mock_auth = make_connector()
+
+    def fake_request(method, endpoint, params):
+        response = MagicMock()
+        ids = params["AmazonOrderIds"].split(",")
+        response.json.return_value = {"payload": {"Orders": [{"AmazonOrderId": i} for i in ids if i != "7"]}}
+        return response
+
+    mock_auth.make_request.side_effect = fake_request
+    lookup = connector.get_orders_by_ids([str(i) for i in range(120)] + ["1"])
+    assert list(lookup.found) == [str(i) for i in range(120) if i != 7]
+    assert lookup.missing == ["7"]
+    batch_sizes = sorted(len(call[1]["params"]["AmazonOrderIds"].split(",")) for call in mock_auth.make_request.call_args_list)
+    assert batch_sizes == [20, 50, 50]
+
+
 # --- get_order ---
 
 def test_get_order_calls_correct_endpoint():
@@ -105,6 +324,35 @@ def test_get_listing_returns_response():
     assert response is not None
 
 
+def test_get_listings_searches_20_skus_per_request():
+    connector, mock_auth = make_connector()
+
+    def fake_request(method, endpoint, params):
+        response = MagicMock()
+        skus = params["identifiers"].split(",")
+        response.json.return_value = {"numberOfResults": len(skus), "items": [{"sku": sku} for sku in skus]}
+        return response
+
+    mock_auth.make_request.side_effect = fake_request
+    skus = [f"SKU-{i}" for i in range(45)]
+    listings = list(connector.get_listings(skus, max_workers=3))
+    assert sorted(listing["sku"] for listing in listings) == sorted(skus)
+    assert mock_auth.make_request.call_count == 3
+    call_kwargs = mock_auth.make_request.call_args
+    assert call_kwargs[1]["endpoint"] == "/listings/2021-08-01/items/TEST_SELLER_ID"
+    assert call_kwargs[1]["params"]["identifiersType"] == "SKU"
+
+
+def test_get_listings_raises_on_bad_response():
+    connector, mock_auth = make_connector()
+    mock_auth.make_request.return_value.json.return_value = {"errors": [{"code": "InvalidInput"}]}
+    try:
+        list(connector.get_listings(["SKU-1"]))
+        assert False, "Expected KeyError"
+    except KeyError:
+        pass
+
+
 # --- create_report (from AmazonReportHandler mixin) ---
 
 def test_create_report_calls_correct_endpoint():
@@ -137,3 +385,144 @@ def test_get_doc_url_calls_correct_endpoint():
     connector.get_doc_url("doc456")
     call_kwargs = mock_auth.make_request.call_args
     assert "doc456" in call_kwargs[0][1]
+
+
+# --- stream_report_rows (from AmazonReportHandler mixin) ---
+
+REPORT_TSV = "order-id\tsku\treason\n111\tSKU-1\tDEFECTIVE\n222\tSKU-\"2\"\tCaf\xe9 stain\n"
+
+
+def make_report_connector(compression=None):
+    """Helper to serve REPORT_TSV as a report document, optionally gzipped."""
+    connector, mock_auth = make_connector()
+    body = REPORT_TSV.encode("iso-8859-1")
+    document = {"reportDocumentId": "doc456", "url": "https://s3.example.com/doc456"}
+    if compression:
+        body = gzip.compress(body)
+        document["compressionAlgorithm"] = compression
+    mock_auth.make_request.return_value.json.return_value = document
+    mock_auth.session.get.return_value.raw = io.BytesIO(body)
+    return connector, mock_auth
+
+
+def test_stream_report_rows_yields_dicts():
+    connector, mock_auth = make_report_connector()
+    rows = list(connector.stream_report_rows("doc456"))
+    assert rows == [
+        {"order-id": "111", "sku": "SKU-1", "reason": "DEFECTIVE"},
+        {"order-id": "222", "sku": 'SKU-"2"', "reason": "Caf\xe9 stain"},
+    ]
+    mock_auth.session.get.assert_called_once_with("https://s3.example.com/doc456", stream=True, timeout=60)
+    assert mock_auth.session.get.return_value.close.called
+
+
+def test_stream_report_rows_gunzips_documents():
+    connector, _ = make_report_connector(compression="GZIP")
+    rows = list(connector.stream_report_rows("doc456", as_dicts=False))
+    assert rows[0] == ["order-id", "sku", "reason"]
+    assert len(rows) == 3
+
+
+def test_parse_returns_from_report_document():
+    connector, mock_auth = make_connector()
+    body = "Order ID\tMerchant SKU\tReturn quantity\tReturn reason\n111\tSKU-1\t2\tDEFECTIVE\n"
+    mock_auth.make_request.return_value.json.return_value = {"url": "https://s3.example.com/doc456"}
+    mock_auth.session.get.return_value.raw = io.BytesIO(body.encode("iso-8859-1"))
+    returns = connector.parse_returns("doc456")
+    assert len(returns) == 1
+    assert returns.row(0)["sku"] == "SKU-1"
+    assert returns.row(0)["return_quantity"] == 2
+
+
+def test_stream_report_rows_raises_on_bad_response():
+    connector, mock_auth = make_connector()
+    mock_auth.make_request.return_value.json.return_value = {"errors": []}
+    try:
+        list(connector.stream_report_rows("doc456"))
+        assert False, "Expected KeyError"
+    except KeyError:
+        pass
+
+
+# --- run_reports (from AmazonReportScheduler mixin) ---
+
+def make_scheduler_connector(statuses):
+    """Helper to serve createReport/getReport/getReportDocument calls; `statuses` maps report ids to status sequences."""
+    connector, mock_auth = make_connector()
+    created = iter(statuses)
+
+    def fake_request(method, endpoint, data=None):
+        response = MagicMock()
+        if method == "POST":
+            response.json.return_value = {"reportId": next(created)}
+        elif "/documents/" in endpoint:
+            response.json.return_value = {"url": f"https://s3.example.com/{endpoint.rsplit('/', 1)[1]}"}
+        else:
+            report_id = endpoint.rsplit("/", 1)[1]
+            status = statuses[report_id].pop(0)
+            response.json.return_value = {"processingStatus": status, "reportDocumentId": f"doc-{report_id}"}
+        return response
+
+    def fake_download(url, stream, timeout):
+        response = MagicMock()
+        response.raw = io.BytesIO(f"report\n{url.rsplit('/', 1)[1]}\n".encode())
+        return response
+
+    mock_auth.make_request.side_effect = fake_request
+    mock_auth.session.get.side_effect = fake_download
+    return connector, mock_auth
+
+
+def test_run_reports_polls_until_done_and_downloads():
+    connector, _ = make_scheduler_connector({
+        "r1": ["IN_QUEUE", "IN_PROGRESS", "DONE"],
+        "r2": ["DONE"],
+        "r3": ["IN_PROGRESS", "FATAL"],
+    })
+    report_requests = [ReportRequest("GET_FLAT_FILE_RETURNS_DATA_BY_RETURN_DATE") for _ in range(3)]
+    results = {result.report_id: result for result in connector.run_reports(report_requests, poll_interval=0.01)}
+    assert list(results["r1"].rows) == [{"report": "doc-r1"}]
+    assert list(results["r2"].rows) == [{"report": "doc-r2"}]
+    assert results["r3"].processing_status == "FATAL"
+    assert results["r3"].rows is None
+
+
+def test_run_reports_opens_streamed_downloads_before_yielding():
+    connector, mock_auth = make_scheduler_connector({"r1": ["DONE"]})
+    [result] = connector.run_reports([ReportRequest("GET_MERCHANT_LISTINGS_ALL_DATA")], poll_interval=0.01)
+    assert mock_auth.session.get.call_count == 1
+    assert list(result.rows) == [{"report": "doc-r1"}]
+
+
+def test_run_reports_reports_failed_downloads_per_report():
+    connector, mock_auth = make_scheduler_connector({"r1": ["DONE"]})
+    mock_auth.session.get.side_effect = ConnectionError("connection reset")
+    [result] = connector.run_reports([ReportRequest("GET_MERCHANT_LISTINGS_ALL_DATA")], poll_interval=0.01)
+    assert isinstance(result.error, ConnectionError)
+    assert result.rows is None
+
+
+def test_run_reports_downloads_lists_or_cached_documents(tmp_path):
+    connector, _ = make_scheduler_connector({"r1": ["DONE"], "r2": ["DONE"]})
+    request = ReportRequest("GET_MERCHANT_LISTINGS_ALL_DATA")
+    [result] = connector.run_reports([request], download="list", poll_interval=0.01)
+    assert result.rows == [{"report": "doc-r1"}]
+
+    [result] = connector.run_reports([request], download="document", cache=ReportCache(str(tmp_path)), poll_interval=0.01)
+    with result.document as document:
+        assert document.header == ["report"]
+        assert document[1] == ["doc-r2"]
+
+
+def test_run_reports_document_mode_requires_cache():
+    connector, _ = make_scheduler_connector({})
+    with pytest.raises(ValueError):
+        list(connector.run_reports([], download="document"))
+
+
+def test_run_reports_reports_errors_per_report():
+    connector, _ = make_scheduler_connector({"r1": ["IN_QUEUE"] * 50})
+    results = list(connector.run_reports([ReportRequest("GET_MERCHANT_LISTINGS_ALL_DATA")],
+                                         poll_interval=0.01, max_poll_interval=0.01, timeout=0.1))
+    assert len(results) == 1
+    assert isinstance(results[0].error, TimeoutError)
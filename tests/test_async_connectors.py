@@ -0,0 +1,232 @@
+import asyncio
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from JegBridge.auth.amazon_auth import AmazonAuth
+from JegBridge.auth.async_base_auth import AsyncBaseAuth
+from JegBridge.auth.backmarket_auth import BackmarketAuth
+from JegBridge.auth.ebay_auth import EbayAuth
+from JegBridge.auth.walmartmp_auth import WalmartMPAuth
+from JegBridge.connectors.async_amazon_connector import AsyncAmazonConnector
+from JegBridge.connectors.async_backmarket_connector import AsyncBackmarketConnector
+from JegBridge.connectors.async_ebay_connector import AsyncEbayConnector
+from JegBridge.connectors.async_walmartmp_connector import AsyncWalmartMPConnector
+from JegBridge.utils.metrics import MetricsRegistry
+
+
+def make_app(calls):
+    """Helper to build a fake marketplace API that records every request it receives."""
+
+    async def token(request):
+        calls.append(("token", None))
+        return web.json_response({"access_token": "walmart-token", "expires_in": 900})
+
+    async def walmart_order(request):
+        calls.append((request.path, request.headers.get("WM_SEC.ACCESS_TOKEN")))
+        return web.json_response({"order": {"purchaseOrderId": request.match_info["order_id"]}})
+
+    async def walmart_orders(request):
+        calls.append((request.path, dict(request.query)))
+        return web.json_response({
+            "list": {"meta": {}, "elements": {"order": [{"purchaseOrderId": "111"}]}}
+        })
+
+    async def backmarket_order(request):
+        calls.append((request.path, request.headers.get("Authorization")))
+        return web.json_response({"order_id": int(request.match_info["order_id"])})
+
+    async def backmarket_orders(request):
+        calls.append((request.path, dict(request.query)))
+        if request.query.get("page") == "2":
+            return web.json_response({"results": [{"order_id": 3}], "next": None})
+        return web.json_response({
+            "results": [{"order_id": 1}, {"order_id": 2}],
+            "next": str(request.url.with_query({"page": "2", "page-size": "50"})),
+        })
+
+    app = web.Application()
+    app.router.add_post("/v3/token", token)
+    app.router.add_get("/v3/orders", walmart_orders)
+    app.router.add_get("/v3/orders/{order_id}", walmart_order)
+    app.router.add_get("/ws/orders", backmarket_orders)
+    app.router.add_get("/ws/orders/{order_id}", backmarket_order)
+    return app
+
+
+def make_paginated_app(calls):
+    """Helper to build a fake marketplace API whose order lists span many pages."""
+
+    async def walmart_orders(request):
+        calls.append((request.path, dict(request.query)))
+        page = int(request.query.get("cursor", "0"))
+        meta = {"nextCursor": f"?cursor={page + 1}&limit=100"} if page < 6 else {}
+        orders = [{"purchaseOrderId": f"{page}-{n}"} for n in range(100)]
+        return web.json_response({"list": {"meta": meta, "elements": {"order": orders}}})
+
+    async def backmarket_orders(request):
+        calls.append((request.path, dict(request.query)))
+        page = int(request.query.get("page", "1"))
+        results = [{"order_id": (page - 1) * 50 + n} for n in range(50 if page < 5 else 20)]
+        return web.json_response({"count": 220, "results": results, "next": None})
+
+    async def token(request):
+        return web.json_response({"access_token": "token", "expires_in": 900})
+
+    async def ebay_orders(request):
+        calls.append((request.path, dict(request.query)))
+        offset, limit = int(request.query["offset"]), int(request.query["limit"])
+        orders = [{"orderId": str(n)} for n in range(offset, min(offset + limit, 450))]
+        return web.json_response({"orders": orders, "total": 450})
+
+    async def amazon_orders(request):
+        calls.append((request.path, dict(request.query)))
+        page = int(request.query.get("NextToken", "0"))
+        payload = {"Orders": [{"AmazonOrderId": f"{page}-{n}"} for n in range(100)]}
+        if page < 2:
+            payload["NextToken"] = str(page + 1)
+        return web.json_response({"payload": payload})
+
+    app = web.Application()
+    app.router.add_post("/v3/token", token)
+    app.router.add_get("/v3/orders", walmart_orders)
+    app.router.add_get("/ws/orders", backmarket_orders)
+    app.router.add_post("/identity/v1/oauth2/token", token)
+    app.router.add_get("/sell/fulfillment/v1/order", ebay_orders)
+    app.router.add_get("/orders/v0/orders", amazon_orders)
+    return app
+
+
+def run_against_fake_server(scenario, app_factory=make_app):
+    """Run `scenario(base_url, calls)` against a fake API server on localhost."""
+    calls = []
+
+    async def main():
+        server = TestServer(app_factory(calls))
+        await server.start_server()
+        try:
+            return await scenario(str(server.make_url("/")), calls)
+        finally:
+            await server.close()
+
+    return asyncio.run(main()), calls
+
+
+def test_walmart_get_order_concurrently_shares_one_token():
+    async def scenario(base_url, calls):
+        auth = WalmartMPAuth(dev_client_id="dev", dev_client_secret="secret", sandbox_url=base_url)
+        async with AsyncWalmartMPConnector(AsyncBaseAuth(auth)) as connector:
+            return await asyncio.gather(*(connector.get_order(str(i)) for i in range(20)))
+
+    orders, calls = run_against_fake_server(scenario)
+    assert [order["purchaseOrderId"] for order in orders] == [str(i) for i in range(20)]
+    assert calls.count(("token", None)) == 1
+    assert all(token == "walmart-token" for path, token in calls if path != "token")
+
+
+def test_walmart_get_orders_returns_list():
+    async def scenario(base_url, calls):
+        auth = WalmartMPAuth(dev_client_id="dev", dev_client_secret="secret", sandbox_url=base_url)
+        async with AsyncWalmartMPConnector(AsyncBaseAuth(auth)) as connector:
+            return await connector.get_orders(filter_params={"status": "Created"})
+
+    orders, calls = run_against_fake_server(scenario)
+    assert orders == [{"purchaseOrderId": "111"}]
+    assert ("/v3/orders", {"status": "Created", "limit": "100"}) in calls
+
+
+def test_backmarket_get_orders_follows_next_url():
+    async def scenario(base_url, calls):
+        auth = BackmarketAuth(dev_client_id="dev", dev_client_secret="secret", sandbox_url=base_url)
+        async with AsyncBackmarketConnector(AsyncBaseAuth(auth)) as connector:
+            return await connector.get_orders()
+
+    orders, _ = run_against_fake_server(scenario)
+    assert [order["order_id"] for order in orders] == [1, 2, 3]
+
+
+def test_backmarket_get_order_sends_auth_header():
+    async def scenario(base_url, calls):
+        auth = BackmarketAuth(dev_client_id="dev", dev_client_secret="secret", sandbox_url=base_url)
+        async with AsyncBackmarketConnector(AsyncBaseAuth(auth)) as connector:
+            return await connector.get_order("9183997")
+
+    order, calls = run_against_fake_server(scenario)
+    assert order == {"order_id": 9183997}
+    assert calls == [("/ws/orders/9183997", "Basic secret")]
+
+
+def test_backmarket_search_returns_raises_not_implemented():
+    auth = BackmarketAuth(dev_client_id="dev", dev_client_secret="secret")
+    connector = AsyncBackmarketConnector(AsyncBaseAuth(auth))
+    with pytest.raises(NotImplementedError):
+        asyncio.run(connector.search_returns(filter_params={}))
+
+
+def test_async_requests_are_recorded_in_metrics():
+    metrics = MetricsRegistry()
+
+    async def scenario(base_url, calls):
+        auth = WalmartMPAuth(dev_client_id="dev", dev_client_secret="secret", sandbox_url=base_url, metrics=metrics)
+        async with AsyncWalmartMPConnector(AsyncBaseAuth(auth)) as connector:
+            return await asyncio.gather(*(connector.get_order(str(i)) for i in range(5)))
+
+    run_against_fake_server(scenario)
+    snapshot = metrics.snapshot()
+    [series] = snapshot["requests"]
+    assert (series["marketplace"], series["endpoint"], series["statuses"]) == ("walmartmp", "v3/orders/{id}", {"200": 5})
+    assert series["bytes_received"] > 0
+    assert snapshot["authentications"] == {"walmartmp": 1}
+
+
+# --- pagination ---
+
+def test_walmart_get_orders_follows_cursor_to_last_page():
+    async def scenario(base_url, calls):
+        auth = WalmartMPAuth(dev_client_id="dev", dev_client_secret="secret", sandbox_url=base_url)
+        async with AsyncWalmartMPConnector(AsyncBaseAuth(auth)) as connector:
+            return await connector.get_orders()
+
+    orders, calls = run_against_fake_server(scenario, make_paginated_app)
+    assert len(orders) == 700
+    assert orders[-1] == {"purchaseOrderId": "6-99"}
+    assert len(calls) == 7
+
+
+def test_backmarket_get_orders_fetches_every_counted_page():
+    async def scenario(base_url, calls):
+        auth = BackmarketAuth(dev_client_id="dev", dev_client_secret="secret", sandbox_url=base_url)
+        async with AsyncBackmarketConnector(AsyncBaseAuth(auth)) as connector:
+            return await connector.get_orders()
+
+    orders, calls = run_against_fake_server(scenario, make_paginated_app)
+    assert [order["order_id"] for order in orders] == list(range(220))
+    assert len(calls) == 5
+
+
+def test_ebay_get_orders_fetches_every_offset():
+    async def scenario(base_url, calls):
+        auth = EbayAuth(dev_client_id="dev", dev_client_secret="secret", dev_refresh_token="refresh", sandbox_url=base_url)
+        async with AsyncEbayConnector(AsyncBaseAuth(auth)) as connector:
+            return await connector.get_orders()
+
+    orders, calls = run_against_fake_server(scenario, make_paginated_app)
+    assert [order["orderId"] for order in orders] == [str(n) for n in range(450)]
+    assert sorted(query["offset"] for _, query in calls) == ["0", "200", "400"]
+
+
+def test_amazon_get_orders_follows_next_token():
+    async def scenario(base_url, calls):
+        auth = AmazonAuth(client_id="id", client_secret="secret", refresh_token="refresh", sandbox_url=base_url)
+        auth.access_token = "amazon-token"
+        auth._set_token_expiry(3600)
+        async with AsyncAmazonConnector(AsyncBaseAuth(auth), seller_id="SELLER") as connector:
+            return await connector.get_orders()
+
+    orders, calls = run_against_fake_server(scenario, make_paginated_app)
+    assert len(orders) == 300
+    assert orders[-1] == {"AmazonOrderId": "2-99"}
+    assert calls[0][1]["OrderStatuses"] == "Unshipped"
+    assert calls[-1][1] == {"MarketplaceIds": "ATVPDKIKX0DER,A2EUQ1WTGCTBG2", "NextToken": "2"}
@@ -0,0 +1,109 @@
+import time
+import requests
+from unittest.mock import MagicMock
+from JegBridge.auth.amazon_auth import AmazonAuth
+from JegBridge.auth.walmartmp_auth import WalmartMPAuth
+from JegBridge.auth.backmarket_auth import BackmarketAuth
+
+
+def make_token_response(token="token-1", expires_in=3600):
+    """Helper to build a mock token endpoint response."""
+    response = MagicMock()
+    response.json.return_value = {"access_token": token, "expires_in": expires_in}
+    return response
+
+
+def make_amazon_auth():
+    """Helper to create an AmazonAuth whose HTTP session is a mock."""
+    session = MagicMock()
+    session.post.return_value = make_token_response()
+    auth = AmazonAuth(client_id="id", client_secret="secret", refresh_token="refresh", session=session)
+    return auth, session
+
+
+# --- token caching ---
+
+def test_amazon_get_headers_reuses_cached_token():
+    auth, session = make_amazon_auth()
+    auth.get_headers()
+    auth.get_headers()
+    assert session.post.call_count == 1
+
+
+def test_amazon_get_headers_refreshes_expiring_token():
+    auth, session = make_amazon_auth()
+    auth.get_headers()
+    auth.token_expiry = time.time() + auth.token_expiry_buffer - 1
+    auth.get_headers()
+    assert session.post.call_count == 2
+
+
+def test_token_without_expires_in_is_not_cached():
+    auth, session = make_amazon_auth()
+    session.post.return_value = make_token_response(expires_in=None)
+    auth.get_headers()
+    auth.get_headers()
+    assert session.post.call_count == 2
+
+
+def test_invalidate_token_forces_refresh():
+    auth, session = make_amazon_auth()
+    auth.get_headers()
+    auth.invalidate_token()
+    auth.get_headers()
+    assert session.post.call_count == 2
+
+
+def test_walmart_token_refreshed_when_environment_changes():
+    session = MagicMock()
+    session.post.return_value = make_token_response(expires_in=900)
+    auth = WalmartMPAuth(dev_client_id="dev", dev_client_secret="dev-secret",
+                         prod_client_id="prod", prod_client_secret="prod-secret", session=session)
+    auth.get_headers()
+    auth.use_production = True
+    auth.get_headers()
+    assert session.post.call_count == 2
+
+
+def test_backmarket_token_does_not_expire():
+    auth = BackmarketAuth(dev_client_id="dev", dev_client_secret="dev-secret")
+    auth.get_headers()
+    assert auth._is_token_valid()
+    assert auth.get_headers()["Authorization"] == "Basic dev-secret"
+
+
+# --- pooled session ---
+
+def test_session_is_created_once_and_reused():
+    auth = BackmarketAuth(dev_client_id="dev", dev_client_secret="dev-secret", pool_maxsize=4)
+    session = auth.session
+    assert isinstance(session, requests.Session)
+    assert auth.session is session
+    assert session.get_adapter("https://www.backmarket.com/")._pool_maxsize == 4
+
+
+def test_make_request_uses_session():
+    auth, session = make_amazon_auth()
+    auth.make_request("GET", "orders/v0/orders")
+    assert session.request.call_count == 1
+    assert session.request.call_args[1]["url"].endswith("orders/v0/orders")
+
+
+def test_token_refresh_uses_session():
+    auth, session = make_amazon_auth()
+    auth.make_request("GET", "orders/v0/orders")
+    assert session.post.call_count == 1
+
+
+def test_close_discards_session():
+    auth = BackmarketAuth(dev_client_id="dev", dev_client_secret="dev-secret")
+    session = auth.session
+    auth.close()
+    assert auth.session is not session
+
+
+def test_context_manager_closes_session():
+    session = MagicMock()
+    with BackmarketAuth(dev_client_id="dev", dev_client_secret="dev-secret", session=session) as auth:
+        auth.make_request("GET", "ws/orders")
+    session.close.assert_called_once()
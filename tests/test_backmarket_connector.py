@@ -1,5 +1,8 @@
+import json
 from unittest.mock import MagicMock
 from JegBridge.connectors.backmarket_connector import BackmarketConnector
+from JegBridge.utils.checkpoint_store import PaginationCheckpoint
+from JegBridge.utils.json_decoder import JsonDecoder
 
 
 def make_connector():
@@ -47,6 +50,124 @@ def test_get_orders_calls_correct_endpoint():
     assert "ws/orders" in call_kwargs[1]["endpoint"]
 
 
+def make_paged_auth(mock_auth, count, page_size=50):
+    """Helper to make the mock auth serve `count` orders, `page_size` per page, by page number."""
+
+    def fake_request(method, endpoint, params):
+        page = params.get("page", 1)
+        response = MagicMock()
+        first = (page - 1) * page_size
+        response.json.return_value = {
+            "count": count,
+            "results": [{"order_id": i} for i in range(first, min(first + page_size, count))],
+        }
+        return response
+
+    mock_auth.make_request.side_effect = fake_request
+
+
+def test_get_orders_fetches_all_pages_in_order():
+    connector, mock_auth = make_connector()
+    make_paged_auth(mock_auth, count=420)
+    orders = connector.get_orders(max_workers=3)
+    assert [order["order_id"] for order in orders] == list(range(420))
+    assert mock_auth.make_request.call_count == 9
+
+
+def test_get_orders_sizes_pages_by_first_page():
+    connector, mock_auth = make_connector()
+    # The API serves 20 orders per page although 50 were requested
+    make_paged_auth(mock_auth, count=95, page_size=20)
+    orders = connector.get_orders(max_workers=2)
+    assert [order["order_id"] for order in orders] == list(range(95))
+    assert mock_auth.make_request.call_count == 5
+
+
+def test_get_orders_respects_max_pages():
+    connector, mock_auth = make_connector()
+    make_paged_auth(mock_auth, count=420)
+    orders = connector.get_orders(max_pages=2)
+    assert len(orders) == 100
+
+
+def test_get_orders_follows_next_without_count():
+    connector, mock_auth = make_connector()
+    mock_auth.make_request.return_value.json.side_effect = [
+        {"results": [{"order_id": 1}], "next": "https://www.backmarket.com/ws/orders?page=2"},
+        {"results": [{"order_id": 2}], "next": None},
+    ]
+    orders = connector.get_orders()
+    assert [order["order_id"] for order in orders] == [1, 2]
+    assert mock_auth.make_request.call_args[1]["endpoint"] == "ws/orders?page=2"
+
+
+def test_get_orders_resumes_from_checkpoint(tmp_path):
+    connector, mock_auth = make_connector()
+    checkpoint = PaginationCheckpoint(str(tmp_path / "backmarket.json"))
+    make_paged_auth(mock_auth, count=420)
+    orders = connector.iter_orders(max_workers=2, checkpoint=checkpoint)
+    # Stop consuming partway through the third page, as if the process had died
+    for _ in range(120):
+        next(orders)
+    orders.close()
+
+    mock_auth.make_request.reset_mock()
+    orders = connector.get_orders(max_workers=2, checkpoint=checkpoint)
+    assert [order["order_id"] for order in orders] == list(range(420))
+    # The third page was not fully consumed, so it is fetched again
+    requested_pages = sorted(call[1]["params"]["page"] for call in mock_auth.make_request.call_args_list)
+    assert requested_pages == list(range(3, 10))
+    assert checkpoint.load({"page-size": 50}) is None
+
+
+def test_iter_orders_is_lazy():
+    connector, mock_auth = make_connector()
+    make_paged_auth(mock_auth, count=1000)
+    orders = connector.iter_orders(max_workers=2)
+    assert next(orders)["order_id"] == 0
+    assert mock_auth.make_request.call_count == 1
+
+
+def test_iter_orders_streams_pages():
+    connector, mock_auth = make_connector()
+    mock_auth.json_decoder = JsonDecoder()
+
+    def fake_request(method, endpoint, params, stream):
+        page = params.get("page", 1)
+        first = (page - 1) * 50
+        body = {"count": 120, "results": [{"order_id": i} for i in range(first, min(first + 50, 120))]}
+        response = MagicMock()
+        response.iter_content.return_value = [json.dumps(body).encode()]
+        return response
+
+    mock_auth.make_request.side_effect = fake_request
+    orders = list(connector.iter_orders(stream=True))
+    assert [order["order_id"] for order in orders] == list(range(120))
+    assert [call[1]["params"].get("page") for call in mock_auth.make_request.call_args_list] == [None, 2, 3]
+
+
+def test_iter_orders_stream_raises_on_bad_response():
+    connector, mock_auth = make_connector()
+    mock_auth.json_decoder = JsonDecoder()
+    mock_auth.make_request.return_value.iter_content.return_value = [b'{"error": "Unauthorized"}']
+    try:
+        list(connector.iter_orders(stream=True))
+        assert False, "Expected KeyError"
+    except KeyError:
+        pass
+    mock_auth.make_request.return_value.close.assert_called_once()
+
+
+# --- get_orders_by_ids ---
+
+def test_get_orders_by_ids_reports_missing_orders():
+    connector, mock_auth = make_connector()
+    mock_auth.make_request.return_value.json.side_effect = [{"order_id": 1}, {"detail": "Not found."}]
+    lookup = connector.get_orders_by_ids([1, 2], max_workers=1)
+    assert lookup.found == {"1": {"order_id": 1}}
+    assert lookup.missing == ["2"]
+
+
 # --- get_order ---
 
 def test_get_order_calls_correct_endpoint():
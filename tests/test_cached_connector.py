@@ -0,0 +1,136 @@
+from datetime import datetime, timezone, timedelta
+from unittest.mock import MagicMock
+from JegBridge.connectors.amazon_connector import AmazonConnector
+from JegBridge.connectors.cached_connector import CachedConnector
+from JegBridge.connectors.ebay_connector import EbayConnector
+from JegBridge.connectors.walmartmp_connector import WalmartMPConnector
+from JegBridge.utils.order_cache import OrderCache
+
+
+def make_cached_connector(ttl=timedelta(minutes=15)):
+    """Helper to wrap an AmazonConnector with a mock auth object in an in-memory cache."""
+    mock_auth = MagicMock()
+    connector = AmazonConnector(auth=mock_auth, seller_id="SELLER")
+    return CachedConnector(connector, OrderCache(), ttl=ttl), mock_auth
+
+
+AMAZON_ORDER = {
+    "AmazonOrderId": "111",
+    "OrderStatus": "Unshipped",
+    "PurchaseDate": "2025-03-01T12:00:00Z",
+    "LastUpdateDate": "2025-03-02T08:00:00Z",
+}
+
+
+# --- OrderCache ---
+
+def test_cache_round_trips_orders():
+    cache = OrderCache()
+    cache.put("amazon", "111", AMAZON_ORDER, status="Unshipped")
+    assert cache.get("amazon", "111") == AMAZON_ORDER
+    assert cache.get("ebay", "111") is None
+
+
+def test_cache_respects_max_age():
+    cache = OrderCache()
+    cache.put("amazon", "111", AMAZON_ORDER)
+    assert cache.get("amazon", "111", max_age=60) == AMAZON_ORDER
+    assert cache.get("amazon", "111", max_age=-1) is None
+
+
+def test_cache_query_filters_by_status_and_dates():
+    cache = OrderCache()
+    cache.put_many("amazon", [
+        {"order_id": "1", "order": {"id": 1}, "status": "Shipped", "created_at": "2025-01-01T00:00:00Z"},
+        {"order_id": "2", "order": {"id": 2}, "status": "Unshipped", "created_at": "2025-02-01T00:00:00Z"},
+        {"order_id": "3", "order": {"id": 3}, "status": "Unshipped", "created_at": "2025-03-01T00:00:00Z"},
+    ])
+    assert cache.query("amazon", status="Unshipped") == [{"id": 2}, {"id": 3}]
+    assert cache.query("amazon", created_after=datetime(2025, 1, 15, tzinfo=timezone.utc),
+                       created_before="2025-03-01T00:00:00Z") == [{"id": 2}]
+
+
+def test_cache_normalizes_dates():
+    assert OrderCache.normalize_date("2025-03-01T13:00:00+01:00") == "2025-03-01T12:00:00Z"
+    assert OrderCache.normalize_date("2025-03-01T12:00:00.000Z") == "2025-03-01T12:00:00Z"
+    assert OrderCache.normalize_date(1740830400000) == "2025-03-01T12:00:00Z"
+    assert OrderCache.normalize_date("not a date") == "not a date"
+
+
+def test_cache_persists_to_file(tmp_path):
+    path = str(tmp_path / "orders.db")
+    with OrderCache(path) as cache:
+        cache.put("amazon", "111", AMAZON_ORDER)
+    with OrderCache(path) as cache:
+        assert cache.get("amazon", "111") == AMAZON_ORDER
+
+
+# --- CachedConnector ---
+
+def test_get_order_is_served_from_cache():
+    connector, mock_auth = make_cached_connector()
+    mock_auth.make_request.return_value.json.return_value = {"payload": AMAZON_ORDER}
+    assert connector.get_order("111") == AMAZON_ORDER
+    assert connector.get_order("111") == AMAZON_ORDER
+    assert mock_auth.make_request.call_count == 1
+
+
+def test_get_order_refetches_stale_orders():
+    connector, mock_auth = make_cached_connector(ttl=timedelta(seconds=-1))
+    mock_auth.make_request.return_value.json.return_value = {"payload": AMAZON_ORDER}
+    connector.get_order("111")
+    connector.get_order("111")
+    assert mock_auth.make_request.call_count == 2
+
+
+def test_get_order_does_not_cache_error_bodies():
+    mock_auth = MagicMock()
+    connector = CachedConnector(EbayConnector(auth=mock_auth), OrderCache())
+    mock_auth.make_request.return_value.json.return_value = {"errors": [{"errorId": 32100, "message": "Not found"}]}
+    assert "errors" in connector.get_order("12-34567-89012")
+    assert connector.cache.get("ebay", "12-34567-89012") is None
+    mock_auth.make_request.return_value.json.return_value = {"orderId": "12-34567-89012"}
+    assert connector.get_order("12-34567-89012") == {"orderId": "12-34567-89012"}
+    assert connector.cache.get("ebay", "12-34567-89012") == {"orderId": "12-34567-89012"}
+
+
+def test_get_orders_fills_cache():
+    connector, mock_auth = make_cached_connector()
+    mock_auth.make_request.return_value.json.return_value = {"payload": {"Orders": [AMAZON_ORDER]}}
+    assert connector.get_orders() == [AMAZON_ORDER]
+    mock_auth.make_request.reset_mock()
+    assert connector.get_order("111") == AMAZON_ORDER
+    assert not mock_auth.make_request.called
+    assert connector.cache.query("amazon", status="Unshipped", modified_after="2025-03-02T00:00:00Z") == [AMAZON_ORDER]
+
+
+def test_get_orders_by_ids_only_fetches_uncached_orders():
+    connector, mock_auth = make_cached_connector()
+    connector.cache_orders([AMAZON_ORDER])
+    mock_auth.make_request.return_value.json.return_value = {"payload": {"Orders": [{"AmazonOrderId": "222"}]}}
+    lookup = connector.get_orders_by_ids(["111", "222", "333"])
+    assert list(lookup.found) == ["111", "222"]
+    assert lookup.missing == ["333"]
+    assert mock_auth.make_request.call_args[1]["params"]["AmazonOrderIds"] == "222,333"
+    assert connector.cache.get("amazon", "222") == {"AmazonOrderId": "222"}
+
+
+def test_walmart_orders_are_indexed_by_order_date():
+    mock_auth = MagicMock()
+    mock_auth.make_request.return_value.json.return_value = {
+        "list": {"elements": {"order": [{"purchaseOrderId": "P1", "orderDate": 1740830400000}]}}
+    }
+    connector = CachedConnector(WalmartMPConnector(auth=mock_auth), OrderCache())
+    connector.get_orders()
+    assert connector.cache.query("walmartmp", created_after="2025-03-01T00:00:00Z") == [
+        {"purchaseOrderId": "P1", "orderDate": 1740830400000}
+    ]
+
+
+def test_other_attributes_are_delegated():
+    connector, mock_auth = make_cached_connector()
+    assert connector.marketplace == "amazon"
+    assert connector.account_id == "SELLER"
+    assert connector.seller_id == "SELLER"
+    connector.get_listing("SKU-1")
+    assert mock_auth.make_request.called
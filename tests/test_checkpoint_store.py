@@ -0,0 +1,147 @@
+import os
+from datetime import datetime, timezone, timedelta
+from unittest.mock import MagicMock
+from JegBridge.connectors.amazon_connector import AmazonConnector
+from JegBridge.connectors.backmarket_connector import BackmarketConnector
+from JegBridge.connectors.ebay_connector import EbayConnector
+from JegBridge.connectors.walmartmp_connector import WalmartMPConnector
+from JegBridge.utils.checkpoint_store import CheckpointStore, PaginationCheckpoint
+
+
+def make_amazon_connector():
+    """Helper to create an AmazonConnector whose auth returns a single empty page."""
+    mock_auth = MagicMock()
+    mock_auth.make_request.return_value.json.return_value = {"payload": {"Orders": [{"AmazonOrderId": "111"}]}}
+    return AmazonConnector(auth=mock_auth, seller_id="SELLER"), mock_auth
+
+
+# --- CheckpointStore ---
+
+def test_store_round_trips_values(tmp_path):
+    store = CheckpointStore(str(tmp_path / "checkpoints.json"))
+    store.set("amazon:SELLER:orders", "2025-01-01T00:00:00+00:00")
+    assert CheckpointStore(store.path).get("amazon:SELLER:orders") == "2025-01-01T00:00:00+00:00"
+
+
+def test_store_returns_default_when_missing(tmp_path):
+    store = CheckpointStore(str(tmp_path / "missing" / "checkpoints.json"))
+    assert store.get("ebay:default:orders", "none") == "none"
+
+
+def test_store_delete(tmp_path):
+    store = CheckpointStore(str(tmp_path / "checkpoints.json"))
+    store.set("key", 1)
+    store.delete("key")
+    assert store.get("key") is None
+
+
+# --- PaginationCheckpoint ---
+
+def test_pagination_checkpoint_accumulates_pages(tmp_path):
+    checkpoint = PaginationCheckpoint(str(tmp_path / "orders.json"))
+    assert checkpoint.load({"status": "Created"}) is None
+    checkpoint.save({"status": "Created"}, [{"id": 1}, {"id": 2}], "cursor-2")
+    checkpoint.save({"status": "Created"}, [{"id": 3}], "cursor-3")
+    reopened = PaginationCheckpoint(checkpoint.path)
+    assert reopened.load({"status": "Created"}) == {"cursor": "cursor-3", "done": False}
+    assert reopened.items() == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+
+def test_pagination_checkpoint_ignores_uncommitted_items(tmp_path):
+    checkpoint = PaginationCheckpoint(str(tmp_path / "orders.json"))
+    checkpoint.save({}, [{"id": 1}], "cursor-2")
+    # Simulate a crash after appending a page but before committing its cursor
+    with open(checkpoint.items_path, "a") as items_file:
+        items_file.write('{"id": 2}\n')
+    assert checkpoint.items() == [{"id": 1}]
+    checkpoint.save({}, [{"id": 2}], None, done=True)
+    assert checkpoint.items() == [{"id": 1}, {"id": 2}]
+
+
+def test_pagination_checkpoint_rejects_other_query(tmp_path):
+    checkpoint = PaginationCheckpoint(str(tmp_path / "orders.json"))
+    checkpoint.save({"status": "Created"}, [], "cursor-2")
+    try:
+        checkpoint.load({"status": "Shipped"})
+        assert False, "Expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_pagination_checkpoint_restarts_missing_items_file(tmp_path):
+    checkpoint = PaginationCheckpoint(str(tmp_path / "fetch.json"))
+    checkpoint.save({}, [{"id": 1}], "cursor-2")
+    os.remove(checkpoint.items_path)
+    checkpoint.save({}, [{"id": 2}], "cursor-3")
+    assert checkpoint.items() == [{"id": 2}]
+    assert checkpoint.load({})["cursor"] == "cursor-3"
+
+
+def test_pagination_checkpoint_clear(tmp_path):
+    checkpoint = PaginationCheckpoint(str(tmp_path / "orders.json"))
+    checkpoint.save({}, [{"id": 1}], "cursor-2")
+    checkpoint.clear()
+    assert checkpoint.load({}) is None
+    assert checkpoint.items() == []
+
+
+# --- sync_orders ---
+
+def test_first_sync_uses_initial_lookback(tmp_path):
+    connector, mock_auth = make_amazon_connector()
+    store = CheckpointStore(str(tmp_path / "checkpoints.json"))
+    orders = connector.sync_orders(store, initial_lookback=timedelta(days=2))
+    assert orders == [{"AmazonOrderId": "111"}]
+    since = datetime.strptime(mock_auth.make_request.call_args[1]["params"]["LastUpdatedAfter"], "%Y-%m-%dT%H:%M:%SZ")
+    assert abs(datetime.utcnow() - timedelta(days=2) - since) < timedelta(minutes=1)
+    assert store.get("amazon:SELLER:orders") is not None
+
+
+def test_next_sync_starts_from_watermark(tmp_path):
+    connector, mock_auth = make_amazon_connector()
+    store = CheckpointStore(str(tmp_path / "checkpoints.json"))
+    store.set("amazon:SELLER:orders", "2025-03-01T12:00:00+00:00")
+    connector.sync_orders(store, overlap=timedelta(minutes=5))
+    params = mock_auth.make_request.call_args[1]["params"]
+    assert params["LastUpdatedAfter"] == "2025-03-01T11:55:00Z"
+    assert "OrderStatuses" not in params
+    assert store.get("amazon:SELLER:orders") > "2025-03-01T12:00:00+00:00"
+
+
+def test_failed_sync_keeps_watermark(tmp_path):
+    connector, mock_auth = make_amazon_connector()
+    mock_auth.make_request.return_value.json.return_value = {"error": "Unauthorized"}
+    store = CheckpointStore(str(tmp_path / "checkpoints.json"))
+    store.set("amazon:SELLER:orders", "2025-03-01T12:00:00+00:00")
+    try:
+        connector.sync_orders(store)
+        assert False, "Expected KeyError"
+    except KeyError:
+        pass
+    assert store.get("amazon:SELLER:orders") == "2025-03-01T12:00:00+00:00"
+
+
+# --- per-marketplace modified-since filters ---
+
+SINCE = datetime(2025, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def test_walmart_modified_since_filter():
+    mock_auth = MagicMock()
+    mock_auth.make_request.return_value.json.return_value = {"list": {"elements": {"order": []}}}
+    list(WalmartMPConnector(auth=mock_auth).iter_orders_modified_since(SINCE))
+    assert mock_auth.make_request.call_args[1]["params"]["lastModifiedStartDate"] == "2025-03-01T12:00:00Z"
+
+
+def test_ebay_modified_since_filter():
+    mock_auth = MagicMock()
+    mock_auth.make_request.return_value.json.return_value = {"orders": []}
+    list(EbayConnector(auth=mock_auth).iter_orders_modified_since(SINCE))
+    assert mock_auth.make_request.call_args[1]["params"]["filter"] == "lastmodifieddate:[2025-03-01T12:00:00.000Z..]"
+
+
+def test_backmarket_modified_since_filter():
+    mock_auth = MagicMock()
+    mock_auth.make_request.return_value.json.return_value = {"results": []}
+    list(BackmarketConnector(auth=mock_auth).iter_orders_modified_since(SINCE))
+    assert mock_auth.make_request.call_args[1]["params"]["date_modification"] == "2025-03-01 12:00:00"
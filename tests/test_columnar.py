@@ -0,0 +1,87 @@
+import math
+import time
+from datetime import datetime, timezone
+from JegBridge.mixins.amazon_report_handler import RETURNS_REPORT_SCHEMA
+from JegBridge.utils.columnar import ColumnarTable, StringColumn, TextColumn, parse_report_date
+
+HEADER = ["Order ID", "Order date", "ASIN", "Merchant SKU", "Return quantity", "Return reason", "Refunded Amount"]
+ROWS = [
+    ["111", "2025-01-07T10:00:00+00:00", "B001", "SKU-1", "1", "DEFECTIVE", "19.99"],
+    ["222", "08-Jan-2025", "B002", "SKU-2", "2", "NO_LONGER_NEEDED", ""],
+    ["111", "2025-01-07T10:00:00+00:00", "B001", "SKU-1", "3", "DEFECTIVE", "59.97"],
+]
+
+
+def make_table():
+    """Helper to build a returns table from ROWS."""
+    return ColumnarTable.from_rows(HEADER, iter(ROWS), RETURNS_REPORT_SCHEMA)
+
+
+def test_parse_report_date_formats():
+    expected = datetime(2025, 1, 8, tzinfo=timezone.utc).timestamp()
+    assert parse_report_date("2025-01-08T00:00:00Z") == expected
+    assert parse_report_date("08-Jan-2025") == expected
+    assert parse_report_date("01/08/2025") == expected
+    assert math.isnan(parse_report_date(""))
+
+
+def test_string_column_dictionary_encodes_values():
+    column = StringColumn()
+    for value in ["a", "b", "a", "a"]:
+        column.append(value)
+    assert column.values == ["a", "b"]
+    assert list(column.codes) == [0, 1, 0, 0]
+    assert list(column) == ["a", "b", "a", "a"]
+
+
+def test_from_rows_builds_typed_columns():
+    table = make_table()
+    assert len(table) == 3
+    assert table["return_quantity"].data.typecode == "q"
+    assert list(table["return_quantity"]) == [1, 2, 3]
+    assert math.isnan(table["refunded_amount"][1])
+    assert table["sku"].values == ["SKU-1", "SKU-2"]
+    # Columns absent from the report are present but empty
+    assert list(table["resolution"]) == ["", "", ""]
+
+
+def test_from_rows_parses_int_thousands_and_overflow():
+    rows = [["1", "1,000"], ["2", "inf"], ["3", "n/a"]]
+    table = ColumnarTable.from_rows(["Order ID", "Return quantity"], iter(rows), RETURNS_REPORT_SCHEMA)
+    assert list(table["return_quantity"]) == [1000, 0, 0]
+
+
+def test_filter_by_value_set_and_predicate():
+    table = make_table()
+    assert list(table.filter(return_reason="DEFECTIVE")["order_id"]) == ["111", "111"]
+    assert len(table.filter(sku={"SKU-1", "SKU-2"}, return_quantity=lambda quantity: quantity > 1)) == 2
+    assert len(table.filter(sku="UNKNOWN")) == 0
+
+
+def test_between_dates():
+    table = make_table()
+    start = datetime(2025, 1, 8, tzinfo=timezone.utc).timestamp()
+    assert list(table.between("order_date", start=start)["order_id"]) == ["222"]
+
+
+def test_group_by_and_sum_by():
+    table = make_table()
+    groups = table.group_by("order_id")
+    assert list(groups) == ["111", "222"]
+    assert len(groups["111"]) == 2
+    assert table.sum_by("sku", "return_quantity") == {"SKU-1": 4, "SKU-2": 2}
+    assert table.sum_by("return_reason", "refunded_amount") == {"DEFECTIVE": 79.96}
+
+
+def test_group_by_unique_key_scales_linearly():
+    rows = [[str(i), "2025-01-07", f"B{i}", f"SKU-{i}", "1", "DEFECTIVE", "1.00"] for i in range(10000)]
+    table = ColumnarTable.from_rows(HEADER, iter(rows), RETURNS_REPORT_SCHEMA)
+    assert isinstance(table["order_id"], TextColumn)
+    started = time.perf_counter()
+    groups = table.group_by("order_id")
+    assert time.perf_counter() - started < 10
+    assert len(groups) == 10000
+    # Sub-tables share the parent's string dictionary instead of re-indexing it
+    assert groups["9999"]["sku"]._index is table["sku"]._index
+    assert list(groups["9999"]["sku"]) == ["SKU-9999"]
+    assert len(table.group_by("sku")) == 10000
@@ -0,0 +1,74 @@
+import asyncio
+import threading
+import time
+from JegBridge.utils.concurrency import bounded_gather, bounded_map, chunked
+
+
+def test_bounded_map_preserves_order():
+    def slow_square(n):
+        time.sleep(0.01 * (5 - n % 5))
+        return n * n
+
+    assert list(bounded_map(slow_square, range(10), max_workers=4)) == [n * n for n in range(10)]
+
+
+def test_bounded_map_limits_calls_in_flight():
+    lock = threading.Lock()
+    in_flight = [0]
+    peak = [0]
+
+    def track(n):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        time.sleep(0.01)
+        with lock:
+            in_flight[0] -= 1
+        return n
+
+    assert list(bounded_map(track, range(20), max_workers=3)) == list(range(20))
+    assert peak[0] <= 3
+
+
+def test_bounded_map_raises_worker_errors():
+    def fail_on_three(n):
+        if n == 3:
+            raise ValueError("boom")
+        return n
+
+    results = []
+    try:
+        for result in bounded_map(fail_on_three, range(6), max_workers=2):
+            results.append(result)
+        assert False, "Expected ValueError"
+    except ValueError:
+        pass
+    assert results == [0, 1, 2]
+
+
+def test_bounded_map_unordered_yields_fast_results_first():
+    def sleep_for(delay):
+        time.sleep(delay)
+        return delay
+
+    results = list(bounded_map(sleep_for, [0.2, 0.01, 0.02], max_workers=3, ordered=False))
+    assert results == [0.01, 0.02, 0.2]
+
+
+def test_bounded_gather_preserves_order_and_limits_calls_in_flight():
+    in_flight = [0]
+    peak = [0]
+
+    async def track(n):
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        await asyncio.sleep(0.01 * (5 - n % 5))
+        in_flight[0] -= 1
+        return n * n
+
+    assert asyncio.run(bounded_gather(track, range(10), max_workers=3)) == [n * n for n in range(10)]
+    assert peak[0] == 3
+
+
+def test_chunked():
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
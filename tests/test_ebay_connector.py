@@ -1,5 +1,8 @@
+import json
+from datetime import datetime, timezone
 from unittest.mock import MagicMock
 from JegBridge.connectors.ebay_connector import EbayConnector
+from JegBridge.utils.json_decoder import JsonDecoder
 
 
 def make_connector():
@@ -52,6 +55,90 @@ def test_get_orders_uses_bearer_headers():
     assert call_kwargs[1]["get_headers_callback"] == mock_auth.get_headers_with_bearer
 
 
+def test_get_orders_fetches_remaining_offsets():
+    connector, mock_auth = make_connector()
+
+    def fake_request(method, endpoint, get_headers_callback, params):
+        response = MagicMock()
+        offset = params["offset"]
+        response.json.return_value = {
+            "total": 450,
+            "orders": [{"orderId": str(i)} for i in range(offset, min(offset + params["limit"], 450))],
+        }
+        return response
+
+    mock_auth.make_request.side_effect = fake_request
+    orders = connector.get_orders(max_workers=2)
+    assert [order["orderId"] for order in orders] == [str(i) for i in range(450)]
+    offsets = sorted(call[1]["params"]["offset"] for call in mock_auth.make_request.call_args_list)
+    assert offsets == [0, 200, 400]
+
+
+def test_get_orders_passes_filter_and_field_groups():
+    connector, mock_auth = make_connector()
+    mock_auth.make_request.return_value.json.return_value = {"orders": []}
+    connector.get_orders(filter="orderfulfillmentstatus:{NOT_STARTED}", field_groups=["TAX_BREAKDOWN"])
+    params = mock_auth.make_request.call_args[1]["params"]
+    assert params["filter"] == "orderfulfillmentstatus:{NOT_STARTED}"
+    assert params["fieldGroups"] == "TAX_BREAKDOWN"
+
+
+def test_iter_orders_is_lazy():
+    connector, mock_auth = make_connector()
+    mock_auth.make_request.return_value.json.return_value = {"total": 1000, "orders": [{"orderId": "08-111"}]}
+    orders = connector.iter_orders()
+    assert next(orders)["orderId"] == "08-111"
+    assert mock_auth.make_request.call_count == 1
+
+
+def test_iter_orders_streams_pages():
+    connector, mock_auth = make_connector()
+    mock_auth.json_decoder = JsonDecoder()
+
+    def fake_request(method, endpoint, get_headers_callback, params, stream):
+        response = MagicMock()
+        offset = params["offset"]
+        page = {"total": 3, "orders": [{"orderId": str(i)} for i in range(offset, min(offset + 2, 3))]}
+        response.iter_content.return_value = [json.dumps(page).encode()]
+        return response
+
+    mock_auth.make_request.side_effect = fake_request
+    orders = list(connector.iter_orders(limit=2, stream=True))
+    assert [order["orderId"] for order in orders] == ["0", "1", "2"]
+    assert mock_auth.make_request.call_count == 2
+
+
+def test_build_order_filter():
+    order_filter = EbayConnector.build_order_filter(
+        creation_date_from=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        last_modified_date_from=datetime(2025, 2, 1, 12, 30, tzinfo=timezone.utc),
+        fulfillment_statuses=["NOT_STARTED", "IN_PROGRESS"],
+    )
+    assert order_filter == (
+        "creationdate:[2025-01-01T00:00:00.000Z..],"
+        "lastmodifieddate:[2025-02-01T12:30:00.000Z..],"
+        "orderfulfillmentstatus:{NOT_STARTED|IN_PROGRESS}"
+    )
+
+
+def test_build_order_filter_without_criteria():
+    assert EbayConnector.build_order_filter() is None
+
+
+# --- get_orders_by_ids ---
+
+def test_get_orders_by_ids_uses_order_ids_parameter():
+    connector, mock_auth = make_connector()
+    mock_auth.make_request.return_value.json.return_value = {
+        "orders": [{"orderId": "08-1"}],
+        "warnings": [{"errorId": 32800, "message": "Order 08-2 not found"}],
+    }
+    lookup = connector.get_orders_by_ids(["08-1", "08-2"])
+    assert lookup.found == {"08-1": {"orderId": "08-1"}}
+    assert lookup.missing == ["08-2"]
+    assert mock_auth.make_request.call_args[1]["params"] == {"orderIds": "08-1,08-2"}
+
+
 # --- get_order ---
 
 def test_get_order_calls_correct_endpoint():
@@ -0,0 +1,85 @@
+import json
+from unittest.mock import MagicMock
+import pytest
+from JegBridge.auth.backmarket_auth import BackmarketAuth
+from JegBridge.connectors.walmartmp_connector import WalmartMPConnector
+from JegBridge.utils.json_decoder import JsonDecoder, get_json_decoder
+
+WALMART_PAGE = json.dumps({
+    "list": {
+        "meta": {"totalCount": 2, "nextCursor": None},
+        "elements": {"order": [
+            {"purchaseOrderId": "P1", "orderDate": 1740830400000, "orderLines": {"orderLine": []}},
+            {"purchaseOrderId": "P2", "orderDate": 1740834000000, "orderLines": {"orderLine": []}},
+        ]},
+    }
+}).encode()
+
+BACKENDS = ["json", "orjson", "msgspec"]
+
+
+def make_decoder(name):
+    """Helper to create a decoder, skipping backends that are not installed."""
+    try:
+        return get_json_decoder(name)
+    except ImportError:
+        pytest.skip(f"{name} is not installed")
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_backends_decode_the_same(name):
+    decoder = make_decoder(name)
+    assert decoder.loads(WALMART_PAGE) == json.loads(WALMART_PAGE)
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_loads_items_returns_each_item_as_json(name):
+    decoder = make_decoder(name)
+    items = decoder.loads_items(WALMART_PAGE, ("list", "elements", "order"))
+    assert [json.loads(item)["purchaseOrderId"] for item in items] == ["P1", "P2"]
+    assert decoder.loads_items(b'{"list": {}}', ("list", "elements", "order")) == []
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_loads_items_rejects_non_objects(name):
+    decoder = make_decoder(name)
+    with pytest.raises(KeyError):
+        decoder.loads_items(b"[1, 2]", ("orders",))
+
+
+def test_msgspec_fields_decoder_reads_mapped_paths():
+    decoder = make_decoder("msgspec")
+    read = decoder.fields_decoder(("id", "lines.0.price.amount", "lines.1.sku", None, "meta"))
+    assert decoder.fields_decoder(("id", "lines.0.price.amount", "lines.1.sku", None, "meta")) is read
+    document = b'{"id": 7, "lines": [{"price": {"amount": 9.5}, "sku": "A"}], "meta": {"a": [1]}, "other": 1}'
+    assert read(document) == (7, 9.5, None, None, {"a": [1]})
+    assert read(b'{"id": 7, "lines": "none"}') is None
+    assert get_json_decoder("json").fields_decoder(("id",)) is None
+
+
+def test_get_json_decoder_defaults_and_errors():
+    assert type(get_json_decoder(None)) is JsonDecoder
+    assert get_json_decoder("auto").name in BACKENDS
+    with pytest.raises(ValueError):
+        get_json_decoder("simdjson")
+
+
+def test_make_request_uses_configured_decoder():
+    decoder = MagicMock(spec=JsonDecoder)
+    decoder.loads.return_value = {"decoded": True}
+    session = MagicMock()
+    session.request.return_value.status_code = 200
+    session.request.return_value.content = b"{}"
+    auth = BackmarketAuth(dev_client_id="dev", dev_client_secret="secret", session=session, json_decoder=decoder)
+    assert auth.make_request("GET", "ws/orders").json() == {"decoded": True}
+    decoder.loads.assert_called_once_with(b"{}")
+
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_parse_orders_page_builds_order_models(name):
+    auth = MagicMock()
+    auth.json_decoder = make_decoder(name)
+    orders = WalmartMPConnector(auth=auth).parse_orders_page(WALMART_PAGE)
+    assert [(order.order_id, order.created_at) for order in orders] == [
+        ("P1", "2025-03-01T12:00:00Z"), ("P2", "2025-03-01T13:00:00Z"),
+    ]
@@ -0,0 +1,80 @@
+import json
+import pytest
+from JegBridge.utils.json_decoder import get_json_decoder
+from JegBridge.utils.json_stream import JsonItemStream
+
+PAGE = {
+    "list": {
+        "meta": {"totalCount": 3, "nextCursor": "?cursor=a\"b&limit=100"},
+        "elements": {"order": [
+            {"purchaseOrderId": "1", "note": "escaped \\\" quote ]}", "lines": [{"a": [1, 2]}, {}]},
+            {"purchaseOrderId": "2", "orderDate": 1740830400000},
+            {"purchaseOrderId": "3", "flags": [True, False, None, -1.5e3]},
+        ]},
+        "total": 3,
+    }
+}
+PATH = ("list", "elements", "order")
+
+
+def split(data, size):
+    """Helper to cut a document into chunks of `size` bytes."""
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+# --- JsonItemStream ---
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 100000])
+def test_items_match_full_decode_for_any_chunking(size):
+    data = json.dumps(PAGE, indent=2).encode()
+    stream = JsonItemStream(split(data, size), PATH)
+    assert list(stream) == PAGE["list"]["elements"]["order"]
+    assert stream.found and stream.count == 3
+    assert stream.envelope == {"list": {"meta": PAGE["list"]["meta"], "elements": {}, "total": 3}}
+
+
+def test_items_are_yielded_before_the_document_ends():
+    def chunks():
+        yield b'{"total": 2, "orders": [{"orderId": "1"},'
+        raise AssertionError("read past the first order")
+
+    stream = iter(JsonItemStream(chunks(), ("orders",)))
+    assert next(stream) == {"orderId": "1"}
+
+
+def test_buffer_drops_consumed_items():
+    orders = [{"orderId": str(i), "note": "x" * 50} for i in range(2000)]
+    data = json.dumps({"orders": orders}).encode()
+    stream = JsonItemStream(split(data, 64), ("orders",), decode=False)
+    largest = 0
+    for raw in stream:
+        assert isinstance(raw, bytes)
+        largest = max(largest, len(stream._buffer))
+    assert stream.count == 2000
+    # Only the current item and the chunk after it are held, not the whole document
+    assert largest < 512
+
+
+def test_raw_items_and_custom_decoder():
+    data = json.dumps(PAGE).encode()
+    raw_items = list(JsonItemStream([data], PATH, decode=False))
+    assert [json.loads(item) for item in raw_items] == PAGE["list"]["elements"]["order"]
+    decoder = get_json_decoder("auto")
+    assert list(JsonItemStream([data], PATH, json_decoder=decoder)) == PAGE["list"]["elements"]["order"]
+
+
+def test_missing_list_and_top_level_array():
+    stream = JsonItemStream([b'{"errors": [{"code": "UNAUTHORIZED"}]}'], ("results",))
+    assert list(stream) == []
+    assert not stream.found
+    assert stream.envelope == {"errors": [{"code": "UNAUTHORIZED"}]}
+    assert list(JsonItemStream([b"[1, ", b"23, {}]"], ())) == [1, 23, {}]
+
+
+def test_rejects_unexpected_or_truncated_documents():
+    with pytest.raises(KeyError):
+        list(JsonItemStream([b"[1, 2]"], ("orders",)))
+    with pytest.raises(ValueError):
+        list(JsonItemStream([b'{"orders": [{"orderId": "1"}'], ("orders",)))
+    with pytest.raises(ValueError):
+        list(JsonItemStream([b'{"orders": [] "total": 1}'], ("orders",)))
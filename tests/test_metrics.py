@@ -0,0 +1,150 @@
+import requests
+from unittest.mock import MagicMock
+import pytest
+from JegBridge.auth.amazon_auth import AmazonAuth
+from JegBridge.auth.backmarket_auth import BackmarketAuth
+from JegBridge.utils.metrics import Histogram, MetricsRegistry, endpoint_template
+from JegBridge.utils.retry import RetryPolicy
+
+
+def make_response(status_code=200, content=b"{}", body=None):
+    """Helper to build a mock HTTP response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = content
+    response.headers = {}
+    response.request.body = body
+    return response
+
+
+# --- endpoint_template ---
+
+@pytest.mark.parametrize("endpoint,template", [
+    ("orders/v0/orders/123-4567890-1234567/orderItems", "orders/v0/orders/{id}/orderItems"),
+    ("/reports/2021-06-30/documents/amzn1.spdoc.1.4.na.abc", "reports/2021-06-30/documents/{id}"),
+    ("v3/orders/109000580338218", "v3/orders/{id}"),
+    ("ws/orders?page=2&page-size=50", "ws/orders"),
+    ("sell/fulfillment/v1/order", "sell/fulfillment/v1/order"),
+])
+def test_endpoint_template(endpoint, template):
+    assert endpoint_template(endpoint) == template
+
+
+# --- Histogram ---
+
+def test_histogram_quantiles_interpolate_within_buckets():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.05, 0.5, 0.5):
+        histogram.observe(value)
+    assert histogram.counts == [2, 2, 0]
+    assert histogram.quantile(0.5) == pytest.approx(0.1)
+    assert histogram.quantile(0.75) == pytest.approx(0.55)
+    histogram.observe(5.0)
+    assert histogram.quantile(0.99) == 1.0
+    assert Histogram().quantile(0.5) is None
+
+
+# --- MetricsRegistry ---
+
+def test_snapshot_groups_by_endpoint_template():
+    metrics = MetricsRegistry()
+    metrics.record_request("amazon", "get", "orders/v0/orders/111-1111111-1111111", 200, 0.2, 0, 100)
+    metrics.record_request("amazon", "GET", "orders/v0/orders/222-2222222-2222222", 429, 0.4, 0, 50)
+    metrics.record_request("amazon", "GET", "orders/v0/orders/333-3333333-3333333", None, 1.5)
+    metrics.record_authentication("amazon")
+
+    snapshot = metrics.snapshot()
+    [series] = snapshot["requests"]
+    assert series["endpoint"] == "orders/v0/orders/{id}"
+    assert series["count"] == 3
+    assert series["statuses"] == {"200": 1, "429": 1, "error": 1}
+    assert series["bytes_received"] == 150
+    assert series["latency"]["sum"] == pytest.approx(2.1)
+    assert 0.25 <= series["latency"]["p50"] <= 0.5
+    assert snapshot["authentications"] == {"amazon": 1}
+
+    metrics.reset()
+    assert metrics.snapshot() == {"requests": [], "authentications": {}}
+
+
+def test_routes_strip_ids_without_digits():
+    metrics = MetricsRegistry()
+    metrics.add_routes("amazon", [r"listings/2021-08-01/items/[^/]+/[^/]+"])
+    metrics.record_request("amazon", "GET", "/listings/2021-08-01/items/SELLER/BLUE-WIDGET", 200, 0.1)
+    metrics.record_request("amazon", "GET", "/listings/2021-08-01/items/SELLER/RED-WIDGET", 200, 0.1)
+    # Unknown routes still fall back to the digit heuristic
+    metrics.record_request("amazon", "GET", "fba/inbound/v0/shipments/FBA15ABC123", 200, 0.1)
+    endpoints = [series["endpoint"] for series in metrics.snapshot()["requests"]]
+    assert endpoints == ["fba/inbound/v0/shipments/{id}", "listings/2021-08-01/items/{id}/{id}"]
+
+
+def test_to_prometheus_exposition():
+    metrics = MetricsRegistry(buckets=(0.1, 1.0))
+    metrics.record_request("ebay", "GET", "sell/fulfillment/v1/order", 200, 0.05, 10, 200)
+    metrics.record_request("ebay", "GET", "sell/fulfillment/v1/order", 200, 0.5, 10, 300)
+    metrics.record_authentication("ebay")
+    text = metrics.to_prometheus()
+    labels = 'marketplace="ebay",method="GET",endpoint="sell/fulfillment/v1/order"'
+    assert "# TYPE jegbridge_request_duration_seconds histogram" in text
+    assert f'jegbridge_requests_total{{{labels},status="200"}} 2' in text
+    assert f'jegbridge_request_duration_seconds_bucket{{{labels},le="0.1"}} 1' in text
+    assert f'jegbridge_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f"jegbridge_request_duration_seconds_count{{{labels}}} 2" in text
+    assert f"jegbridge_request_bytes_total{{{labels}}} 20" in text
+    assert f"jegbridge_response_bytes_total{{{labels}}} 500" in text
+    assert 'jegbridge_authentications_total{marketplace="ebay"} 1' in text
+    assert text.endswith("\n")
+
+
+# --- BaseAuth metrics ---
+
+def test_make_request_records_every_attempt():
+    metrics = MetricsRegistry()
+    session = MagicMock()
+    session.request.side_effect = [
+        make_response(503),
+        requests.exceptions.ConnectionError("reset"),
+        make_response(200, content=b'{"order_id": 1}', body=b'{"a":1}'),
+    ]
+    auth = BackmarketAuth(
+        dev_client_id="dev", dev_client_secret="secret", session=session, metrics=metrics,
+        retry_policy=RetryPolicy(backoff_factor=0, jitter=False),
+    )
+    auth.make_request("GET", "ws/orders/9183997")
+
+    [series] = metrics.snapshot()["requests"]
+    assert (series["marketplace"], series["method"], series["endpoint"]) == ("backmarket", "GET", "ws/orders/{id}")
+    assert series["statuses"] == {"503": 1, "error": 1, "200": 1}
+    assert (series["bytes_sent"], series["bytes_received"]) == (7, 2 + 15)
+
+
+def test_auth_registers_marketplace_routes():
+    metrics = MetricsRegistry()
+    session = MagicMock()
+    session.post.return_value.json.return_value = {"access_token": "token-1", "expires_in": 3600}
+    session.request.return_value = make_response()
+    auth = AmazonAuth(client_id="id", client_secret="secret", refresh_token="refresh", session=session,
+                      metrics=metrics, rate_limiter=None)
+    auth.make_request("GET", "/listings/2021-08-01/items/SELLER/blue-widget")
+    [series] = metrics.snapshot()["requests"]
+    assert series["endpoint"] == "listings/2021-08-01/items/{id}/{id}"
+
+
+def test_authenticate_calls_are_counted():
+    metrics = MetricsRegistry()
+    session = MagicMock()
+    session.post.return_value.json.return_value = {"access_token": "token-1", "expires_in": 3600}
+    auth = AmazonAuth(client_id="id", client_secret="secret", refresh_token="refresh", session=session, metrics=metrics)
+    auth.get_headers()
+    auth.get_headers()
+    auth.invalidate_token()
+    auth.get_headers()
+    assert metrics.snapshot()["authentications"] == {"amazon": 2}
+
+
+def test_metrics_are_disabled_by_default():
+    session = MagicMock()
+    session.request.return_value = make_response()
+    auth = BackmarketAuth(dev_client_id="dev", dev_client_secret="secret", session=session)
+    assert auth.metrics is None
+    assert auth.make_request("GET", "ws/orders").status_code == 200
@@ -0,0 +1,127 @@
+import json
+import sys
+from unittest.mock import MagicMock
+import pytest
+from JegBridge.connectors.amazon_connector import AmazonConnector
+from JegBridge.connectors.backmarket_connector import BackmarketConnector
+from JegBridge.connectors.cached_connector import CachedConnector
+from JegBridge.connectors.ebay_connector import EbayConnector
+from JegBridge.connectors.walmartmp_connector import WalmartMPConnector
+from JegBridge.models.order import Order, OrderMapping, get_path
+from JegBridge.utils.json_decoder import get_json_decoder
+from JegBridge.utils.order_cache import OrderCache
+
+EBAY_ORDER = {
+    "orderId": "08-1",
+    "orderFulfillmentStatus": "NOT_STARTED",
+    "creationDate": "2025-03-01T12:00:00.000Z",
+    "lastModifiedDate": "2025-03-02T12:00:00.000Z",
+    "pricingSummary": {"total": {"value": "39.98", "currency": "USD"}},
+    "buyer": {"username": "buyer1"},
+    "lineItems": [{"lineItemId": "L1", "sku": "SKU-1", "title": "Phone", "quantity": 2, "lineItemCost": {"value": "39.98"}}],
+}
+
+WALMART_ORDER = {
+    "purchaseOrderId": "P1",
+    "orderDate": 1740830400000,
+    "orderLines": {"orderLine": [{
+        "lineNumber": "1",
+        "item": {"sku": "SKU-9", "productName": "Charger"},
+        "orderLineQuantity": {"amount": "1"},
+        "charges": {"charge": [{"chargeAmount": {"currency": "USD", "amount": 9.99}}]},
+        "orderLineStatuses": {"orderLineStatus": [{"status": "Acknowledged"}]},
+    }]},
+}
+
+
+def make_msgspec_decoder():
+    """Helper to create a msgspec decoder whose full decoding is tracked, skipping if msgspec is not installed."""
+    pytest.importorskip("msgspec")
+    decoder = get_json_decoder("msgspec")
+    decoder.loads = MagicMock(wraps=decoder.loads)
+    return decoder
+
+
+def test_get_path():
+    assert get_path(WALMART_ORDER, "orderLines.orderLine.0.item.sku") == "SKU-9"
+    assert get_path(WALMART_ORDER, "orderLines.orderLine.3.item") is None
+    assert get_path(WALMART_ORDER, None) is None
+
+
+def test_ebay_order_mapping():
+    order = EbayConnector(auth=MagicMock()).to_order(EBAY_ORDER)
+    assert (order.marketplace, order.order_id, order.status) == ("ebay", "08-1", "NOT_STARTED")
+    assert order.created_at == "2025-03-01T12:00:00Z"
+    assert (order.total, order.currency) == (39.98, "USD")
+    assert [(line.sku, line.quantity, line.price) for line in order.lines] == [("SKU-1", 2.0, 39.98)]
+    assert order.get("buyer.username") == "buyer1"
+    assert order.raw == EBAY_ORDER
+
+
+def test_walmart_order_mapping():
+    order = WalmartMPConnector(auth=MagicMock()).to_order(WALMART_ORDER)
+    assert order.order_id == "P1"
+    assert order.status == "Acknowledged"
+    assert order.created_at == "2025-03-01T12:00:00Z"
+    assert order.lines[0].title == "Charger"
+
+
+def test_amazon_and_backmarket_order_mappings():
+    amazon = AmazonConnector(auth=MagicMock(), seller_id="SELLER").to_order(
+        {"AmazonOrderId": "111", "OrderStatus": "Unshipped", "OrderTotal": {"CurrencyCode": "USD", "Amount": "12.50"}}
+    )
+    assert (amazon.order_id, amazon.total, amazon.lines) == ("111", 12.5, [])
+    backmarket = BackmarketConnector(auth=MagicMock()).to_order(
+        b'{"order_id": 42, "state": 1, "price": "100.00", "orderlines": [{"id": 7, "listing": "SKU-7", "quantity": 1}]}'
+    )
+    assert (backmarket.order_id, backmarket.status, backmarket.lines[0].sku) == ("42", "1", "SKU-7")
+
+
+def test_order_keeps_only_compact_bytes():
+    order = Order("ebay", EBAY_ORDER, EbayConnector.order_mapping)
+    assert not hasattr(order, "__dict__")
+    assert order.raw_bytes.startswith(b'{"orderId":"08-1"')
+    assert sys.getsizeof(order) + len(order.raw_bytes) < 2000
+
+
+def test_order_reads_raw_with_its_decoder():
+    decoder = MagicMock()
+    decoder.fields_decoder.return_value = None
+    decoder.loads.return_value = EBAY_ORDER
+    order = Order("ebay", b'{"orderId":"08-1"}', EbayConnector.order_mapping, json_decoder=decoder)
+    decoder.loads.reset_mock()
+    assert order.get("buyer.username") == "buyer1"
+    decoder.loads.assert_called_once_with(b'{"orderId":"08-1"}')
+
+
+def test_order_typed_decoding_matches_dict_decoding():
+    decoder = make_msgspec_decoder()
+    for connector_class, raw in [(EbayConnector, EBAY_ORDER), (WalmartMPConnector, WALMART_ORDER)]:
+        expected = Order(connector_class.marketplace, raw, connector_class.order_mapping)
+        order = Order(connector_class.marketplace, json.dumps(raw).encode(), connector_class.order_mapping,
+                      json_decoder=decoder)
+        assert (order.order_id, order.status, order.created_at, order.total, order.currency) == \
+            (expected.order_id, expected.status, expected.created_at, expected.total, expected.currency)
+    # The mapped fields were read without decoding the whole orders
+    assert not decoder.loads.called
+
+
+def test_order_typed_decoding_falls_back_on_unexpected_shapes():
+    decoder = make_msgspec_decoder()
+    raw = json.dumps({"orderId": "08-1", "pricingSummary": "n/a", "orderFulfillmentStatus": "NOT_STARTED"})
+    order = Order("ebay", raw, EbayConnector.order_mapping, json_decoder=decoder)
+    assert (order.order_id, order.status, order.total) == ("08-1", "NOT_STARTED", None)
+
+
+def test_order_without_id_keeps_none():
+    order = Order("ebay", {"orderFulfillmentStatus": "NOT_STARTED"}, EbayConnector.order_mapping)
+    assert order.order_id is None
+
+
+def test_cached_connector_uses_wrapped_mapping():
+    connector = CachedConnector(EbayConnector(auth=MagicMock()), OrderCache())
+    assert connector.to_order(EBAY_ORDER).order_id == "08-1"
+
+
+def test_order_mapping_defaults():
+    assert OrderMapping(order_id="id").lines is None
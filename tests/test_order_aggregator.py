@@ -0,0 +1,86 @@
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock
+from JegBridge.connectors.amazon_connector import AmazonConnector
+from JegBridge.connectors.ebay_connector import EbayConnector
+from JegBridge.connectors.order_aggregator import OrderAggregator
+from JegBridge.connectors.walmartmp_connector import WalmartMPConnector
+
+
+def make_connectors():
+    """Helper to create Amazon and eBay connectors that each return one page of orders."""
+    amazon_auth = MagicMock()
+    amazon_auth.make_request.return_value.json.return_value = {"payload": {"Orders": [{"AmazonOrderId": "111"}]}}
+    ebay_auth = MagicMock()
+    ebay_auth.make_request.return_value.json.return_value = {"orders": [{"orderId": "08-1"}], "total": 1}
+    return AmazonConnector(auth=amazon_auth, seller_id="SELLER"), EbayConnector(auth=ebay_auth)
+
+
+def test_get_orders_merges_and_tags_orders():
+    amazon, ebay = make_connectors()
+    result = OrderAggregator([amazon, ebay]).get_orders()
+    tagged = {(order.marketplace, order.account_id): order.order for order in result.orders}
+    assert tagged == {("amazon", "SELLER"): {"AmazonOrderId": "111"}, ("ebay", "default"): {"orderId": "08-1"}}
+    assert result.errors == {}
+
+
+def test_default_fetch_reads_open_orders():
+    amazon, ebay = make_connectors()
+    OrderAggregator([amazon, ebay]).get_orders()
+    assert amazon.auth.make_request.call_args[1]["params"]["OrderStatuses"] == "Unshipped,PartiallyShipped"
+    assert ebay.auth.make_request.call_args[1]["params"]["filter"] == "orderfulfillmentstatus:{NOT_STARTED|IN_PROGRESS}"
+
+
+def test_duplicate_marketplace_accounts_are_rejected():
+    with pytest.raises(ValueError, match="walmartmp:default"):
+        OrderAggregator([WalmartMPConnector(auth=MagicMock()), WalmartMPConnector(auth=MagicMock())])
+
+
+def test_failing_connector_keeps_partial_results():
+    amazon, ebay = make_connectors()
+    walmart_auth = MagicMock()
+    walmart_auth.make_request.return_value.json.return_value = {"error": "Unauthorized"}
+    result = OrderAggregator([amazon, ebay, WalmartMPConnector(auth=walmart_auth)]).get_orders()
+    assert len(result.orders) == 2
+    assert isinstance(result.errors["walmartmp:default"], KeyError)
+
+
+def test_slow_connector_times_out_without_blocking_others():
+    amazon, ebay = make_connectors()
+    release = threading.Event()
+
+    def fetch(connector):
+        if connector.marketplace == "ebay":
+            yield {"orderId": "08-1"}
+            release.wait(5)
+            yield {"orderId": "08-2"}
+        else:
+            yield from connector.iter_orders()
+
+    started = time.monotonic()
+    result = OrderAggregator([amazon, ebay], timeout=5, timeouts={"ebay": 0.1}).get_orders(fetch)
+    release.set()
+    assert time.monotonic() - started < 2
+    assert sorted(order.marketplace for order in result.orders) == ["amazon", "ebay"]
+    assert isinstance(result.errors["ebay:default"], TimeoutError)
+
+
+def test_abandoned_stream_stops_reading_connectors():
+    amazon, _ = make_connectors()
+    produced = []
+
+    def fetch(connector):
+        while True:
+            produced.append(len(produced))
+            yield {"AmazonOrderId": str(len(produced))}
+
+    orders = OrderAggregator([amazon], buffer_size=2).iter_orders(fetch)
+    next(orders)
+    orders.close()
+    time.sleep(0.3)
+    count = len(produced)
+    time.sleep(0.2)
+    # The reader is bounded by the buffer and stops once the stream is closed
+    assert count <= 5
+    assert len(produced) == count
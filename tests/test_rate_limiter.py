@@ -0,0 +1,100 @@
+import threading
+from unittest.mock import MagicMock, patch
+from JegBridge.auth.amazon_auth import AmazonAuth, SP_API_RATE_LIMITS
+from JegBridge.utils.rate_limiter import RateLimiter, TokenBucket
+
+
+def make_limiter():
+    """Helper to create a limiter seeded with the SP-API defaults."""
+    return RateLimiter(SP_API_RATE_LIMITS)
+
+
+# --- TokenBucket ---
+
+def test_bucket_allows_burst_without_waiting():
+    bucket = TokenBucket(rate=1, burst=3)
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+
+
+def test_bucket_queues_reservations_beyond_burst():
+    bucket = TokenBucket(rate=2, burst=1)
+    bucket.reserve()
+    assert 0.45 < bucket.reserve() <= 0.5
+    assert 0.95 < bucket.reserve() <= 1.0
+
+
+def test_bucket_is_thread_safe():
+    bucket = TokenBucket(rate=1, burst=10)
+    delays = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(10):
+            delay = bucket.reserve()
+            with lock:
+                delays.append(delay)
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # 10 immediate slots, then one slot per second for the remaining 40 reservations
+    assert sum(1 for delay in delays if delay == 0) == 10
+    assert 39 < max(delays) <= 40
+
+
+# --- RateLimiter ---
+
+def test_limiter_matches_operation_patterns():
+    limiter = make_limiter()
+    get_orders = limiter.get_bucket("GET", "orders/v0/orders")
+    get_order = limiter.get_bucket("GET", "/orders/v0/orders/111-222-333")
+    assert get_orders.rate == 0.0167
+    assert get_order.rate == 0.5
+    assert limiter.get_bucket("POST", "reports/2021-06-30/reports").burst == 15
+    assert limiter.get_bucket("GET", "listings/2021-08-01/items/SELLER/SKU-1").rate == 5.0
+
+
+def test_limiter_ignores_unknown_endpoints():
+    limiter = make_limiter()
+    assert limiter.get_bucket("GET", "fba/inventory/v1/summaries") is None
+    assert limiter.reserve("GET", "fba/inventory/v1/summaries") == 0
+
+
+def test_limiter_updates_rate_from_headers():
+    limiter = make_limiter()
+    limiter.update_from_headers("GET", "orders/v0/orders", {"x-amzn-RateLimit-Limit": "0.5"})
+    assert limiter.get_bucket("GET", "orders/v0/orders").rate == 0.5
+
+
+def test_limiter_drains_bucket_when_throttled():
+    limiter = RateLimiter([("GET", r"orders/v0/orders", 1, 5)])
+    limiter.on_throttled("GET", "orders/v0/orders")
+    assert limiter.reserve("GET", "orders/v0/orders") > 0
+
+
+# --- BaseAuth integration ---
+
+@patch("JegBridge.utils.rate_limiter.time.sleep")
+def test_make_request_waits_for_rate_limit(mock_sleep):
+    session = MagicMock()
+    session.post.return_value.json.return_value = {"access_token": "token", "expires_in": 3600}
+    session.request.return_value.headers = {}
+    session.request.return_value.status_code = 200
+    auth = AmazonAuth(client_id="id", client_secret="secret", refresh_token="refresh", session=session,
+                      rate_limiter=RateLimiter([("GET", r"orders/v0/orders", 1, 1)]))
+    auth.make_request("GET", "orders/v0/orders")
+    assert not mock_sleep.called
+    auth.make_request("GET", "orders/v0/orders")
+    assert mock_sleep.called
+
+
+def test_amazon_auth_has_default_limiter():
+    auth = AmazonAuth(client_id="id", client_secret="secret", refresh_token="refresh")
+    assert auth.rate_limiter.get_bucket("GET", "orders/v0/orders") is not None
+
+
+def test_amazon_auth_limiter_can_be_disabled():
+    auth = AmazonAuth(client_id="id", client_secret="secret", refresh_token="refresh", rate_limiter=None)
+    assert auth.rate_limiter is None
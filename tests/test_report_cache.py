@@ -0,0 +1,122 @@
+import io
+import os
+import time
+from unittest.mock import MagicMock
+from JegBridge.connectors.amazon_connector import AmazonConnector
+from JegBridge.utils.report_cache import ReportCache, ReportDocument
+
+REPORT = b"order-id\tsku\n111\tSKU-1\n222\tSKU-2\r\n333\tSKU-3"
+
+
+def make_connector():
+    """Helper to create an AmazonConnector whose report document download serves REPORT."""
+    mock_auth = MagicMock()
+    mock_auth.make_request.return_value.json.return_value = {"url": "https://s3.example.com/doc456"}
+    mock_auth.session.get.side_effect = lambda url, stream, timeout: MagicMock(raw=io.BytesIO(REPORT))
+    return AmazonConnector(auth=mock_auth, seller_id="SELLER"), mock_auth
+
+
+# --- ReportDocument ---
+
+def test_document_random_access(tmp_path):
+    path = tmp_path / "doc.tsv"
+    path.write_bytes(REPORT)
+    with ReportDocument(str(path)) as document:
+        assert len(document) == 4
+        assert document.header == ["order-id", "sku"]
+        assert document[2] == ["222", "SKU-2"]
+        assert document[-1] == ["333", "SKU-3"]
+        assert document[1:3] == [["111", "SKU-1"], ["222", "SKU-2"]]
+    assert os.path.exists(f"{path}.idx")
+
+
+def test_document_reuses_saved_index(tmp_path):
+    path = tmp_path / "doc.tsv"
+    path.write_bytes(REPORT)
+    with ReportDocument(str(path)) as document:
+        offsets = document.offsets
+    with ReportDocument(str(path)) as document:
+        assert document._load_index() == offsets
+
+
+def test_empty_document(tmp_path):
+    path = tmp_path / "empty.tsv"
+    path.write_bytes(b"")
+    with ReportDocument(str(path)) as document:
+        assert len(document) == 0
+        assert document.header == []
+
+
+def test_document_ignores_index_of_a_different_document(tmp_path):
+    path = tmp_path / "doc.tsv"
+    path.write_bytes(REPORT)
+    ReportDocument(str(path)).offsets
+    path.write_bytes(REPORT + b"\n444\tSKU-4")
+    with ReportDocument(str(path)) as document:
+        assert document._load_index() is None
+        assert document[-1] == ["444", "SKU-4"]
+
+
+# --- ReportCache ---
+
+def test_cache_store_and_open(tmp_path):
+    cache = ReportCache(str(tmp_path))
+    assert cache.open("doc456") is None
+    cache.store("amzn1.tortuga/doc456", io.BytesIO(REPORT))
+    assert "amzn1.tortuga/doc456" in cache
+    with cache.open("amzn1.tortuga/doc456") as document:
+        assert document[1] == ["111", "SKU-1"]
+
+
+def test_cache_reopen_reuses_saved_index(tmp_path, monkeypatch):
+    cache = ReportCache(str(tmp_path))
+    cache.store("doc456", io.BytesIO(REPORT))
+    with cache.open("doc456") as document:
+        assert document[1] == ["111", "SKU-1"]
+
+    def fail_build(self):
+        raise AssertionError("index was rebuilt")
+
+    monkeypatch.setattr(ReportDocument, "_build_index", fail_build)
+    time.sleep(0.01)
+    with cache.open("doc456") as document:
+        assert document[2] == ["222", "SKU-2"]
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = ReportCache(str(tmp_path), max_bytes=2 * len(REPORT))
+    cache.store("old", io.BytesIO(REPORT))
+    cache.store("recent", io.BytesIO(REPORT))
+    past = time.time() - 60
+    os.utime(cache.path_for("old"), (past, past))
+    os.utime(cache.path_for("recent"), (past + 1, past + 1))
+    cache.open("old").close()
+    cache.store("new", io.BytesIO(REPORT))
+    assert "old" in cache
+    assert "recent" not in cache
+    assert "new" in cache
+
+
+# --- AmazonReportHandler integration ---
+
+def test_get_cached_report_downloads_once(tmp_path):
+    connector, mock_auth = make_connector()
+    cache = ReportCache(str(tmp_path))
+    with connector.get_cached_report("doc456", cache) as document:
+        assert document[3] == ["333", "SKU-3"]
+    with connector.get_cached_report("doc456", cache) as document:
+        assert len(document) == 4
+    assert mock_auth.session.get.call_count == 1
+
+
+def test_stream_report_rows_reads_from_cache(tmp_path):
+    connector, mock_auth = make_connector()
+    cache = ReportCache(str(tmp_path))
+    first = list(connector.stream_report_rows("doc456", cache=cache))
+    second = list(connector.stream_report_rows("doc456", cache=cache))
+    assert first == second == [
+        {"order-id": "111", "sku": "SKU-1"},
+        {"order-id": "222", "sku": "SKU-2"},
+        {"order-id": "333", "sku": "SKU-3"},
+    ]
+    assert mock_auth.session.get.call_count == 1
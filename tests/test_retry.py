@@ -0,0 +1,125 @@
+import requests
+from unittest.mock import MagicMock, patch
+from JegBridge.auth.amazon_auth import AmazonAuth
+from JegBridge.auth.backmarket_auth import BackmarketAuth
+from JegBridge.utils.custom_exceptions import RequestError
+from JegBridge.utils.retry import RetryPolicy
+
+
+def make_response(status_code=200, headers=None):
+    """Helper to build a mock API response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+def make_auth(*responses, retry_policy=None):
+    """Helper to create a BackmarketAuth whose session returns `responses` in order."""
+    session = MagicMock()
+    session.request.side_effect = list(responses)
+    policy = retry_policy or RetryPolicy(jitter=False)
+    return BackmarketAuth(dev_client_id="dev", dev_client_secret="secret", session=session, retry_policy=policy), session
+
+
+# --- RetryPolicy ---
+
+def test_parse_retry_after_seconds():
+    assert RetryPolicy.parse_retry_after("3") == 3.0
+
+
+def test_parse_retry_after_http_date():
+    assert RetryPolicy.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_parse_retry_after_invalid():
+    assert RetryPolicy.parse_retry_after("soon") is None
+
+
+def test_backoff_grows_exponentially_and_is_capped():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+    assert [policy.compute_backoff(n) for n in range(4)] == [1, 2, 4, 5]
+
+
+def test_jittered_backoff_stays_within_bounds():
+    policy = RetryPolicy(backoff_factor=1)
+    assert all(0 <= policy.compute_backoff(3) <= 8 for _ in range(50))
+
+
+def test_non_idempotent_methods_are_not_retried():
+    policy = RetryPolicy()
+    assert policy.get_retry_delay("POST", 0, 0, status_code=503) is None
+
+
+def test_retry_budget_is_enforced():
+    policy = RetryPolicy(max_retry_time=10, jitter=False)
+    assert policy.get_retry_delay("GET", 0, 0, status_code=429, headers={"Retry-After": "30"}) is None
+    assert policy.stats.giveups == 1
+
+
+# --- make_request ---
+
+@patch("JegBridge.auth.base_auth.time.sleep")
+def test_make_request_retries_server_errors(mock_sleep):
+    auth, session = make_auth(make_response(503), make_response(500), make_response(200))
+    response = auth.make_request("GET", "ws/orders")
+    assert response.status_code == 200
+    assert session.request.call_count == 3
+    assert auth.retry_policy.stats.retries_by_reason == {"503": 1, "500": 1}
+
+
+@patch("JegBridge.auth.base_auth.time.sleep")
+def test_make_request_honors_retry_after(mock_sleep):
+    auth, _ = make_auth(make_response(429, {"Retry-After": "2"}), make_response(200))
+    auth.make_request("GET", "ws/orders")
+    mock_sleep.assert_called_once_with(2.0)
+    assert auth.retry_policy.stats.retry_sleep_seconds == 2.0
+
+
+@patch("JegBridge.auth.base_auth.time.sleep")
+def test_make_request_returns_last_response_when_retries_exhausted(mock_sleep):
+    auth, session = make_auth(*[make_response(503) for _ in range(3)],
+                              retry_policy=RetryPolicy(max_retries=2, jitter=False))
+    response = auth.make_request("GET", "ws/orders")
+    assert response.status_code == 503
+    assert session.request.call_count == 3
+
+
+@patch("JegBridge.auth.base_auth.time.sleep")
+def test_make_request_retries_connection_errors(mock_sleep):
+    auth, session = make_auth(requests.exceptions.ConnectionError("reset"), make_response(200))
+    assert auth.make_request("GET", "ws/orders").status_code == 200
+    assert auth.retry_policy.stats.retries_by_reason == {"ConnectionError": 1}
+
+
+@patch("JegBridge.auth.base_auth.time.sleep")
+def test_make_request_raises_when_connection_errors_persist(mock_sleep):
+    auth, _ = make_auth(*[requests.exceptions.ConnectionError("reset") for _ in range(4)])
+    try:
+        auth.make_request("GET", "ws/orders")
+        assert False, "Expected RequestError"
+    except RequestError:
+        pass
+
+
+def test_make_request_does_not_retry_post():
+    auth, session = make_auth(make_response(503))
+    assert auth.make_request("POST", "ws/orders").status_code == 503
+    assert session.request.call_count == 1
+
+
+def test_make_request_refreshes_token_on_401():
+    session = MagicMock()
+    session.post.return_value.json.return_value = {"access_token": "token", "expires_in": 3600}
+    session.request.side_effect = [make_response(401), make_response(200)]
+    auth = AmazonAuth(client_id="id", client_secret="secret", refresh_token="refresh",
+                      session=session, rate_limiter=None)
+    assert auth.make_request("GET", "orders/v0/orders").status_code == 200
+    assert session.post.call_count == 2
+    assert auth.retry_policy.stats.token_refreshes == 1
+
+
+def test_make_request_does_not_refresh_static_keys_on_401():
+    auth, session = make_auth(make_response(401))
+    assert auth.make_request("GET", "ws/orders").status_code == 401
+    assert session.request.call_count == 1
@@ -0,0 +1,136 @@
+import threading
+import time
+from unittest.mock import MagicMock
+import pytest
+from JegBridge.auth.backmarket_auth import BackmarketAuth
+from JegBridge.utils.single_flight import SingleFlight
+
+
+def wait_for(condition, timeout=5):
+    """Helper to poll until `condition()` is true."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.001)
+
+
+def run_in_threads(fn, count):
+    """Helper to start `count` threads running `fn`, collecting results and exceptions."""
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(fn())) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+# --- SingleFlight ---
+
+def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def slow_call():
+        calls.append(1)
+        release.wait(5)
+        return "result"
+
+    threads, results = run_in_threads(lambda: flight.do("key", slow_call), 5)
+    wait_for(lambda: flight.shared_calls == 4)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert sorted(results, key=lambda result: result[1]) == [("result", False)] + [("result", True)] * 4
+    assert flight.in_flight() == 0
+
+
+def test_exception_is_shared_and_next_call_runs_again():
+    flight = SingleFlight()
+    release = threading.Event()
+    errors = []
+
+    def failing_call():
+        release.wait(5)
+        raise ValueError("boom")
+
+    def caller():
+        try:
+            flight.do("key", failing_call)
+        except ValueError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=caller) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    wait_for(lambda: flight.shared_calls == 2)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(errors) == 3
+    assert flight.do("key", lambda: "fresh") == ("fresh", False)
+
+
+def test_different_keys_do_not_wait_for_each_other():
+    flight = SingleFlight()
+    assert flight.do("a", lambda: 1) == (1, False)
+    assert flight.do("b", lambda: 2) == (2, False)
+    assert flight.shared_calls == 0
+
+
+# --- BaseAuth coalescing ---
+
+def make_blocking_auth(coalesce_gets=True):
+    """Helper to create a BackmarketAuth whose session blocks every request until released."""
+    release = threading.Event()
+    session = MagicMock()
+
+    def fake_request(**kwargs):
+        release.wait(5)
+        response = MagicMock()
+        response.status_code = 200
+        return response
+
+    session.request.side_effect = fake_request
+    auth = BackmarketAuth(dev_client_id="dev", dev_client_secret="secret", session=session, coalesce_gets=coalesce_gets)
+    return auth, session, release
+
+
+def test_make_request_coalesces_identical_gets():
+    auth, session, release = make_blocking_auth()
+    threads, results = run_in_threads(lambda: auth.make_request("GET", "ws/orders/1", params={"a": 1, "b": 2}), 4)
+    wait_for(lambda: auth.single_flight.shared_calls == 3)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert session.request.call_count == 1
+    assert len({id(response) for response in results}) == 1
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"method": "POST", "endpoint": "ws/orders/1"},
+    {"method": "GET", "endpoint": "ws/orders/1", "stream": True},
+    {"method": "GET", "endpoint": "ws/orders/1", "json": {"a": 1}},
+])
+def test_make_request_does_not_coalesce_non_idempotent_or_streamed(kwargs):
+    auth, session, release = make_blocking_auth()
+    threads, _ = run_in_threads(lambda: auth.make_request(**kwargs), 3)
+    wait_for(lambda: session.request.call_count == 3)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert auth.single_flight.shared_calls == 0
+
+
+def test_make_request_keys_on_params():
+    auth, session, release = make_blocking_auth()
+    release.set()
+    auth.make_request("GET", "ws/orders", params={"page": 1})
+    auth.make_request("GET", "ws/orders", params={"page": 2})
+    assert session.request.call_count == 2
+    assert auth.single_flight.shared_calls == 0
+
+
+def test_coalescing_is_off_by_default():
+    auth, _, _ = make_blocking_auth(coalesce_gets=False)
+    assert auth.single_flight is None
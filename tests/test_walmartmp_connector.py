@@ -1,5 +1,11 @@
+import json
+import threading
+import time
+import pytest
 from unittest.mock import MagicMock
 from JegBridge.connectors.walmartmp_connector import WalmartMPConnector
+from JegBridge.utils.checkpoint_store import PaginationCheckpoint
+from JegBridge.utils.json_decoder import JsonDecoder
 
 
 def make_connector():
@@ -49,6 +55,152 @@ def test_get_orders_calls_correct_endpoint():
     assert "v3/orders" in call_kwargs[1]["endpoint"]
 
 
+def make_orders_page(order_ids, next_cursor=None):
+    """Helper to build a Walmart orders page response body."""
+    return {
+        "list": {
+            "meta": {"nextCursor": next_cursor} if next_cursor else {},
+            "elements": {"order": [{"purchaseOrderId": order_id} for order_id in order_ids]},
+        }
+    }
+
+
+def test_get_orders_follows_cursor_without_page_cap():
+    connector, mock_auth = make_connector()
+    pages = [make_orders_page(range(i * 100, (i + 1) * 100), f"?cursor=c{i}&limit=100") for i in range(7)]
+    pages.append(make_orders_page(["last"]))
+    mock_auth.make_request.return_value.json.side_effect = pages
+    orders = connector.get_orders()
+    assert len(orders) == 701
+    assert mock_auth.make_request.call_args[1]["params"] == {"cursor": "c6", "limit": "100"}
+
+
+def test_get_orders_stops_on_repeated_cursor():
+    connector, mock_auth = make_connector()
+    mock_auth.make_request.return_value.json.side_effect = [
+        make_orders_page(range(100), "?cursor=same"),
+        make_orders_page(range(100, 200), "?cursor=same"),
+        make_orders_page(["never"]),
+    ]
+    orders = connector.get_orders()
+    assert len(orders) == 200
+    assert mock_auth.make_request.call_count == 2
+
+
+def test_get_orders_respects_max_pages():
+    connector, mock_auth = make_connector()
+    mock_auth.make_request.return_value.json.side_effect = [
+        make_orders_page(range(100), "?cursor=a"),
+        make_orders_page(range(100, 200), "?cursor=b"),
+    ]
+    assert len(connector.get_orders(max_pages=1)) == 100
+
+
+def test_get_orders_resumes_from_checkpoint(tmp_path):
+    connector, mock_auth = make_connector()
+    checkpoint = PaginationCheckpoint(str(tmp_path / "walmart.json"))
+    mock_auth.make_request.return_value.json.side_effect = [
+        make_orders_page(range(100), "?cursor=a&limit=100"),
+        make_orders_page(range(100, 200), "?cursor=b&limit=100"),
+        KeyError("list"),
+    ]
+    try:
+        connector.get_orders(checkpoint=checkpoint)
+        assert False, "Expected KeyError"
+    except KeyError:
+        pass
+
+    mock_auth.make_request.reset_mock()
+    mock_auth.make_request.return_value.json.side_effect = [make_orders_page(["last"])]
+    orders = connector.get_orders(checkpoint=checkpoint)
+    assert len(orders) == 201
+    assert mock_auth.make_request.call_args[1]["params"] == {"cursor": "b", "limit": "100"}
+    assert checkpoint.load({"limit": 100}) is None
+
+
+def test_iter_orders_prefetches_next_page():
+    connector, mock_auth = make_connector()
+    second_page_requested = threading.Event()
+
+    def fake_json():
+        if mock_auth.make_request.call_count == 2:
+            second_page_requested.set()
+            return make_orders_page(["last"])
+        return make_orders_page(range(100), "?cursor=a")
+
+    mock_auth.make_request.return_value.json.side_effect = fake_json
+    orders = connector.iter_orders()
+    next(orders)
+    # The second page is requested while the caller is still holding the first order
+    assert second_page_requested.wait(timeout=5)
+    assert len(list(orders)) == 100
+
+
+def test_iter_orders_does_not_wait_for_prefetch_when_abandoned():
+    connector, mock_auth = make_connector()
+    release = threading.Event()
+
+    def fake_json():
+        if mock_auth.make_request.call_count == 2:
+            release.wait(5)
+            return make_orders_page(["last"])
+        return make_orders_page(range(100), "?cursor=a")
+
+    mock_auth.make_request.return_value.json.side_effect = fake_json
+    orders = connector.iter_orders()
+    next(orders)
+    started = time.monotonic()
+    orders.close()
+    assert time.monotonic() - started < 1
+    release.set()
+
+
+def test_iter_orders_streams_pages():
+    connector, mock_auth = make_connector()
+    mock_auth.json_decoder = JsonDecoder()
+    pages = [make_orders_page(range(100), "?cursor=a&limit=100"), make_orders_page(["last"])]
+    mock_auth.make_request.return_value.iter_content.side_effect = [
+        [body[:50], body[50:]] for body in (json.dumps(page).encode() for page in pages)
+    ]
+    orders = list(connector.iter_orders(stream=True))
+    assert [order["purchaseOrderId"] for order in orders] == list(range(100)) + ["last"]
+    assert mock_auth.make_request.call_args[1]["stream"] is True
+    assert mock_auth.make_request.call_args[1]["params"] == {"cursor": "a", "limit": "100"}
+
+
+def test_iter_orders_stream_rejects_checkpoint(tmp_path):
+    connector, _ = make_connector()
+    checkpoint = PaginationCheckpoint(str(tmp_path / "walmart.json"))
+    with pytest.raises(ValueError):
+        list(connector.iter_orders(stream=True, checkpoint=checkpoint))
+
+
+def test_iter_open_orders_queries_each_open_status_once():
+    connector, mock_auth = make_connector()
+    mock_auth.make_request.return_value.json.side_effect = [make_orders_page(["1", "2"]), make_orders_page(["2", "3"])]
+    orders = list(connector.iter_open_orders())
+    assert [order["purchaseOrderId"] for order in orders] == ["1", "2", "3"]
+    statuses = [call[1]["params"]["status"] for call in mock_auth.make_request.call_args_list]
+    assert statuses == ["Created", "Acknowledged"]
+
+
+# --- get_orders_by_ids ---
+
+def test_get_orders_by_ids_falls_back_to_get_order():
+    connector, mock_auth = make_connector()
+
+    def fake_request(method, endpoint):
+        response = MagicMock()
+        order_id = endpoint.rsplit("/", 1)[1]
+        response.json.return_value = {"order": {"purchaseOrderId": order_id}} if order_id != "404" else {"errors": []}
+        return response
+
+    mock_auth.make_request.side_effect = fake_request
+    lookup = connector.get_orders_by_ids(["1", "404", "2"], max_workers=2)
+    assert lookup.found == {"1": {"purchaseOrderId": "1"}, "2": {"purchaseOrderId": "2"}}
+    assert lookup.missing == ["404"]
+
+
 # --- get_order ---
 
 def test_get_order_calls_correct_endpoint():